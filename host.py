@@ -0,0 +1,56 @@
+"""Runs several bots in one process.
+
+Call this with the names of the bots to run, separated by commas, or with no
+arguments to run every bot in config.ini. Sections for bots' extra tables, named
+"<bot name>/<table name>", are not bots themselves. The bots share one event loop
+and one copy of the characters, scripts and preferences; each keeps its own token
+and games.
+"""
+
+import asyncio
+from configparser import ConfigParser
+from sys import argv
+from typing import List
+
+from lib.bot import BOTCBot
+from main import create_bot_or_exit
+
+
+async def run_bots(bots: List[BOTCBot], config: ConfigParser):
+    """Run bots until they all stop, closing every bot if any of them fails.
+
+    Parameters
+    ----------
+    bots : List[BOTCBot]
+        The bots to run.
+    config : ConfigParser
+        The config, holding each bot's token.
+    """
+    try:
+        await asyncio.gather(
+            *(bot.start(config[bot.bot_name]["TOKEN"]) for bot in bots)
+        )
+    finally:
+        for bot in bots:
+            if not bot.is_closed():
+                await bot.close()
+
+
+if __name__ == "__main__":
+    config = ConfigParser()
+    config.read("config.ini")
+
+    if argv[1:]:
+        bot_names = [name.strip() for name in " ".join(argv[1:]).split(",")]
+    else:
+        bot_names = [name for name in config.sections() if "/" not in name]
+
+    bots = [create_bot_or_exit(bot_name, config) for bot_name in bot_names]
+
+    loop = asyncio.get_event_loop()
+    try:
+        loop.run_until_complete(run_bots(bots, config))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.close()
@@ -1,20 +1,23 @@
 """Contains the BOTCBot class."""
 
+import asyncio
 import typing
-from os import remove
-from os.path import isfile
 
 import discord
-from dill import dump, load
 from discord.ext import commands
 
+from lib.dispatcher import Dispatcher
 from lib.logic.Character import Storyteller
 from lib.logic.Game import Game
+from lib.logic.PinLedger import PinLedger
 from lib.logic.Player import Player
 from lib.logic.converters import to_character_list
 from lib.logic.playerconverter import to_member_list
 from lib.logic.tools import generate_game_info_message
 from lib.preferences import load_preferences
+from lib.presence import PresenceManager
+from lib.scheduler import Scheduler
+from lib.table import Table
 from lib.utils import safe_send, get_input
 
 if typing.TYPE_CHECKING:
@@ -24,7 +27,23 @@ if typing.TYPE_CHECKING:
 
 
 class BOTCBot(commands.Bot):
-    """An extension of the commands.Bot class, storing globally necessary attributes."""
+    """An extension of the commands.Bot class, storing globally necessary attributes.
+
+    The bot runs one game per table. Commands in a table's channel go to its game,
+    and DMs go to the game the author is in, found through member_tables. Members in
+    several games are asked which one a command is for.
+
+    Attributes
+    ----------
+    tables : Dict[int, Table]
+        The bot's tables, by channel ID.
+    main_table : Table
+        The table configured in the bot's own config section, which gets DMs from
+        members in no game.
+    member_tables : Dict[int, List[Table]]
+        The tables whose games each member is in, by member ID, in the order the
+        member joined them.
+    """
 
     def __init__(
         self,
@@ -43,40 +62,22 @@ class BOTCBot(commands.Bot):
 
         self.bot_name = bot_name
         self._serverid = serverid
-        self._channelid = channelid
-        self._storytellerid = storytellerid
-        self._playerid = playerid
-        self._inactiveid = inactiveid
         self._playtestid = playtestid
-        self._observerid = observerid
         self.config = config
-        self.game: typing.Optional[Game] = None
+        self.tables: typing.Dict[int, Table] = {}
+        self.member_tables: typing.Dict[int, typing.List[Table]] = {}
+        self.scheduler = Scheduler()
+        self.dispatcher = Dispatcher()
+        self.presence = PresenceManager(self)
+        self.main_table = self.add_table(
+            "", channelid, storytellerid, playerid, inactiveid, observerid
+        )
 
     @property
     def server(self) -> discord.Guild:
         """Determine the bot's main server."""
         return self.get_guild(self._serverid)
 
-    @property
-    def channel(self) -> discord.TextChannel:
-        """Determine the bot's main channel."""
-        return self.get_channel(self._channelid)
-
-    @property
-    def storyteller_role(self) -> discord.Role:
-        """Determine the bot's Storyteller role."""
-        return self.server.get_role(self._storytellerid)
-
-    @property
-    def player_role(self) -> discord.Role:
-        """Determine the bot's player role."""
-        return self.server.get_role(self._playerid)
-
-    @property
-    def inactive_role(self) -> discord.Role:
-        """Determine the bot's inactive role."""
-        return self.server.get_role(self._inactiveid)
-
     @property
     def playtest_role(self) -> typing.Optional[discord.Role]:
         """Determine the bot's playtest role."""
@@ -84,66 +85,158 @@ class BOTCBot(commands.Bot):
             return self.server.get_role(self._playtestid)
         return None
 
-    @property
-    def observer_role(self) -> discord.Role:
-        """Determine the bot's observer role."""
-        return self.server.get_role(self._observerid)
-
     @property
     def instant_message_reporting(self) -> bool:
         """Determine whether the bot uses instant message reporting."""
         return self.config.getboolean("instantmessagereports")
         # TODO: this isnt working
 
+    @property
+    def batch_vote_announcements(self) -> bool:
+        """Determine whether runs of automatic votes are announced together."""
+        return self.config.getboolean("batchvoteannouncements", fallback=False)
+
+    @property
+    def observer_digest_enabled(self) -> bool:
+        """Determine whether observers get PM reports in digests."""
+        return self.config.getboolean("observerdigest", fallback=False)
+
+    @property
+    def observer_digest_interval(self) -> float:
+        """Determine how many seconds to wait between digests.
+
+        If zero, digests are only sent at the start of votes and the end of the day.
+        """
+        return self.config.getfloat("observerdigestinterval", fallback=0)
+
     @property
     def playtest(self) -> bool:
         """Determine whether the bot has playtest characters enabled."""
         return self.config.getboolean("playtest")
 
+    def add_table(
+        self,
+        name: str,
+        channelid: int,
+        storytellerid: int,
+        playerid: int,
+        inactiveid: int,
+        observerid: int,
+    ) -> Table:
+        """Add a table for running games in a channel.
+
+        Parameters
+        ----------
+        name : str
+            The table's name, which names its backup directory.
+        channelid : int
+            The ID of the table's gameplay channel.
+        storytellerid : int
+            The ID of the table's Storyteller role.
+        playerid : int
+            The ID of the table's player role.
+        inactiveid : int
+            The ID of the table's inactive role.
+        observerid : int
+            The ID of the table's observer role.
+
+        Returns
+        -------
+        Table
+            The new table.
+        """
+        if channelid in self.tables:
+            raise ValueError("channel already has a table")
+        table = Table(
+            self, name, channelid, storytellerid, playerid, inactiveid, observerid
+        )
+        self.tables[channelid] = table
+        return table
+
+    def tables_for_member(
+        self, member: typing.Union[discord.User, discord.Member]
+    ) -> typing.List[Table]:
+        """Find the tables a member's DMs may be for.
+
+        Members in a game go to its table. Anyone else goes to the tables where they
+        have the Storyteller, player or observer role, or else the main table. If
+        there are several, the member must be asked which one they mean.
+        """
+        if member.id in self.member_tables:
+            return list(self.member_tables[member.id])
+
+        server_member = self.server.get_member(member.id)
+        if server_member:
+            role_ids = {role.id for role in server_member.roles}
+            tables = [
+                table for table in self.tables.values() if role_ids & table.role_ids
+            ]
+            if tables:
+                return tables
+        return [self.main_table]
+
+    def index_members(self, table: Table):
+        """Update member_tables with the players and storytellers in a table's game."""
+        if table.game:
+            ids = {player.id for player in table.game.seating_order}
+            ids.update(storyteller.id for storyteller in table.game.storytellers)
+        else:
+            ids = set()
+
+        for idn in table.member_ids - ids:
+            tables = self.member_tables.get(idn, [])
+            if table in tables:
+                tables.remove(table)
+            if not tables:
+                self.member_tables.pop(idn, None)
+        for idn in ids - table.member_ids:
+            self.member_tables.setdefault(idn, []).append(table)
+        table.member_ids = ids
+
     async def start_game(self, ctx: "Context", script: "Script"):
         """Handle startgame logic."""
         await safe_send(ctx, f"Starting a {script.name} game.")
 
         # ask for the list of players
-        users = await to_member_list(
-            ctx,
-            (
-                await get_input(
-                    ctx,
-                    (
-                        "What is the seating order? (Separate "
-                        "users with line breaks. Do not include "
-                        "travelers.)"
-                    ),
-                )
-            ).split("\n"),
-        )
+        user_lines = (
+            await get_input(
+                ctx,
+                (
+                    "What is the seating order? (Separate "
+                    "users with line breaks. Do not include "
+                    "travelers.)"
+                ),
+            )
+        ).split("\n")
 
         # ask for the list of characters
-        characters = to_character_list(
-            ctx,
-            (
-                await get_input(
-                    ctx,
-                    (
-                        "What are the corresponding characters? "
-                        "(Separate characters with line breaks.)"
-                    ),
-                )
-            ).split("\n"),
-            script,
-        )
+        character_lines = (
+            await get_input(
+                ctx,
+                (
+                    "What are the corresponding characters? "
+                    "(Separate characters with line breaks.)"
+                ),
+            )
+        ).split("\n")
 
-        with ctx.typing():  # doing a lot of computation here
+        # validate everything before resolving players, which may need one more prompt
+        characters = to_character_list(ctx, character_lines, script)
+
+        # verify 1:1 user:character ratio
+        if len(user_lines) != len(characters):
+            raise commands.BadArgument(
+                "There are a different number of players and characters."
+            )
+
+        users = await to_member_list(ctx, user_lines)
 
-            # verify 1:1 user:character ratio
-            if len(users) != len(characters):
-                raise commands.BadArgument(
-                    "There are a different number of players and characters."
-                )
+        table = ctx.table
+
+        with ctx.typing():  # doing a lot of computation here
 
             # role cleanup
-            await self._startgame_role_cleanup(users)
+            await self._startgame_role_cleanup(table, users)
 
             # generate seating order
             seating_order = [
@@ -152,133 +245,108 @@ class BOTCBot(commands.Bot):
             ]
 
             # script message
+            pins = PinLedger()
             posts = []
             for content in list(script.info(ctx)):
-                posts.append(await safe_send(self.channel, content))
+                posts.append(await self.dispatcher.send(table.channel, content))
 
             for post in posts[::-1]:  # Reverse the order so the pins are right
-                await post.pin()
+                pins.pin(ctx, post)
 
             # welcome message
-            await safe_send(
-                self.channel,
+            await self.dispatcher.send(
+                table.channel,
                 (
-                    f"{self.player_role.mention}, "
+                    f"{table.player_role.mention}, "
                     "welcome to Blood on the Clocktower! Go to "
                     "sleep."
                 ),
             )
 
             # Seating order message
-            seating_order_message = await safe_send(
-                self.channel, generate_game_info_message(seating_order, ctx),
+            seating_order_message = await self.dispatcher.send(
+                table.channel, generate_game_info_message(seating_order, ctx),
             )
-            await seating_order_message.pin()
+            pins.pin(ctx, seating_order_message)
 
             # storytellers
             storytellers = [
                 Player(person, Storyteller, None)
-                for person in self.storyteller_role.members
+                for person in table.storyteller_role.members
             ]
 
             # start the game
-            self.game = Game(seating_order, seating_order_message, script, storytellers)
+            table.game = Game(
+                seating_order, seating_order_message, script, storytellers, pins
+            )
 
             # complete
             return
 
-    async def update_status(self):
-        """Update the bot's status to display information about the game."""
-        if not self.game:
-            await self.change_presence(
-                status=discord.Status.dnd,
-                activity=discord.Game(name="No ongoing game!"),
-            )
-
-        elif not self.game.current_day:
-            await self.change_presence(
-                status=discord.Status.idle,
-                activity=discord.Game(name="It's nighttime!"),
-            )
-
-        else:
-            clopen = ["Closed", "Open"]
-            await self.change_presence(
-                status=discord.Status.online,
-                activity=discord.Game(
-                    name="PMs {is_pms}, "
-                    "Noms "
-                    "{is_noms}!".format(
-                        is_pms=clopen[self.game.current_day.is_pms],
-                        is_noms=clopen[self.game.current_day.is_noms],
-                    )
-                    # noms instead of nominations for space
-                ),
-            )
+    async def after_command(self, ctx: "Context"):
+        """Clean up after a change to the game state.
 
-    def backup(self, file_name: str = "current_game.pckl"):
-        """Backs up the current gamestate."""
-        file_name = "resources/backup/" + self.bot_name + "/" + file_name
+        Refreshes the seating order message, backs up the table, tells the
+        storytellers about any phase changes, reindexes the table's members, and
+        updates the status. Run after every command, and after any change made
+        outside of a command.
+        """
+        table = ctx.table
+        if table.game:
+            await table.game.reseat(ctx, table.game.seating_order)
+        table.backup()
+        await table.phase_notifier.flush(table)
+        self.index_members(table)
+        await self.update_status()
 
-        if self.game:
-            with open(file_name, "wb") as file:
-                dump(self.game, file)
-        else:
-            if isfile(file_name):
-                remove(file_name)
+    async def update_status(self):
+        """Update the bot's status to display information about the game.
 
-    async def restore_backup(self, file_name: str = "current_game.pckl", mute=False):
-        """Restores a backup."""
-        file_name = "resources/backup/" + self.bot_name + "/" + file_name
+        If the bot is running several games, the status just counts them. The update
+        is sent by the bot's PresenceManager, so repeated calls are cheap.
+        """
+        games = [table.game for table in self.tables.values() if table.game]
 
-        # restore backups
-        try:
+        if not games:
+            self.presence.update(discord.Status.dnd, "No ongoing game!")
 
-            with open(file_name, "rb") as file:
-                self.game = load(file)
+        elif len(games) > 1:
+            self.presence.update(discord.Status.online, f"{len(games)} ongoing games!")
 
-            # catch game being none
-            # should never be possible if the file exists, but just in case
-            assert self.game
+        elif not games[0].current_day:
+            self.presence.update(discord.Status.idle, "It's nighttime!")
 
-            # do some unpickling
-            # noinspection PyTypeChecker
-            # the seating order message is pickled as an int so this is fine
-            self.game.seating_order_message = await self.channel.fetch_message(
-                self.game.seating_order_message
+        else:
+            clopen = ["Closed", "Open"]
+            self.presence.update(
+                discord.Status.online,
+                "PMs {is_pms}, Noms {is_noms}!".format(
+                    is_pms=clopen[games[0].current_day.is_pms],
+                    is_noms=clopen[games[0].current_day.is_noms],
+                ),
+                # noms instead of nominations for space
             )
-            for player in self.game.seating_order + self.game.storytellers:
-                player.member = self.server.get_member(player.member)
-
-            # print
-            if not mute:
-                print("Backup restored!")
-            return True
-
-        except (FileNotFoundError, AssertionError):
-            self.game = None
-            if not mute:
-                print("No backup found.")
-            return None
-
-        except EOFError:
-            self.game = None
-            print("Backup incomplete.")  # do this even if mute because it
-            # represents an error
-            return None
 
     async def process_commands(self, message: discord.Message):
         """Process commands registered to the bot.
 
-        Modified to handle custom aliases.
+        Modified to handle custom aliases, and to attach the table the message is
+        for to the context as ctx.table. Messages in servers are only processed in
+        tables' channels. Commands DMed by members of several tables ask which table
+        they're for.
         """
         if message.author.bot:
             return
 
-        if not (message.guild is None or message.channel == self.channel):
+        if message.guild is None:
+            tables = self.tables_for_member(message.author)
+        elif message.channel.id in self.tables:
+            tables = [self.tables[message.channel.id]]
+        else:
             return
 
         ctx = await self.get_context(message)
+        ctx.table = tables[0]
 
         preferences = load_preferences(message.author)
         if ctx.invoked_with in preferences.aliases:
@@ -289,24 +357,54 @@ class BOTCBot(commands.Bot):
                 for cmd in preferences.aliases[ctx.invoked_with].split(" ")[1:]:
                     ctx.command = ctx.command.get_command(cmd)
 
+        if ctx.command and len(tables) > 1:
+            try:
+                ctx.table = await _choose_table(ctx, tables)
+            except (ValueError, asyncio.TimeoutError, commands.BadArgument) as e:
+                self.dispatch("command_error", ctx, e)
+                return
+
         await self.invoke(ctx)
 
-    async def _startgame_role_cleanup(self, users: typing.List[discord.Member]):
+    @staticmethod
+    async def _startgame_role_cleanup(
+        table: Table, users: typing.List[discord.Member]
+    ):
         """Handle role cleanup for startgame."""
         # clear all player roles
-        for memb in self.player_role.members:
-            await memb.remove_roles(self.player_role)
+        for memb in table.player_role.members:
+            await memb.remove_roles(table.player_role)
 
         # modify roles for players
         for user in users:
 
             # add player role
-            await user.add_roles(self.player_role)
+            await user.add_roles(table.player_role)
 
             # remove storyteller role
-            if self.storyteller_role in user.roles:
-                await user.remove_roles(self.storyteller_role)
+            if table.storyteller_role in user.roles:
+                await user.remove_roles(table.storyteller_role)
 
         # add player role for storytellers
-        for memb in self.storyteller_role.members:
-            await memb.add_roles(self.player_role)
+        for memb in table.storyteller_role.members:
+            await memb.add_roles(table.player_role)
+
+
+async def _choose_table(ctx: "Context", tables: typing.List[Table]) -> Table:
+    """Ask the author which of several tables their command is for."""
+    message_text = 'Which table is this for? or say "cancel"'
+    for i, table in enumerate(tables):
+        message_text += f"\n({i + 1}). {table.channel.mention}"
+
+    # Wait for response
+    choice = await get_input(ctx, message_text)
+
+    # If the choice is an int
+    if choice.isdigit() and 1 <= int(choice) <= len(tables):
+        return tables[int(choice) - 1]
+
+    # If the choice is a channel
+    for table in tables:
+        if choice.lstrip("#").lower() == table.channel.name.lower():
+            return table
+    raise commands.BadArgument(f"{choice} isn't one of your tables.")
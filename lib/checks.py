@@ -25,7 +25,7 @@ def is_in_channel():
             True if the command succeeds, else raises an exception.
 
         """
-        if ctx.channel == ctx.bot.channel:
+        if ctx.channel == ctx.table.channel:
             return True
         raise commands.CheckFailure(message="")
 
@@ -73,7 +73,7 @@ def is_game() -> Callable:
             True if the command succeeds, else raises an exception.
 
         """
-        if ctx.bot.game:
+        if ctx.table.game:
             return True
         raise commands.CheckFailure(message="There is no ongoing game.")
 
@@ -97,7 +97,7 @@ def is_not_game() -> Callable:
             True if the command succeeds, else raises an exception.
 
         """
-        if not ctx.bot.game:
+        if not ctx.table.game:
             return True
         raise commands.CheckFailure(message="There is already an ongoing game.")
 
@@ -121,7 +121,8 @@ def is_storyteller() -> Callable:
             True if the command succeeds, else raises an exception.
 
         """
-        if ctx.bot.server.get_member(ctx.author.id) in ctx.bot.storyteller_role.members:
+        member = ctx.bot.server.get_member(ctx.author.id)
+        if member in ctx.table.storyteller_role.members:
             return True
         raise commands.CheckFailure(message="Sorry! Only storytellers can do that.")
 
@@ -145,10 +146,10 @@ def is_player() -> Callable:
             True if the command succeeds, else raises an exception.
 
         """
-        if ctx.bot.game:
+        if ctx.table.game:
             try:
                 get_player(
-                    ctx.bot.game, ctx.message.author.id, include_storytellers=False
+                    ctx.table.game, ctx.message.author.id, include_storytellers=False
                 )
                 return True
             except ValueError as e:
@@ -176,7 +177,7 @@ def is_day() -> Callable:
             True if the command succeeds, else raises an exception.
 
         """
-        if ctx.bot.game and ctx.bot.game.current_day:
+        if ctx.table.game and ctx.table.game.current_day:
             return True
         raise commands.CheckFailure(message="It's not day right now.")
 
@@ -200,7 +201,7 @@ def is_night() -> Callable:
             True if the command succeeds, else raises an exception.
 
         """
-        if ctx.bot.game and not ctx.bot.game.current_day:
+        if ctx.table.game and not ctx.table.game.current_day:
             return True
         raise commands.CheckFailure(message="It's already day!")
 
@@ -225,9 +226,9 @@ def pms_open() -> Callable:
 
         """
         if (
-            ctx.bot.game
-            and ctx.bot.game.current_day
-            and ctx.bot.game.current_day.is_pms
+            ctx.table.game
+            and ctx.table.game.current_day
+            and ctx.table.game.current_day.is_pms
         ):
             return True
         raise commands.CheckFailure(message="PMs aren't open right now.")
@@ -253,9 +254,9 @@ def noms_open() -> Callable:
 
         """
         if (
-            ctx.bot.game
-            and ctx.bot.game.current_day
-            and ctx.bot.game.current_day.is_noms
+            ctx.table.game
+            and ctx.table.game.current_day
+            and ctx.table.game.current_day.is_noms
         ):
             return True
         raise commands.CheckFailure(message="Nominations aren't open right now.")
@@ -281,9 +282,9 @@ def is_vote() -> Callable:
 
         """
         if (
-            ctx.bot.game
-            and ctx.bot.game.current_day
-            and ctx.bot.game.current_day.current_vote
+            ctx.table.game
+            and ctx.table.game.current_day
+            and ctx.table.game.current_day.current_vote
         ):
             return True
         raise commands.CheckFailure(message="There's no ongoing vote right now.")
@@ -309,9 +310,9 @@ def is_not_vote() -> Callable:
 
         """
         if (
-            ctx.bot.game
-            and ctx.bot.game.current_day
-            and not ctx.bot.game.current_day.current_vote
+            ctx.table.game
+            and ctx.table.game.current_day
+            and not ctx.table.game.current_day.current_vote
         ):
             return True
         raise commands.CheckFailure(message="There's already an ongoing vote.")
@@ -24,7 +24,7 @@ class Debug(commands.Cog, command_attrs=dict(hidden=True)):
     async def _unpinall(self, ctx: Context):
         """Unpin all messages in channel."""
         with ctx.typing():
-            for msg in await ctx.bot.channel.pins():
+            for msg in await ctx.table.channel.pins():
                 await msg.unpin()
 
         await safe_send(ctx, "Unpinned all messages.")
@@ -95,7 +95,7 @@ class Debug(commands.Cog, command_attrs=dict(hidden=True)):
     async def _detailedgrimoire(self, ctx: Context):
         """Display a detailed text grimoire."""
         message_text = "**Grimoire:**"
-        for player in ctx.bot.game.seating_order:
+        for player in ctx.table.game.seating_order:
             message_text += f"\n\n__{player.epithet}:__"
             for effect in player.effects:
                 message_text += f"\n{effect.name}:"
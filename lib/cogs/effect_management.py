@@ -118,7 +118,7 @@ class EffectManagement(commands.Cog, name="[ST] Effects"):
         if source is not None:
             source_actual = await to_player(ctx, source, includes_storytellers=True)
         else:
-            source_actual = ctx.bot.game.storytellers[0]
+            source_actual = ctx.table.game.storytellers[0]
         await _effect_adder(
             ctx, player_actual, generic_ongoing_effect(Effect.Poisoned), source_actual
         )
@@ -44,10 +44,10 @@ async def _http_error_handler(ctx: Context, error: HTTPException):
         raise error
 
 
-def _update_player_members(bot, after):
+def _update_player_members(table, after):
     """Update player members when they change."""
     try:
-        player = get_player(bot.game, after)
+        player = get_player(table.game, after.id)
         player.member = after
     except TypeError as e:
         if str(e) != "no current game":
@@ -57,11 +57,13 @@ def _update_player_members(bot, after):
             raise
 
 
-def _update_storyteller_list(bot, after, before):
+def _update_storyteller_list(table, after, before):
     """Add new storytellers to the Storyteller list."""
-    if bot.storyteller_role not in before.roles and bot.storyteller_role in after.roles:
-        bot.game.storytellers.append(Player(after, Storyteller, None))
-    bot.backup()
+    role = table.storyteller_role
+    if role not in before.roles and role in after.roles:
+        table.game.add_storyteller(Player(after, Storyteller, None))
+        table.bot.index_members(table)
+    table.backup()
 
 
 class Events(commands.Cog):
@@ -76,12 +78,14 @@ class Events(commands.Cog):
         print("Logged in as", self.bot.user.name)
         print("ID:", self.bot.user.id)
         print("Server:", self.bot.server)
-        print("Gameplay Channel: #", self.bot.channel.name)
+        for table in self.bot.tables.values():
+            print("Gameplay Channel: #", table.channel.name)
 
-        # restore backups
-        await self.bot.restore_backup()
+            # restore backups
+            await table.restore_backup()
 
         # update status
+        self.bot.presence.reset()
         await self.bot.update_status()
 
         print("------")
@@ -190,13 +194,14 @@ class Events(commands.Cog):
     @commands.Cog.listener()
     async def on_member_update(self, before, after):
         """Handle member updates."""
-        if self.bot.game:
+        for table in self.bot.tables.values():
+            if table.game:
 
-            # update player objects with changes
-            _update_player_members(self.bot, after)
+                # update player objects with changes
+                _update_player_members(table, after)
 
-            # add new storytellers to the seating order
-            _update_storyteller_list(self.bot, after, before)
+                # add new storytellers to the seating order
+                _update_storyteller_list(table, after, before)
 
     @commands.Cog.listener()
     async def on_message(self, message):
@@ -204,15 +209,16 @@ class Events(commands.Cog):
         if message.author.bot:
             return
 
-        if not message.channel == self.bot.channel:
+        table = self.bot.tables.get(message.channel.id)
+        if table is None:
             return
 
-        if self.bot.game is None or self.bot.game.current_day is None:
+        if table.game is None or table.game.current_day is None:
             return
 
         try:
-            player = get_player(self.bot.game, message.author.id, False)
-            await player.make_active(self.bot.game)
+            player = get_player(table.game, message.author.id, False)
+            await player.make_active(table)
         except TypeError as e:
             if str(e) != "no current game":
                 raise
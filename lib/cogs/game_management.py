@@ -54,7 +54,7 @@ class GameManagement(commands.Cog, name="[ST] Game Management"):
 
         # check if person is in the game
         try:
-            get_player(ctx.bot.game, traveler_actual.id)
+            get_player(ctx.table.game, traveler_actual.id)
             raise commands.BadArgument(
                 f"{load_preferences(traveler_actual).nick} is already in the game."
             )
@@ -68,13 +68,11 @@ class GameManagement(commands.Cog, name="[ST] Game Management"):
 
                 # determine the position
                 upwards_neighbor_actual = await to_player(ctx, upwards_neighbor)
+                seating_order = ctx.table.game.seating_order
+                position = seating_order.index(upwards_neighbor_actual) + 1
 
                 # make the Player
-                player = Player(
-                    traveler_actual,
-                    character_actual,
-                    upwards_neighbor_actual.position + 1,
-                )
+                player = Player(traveler_actual, character_actual, position)
 
                 # check that the character is a traveler
                 if not player.character_type(ctx) == "traveler":
@@ -89,33 +87,31 @@ class GameManagement(commands.Cog, name="[ST] Game Management"):
                     player.add_effect(ctx, Evil, player)
 
                 # add the player role
-                await traveler_actual.add_roles(ctx.bot.player_role)
+                await traveler_actual.add_roles(ctx.table.player_role)
 
                 # add them to the seating order
-                ctx.bot.game.seating_order.insert(
-                    upwards_neighbor_actual.position + 1, player
-                )
+                ctx.table.game.add_player(position, player)
 
                 # announcement
-                await safe_send(
-                    ctx.bot.channel,
+                await ctx.bot.dispatcher.send(
+                    ctx.table.channel,
                     (
                         "{townsfolk}, {player} has joined the town as the {traveler}. "
                         "Let's tell {pronoun} hello!"
                     ).format(
                         traveler=player.character.name,
                         pronoun=load_preferences(player).pronouns[1],
-                        townsfolk=ctx.bot.player_role.mention,
+                        townsfolk=ctx.table.player_role.mention,
                         player=player.nick,
                     ),
                 )
 
                 # rules
-                msg = await safe_send(
-                    ctx.bot.channel,
+                msg = await ctx.bot.dispatcher.send(
+                    ctx.table.channel,
                     f"\n**{player.character.name}** - {player.character.rules_text}",
                 )
-                await msg.pin()
+                ctx.table.game.pins.pin(ctx, msg)
                 await safe_send(
                     ctx,
                     f"Successfully added {player.nick} as the {player.character.name}.",
@@ -141,21 +137,21 @@ class GameManagement(commands.Cog, name="[ST] Game Management"):
             raise commands.BadArgument(f"{traveler_actual.nick} is not a traveler.")
 
         # remove them from the seating order
-        ctx.bot.game.seating_order.remove(traveler_actual)
+        ctx.table.game.remove_player(traveler_actual)
 
         # announcement
-        msg = await safe_send(
-            ctx.bot.channel,
+        msg = await ctx.bot.dispatcher.send(
+            ctx.table.channel,
             (
                 "{townsfolk}, {traveler} has left the town. "
                 "Let's wish {pronoun} goodbye!"
             ).format(
                 pronoun=load_preferences(traveler_actual).pronouns[1],
-                townsfolk=ctx.bot.player_role.mention,
+                townsfolk=ctx.table.player_role.mention,
                 traveler=traveler_actual.nick,
             ),
         )
-        await msg.pin()
+        ctx.table.game.pins.pin(ctx, msg)
         await safe_send(ctx, f"Successfully removed traveler {traveler_actual.nick}.")
 
     @commands.command()
@@ -172,8 +168,8 @@ class GameManagement(commands.Cog, name="[ST] Game Management"):
 
         If you want to simulate a nomination by a player, use proxynominate.
         """
-        await ctx.bot.game.current_day.nominate(
-            ctx, nominee, get_player(ctx.bot.game, ctx.message.author.id)
+        await ctx.table.game.current_day.nominate(
+            ctx, nominee, get_player(ctx.table.game, ctx.message.author.id)
         )
         await safe_send(ctx, f"Successfully nominated.")
 
@@ -195,7 +191,7 @@ class GameManagement(commands.Cog, name="[ST] Game Management"):
         """
         nominator_actual = await to_player(ctx, nominator)
         try:
-            await ctx.bot.game.current_day.nominate(ctx, nominee, nominator_actual)
+            await ctx.table.game.current_day.nominate(ctx, nominee, nominator_actual)
             await safe_send(ctx, f"Successfully nominated for {nominator_actual.nick}.")
         except ValueError as e:
             if str(e) == "nominator already nominated":
@@ -218,16 +214,18 @@ class GameManagement(commands.Cog, name="[ST] Game Management"):
         """
         voter_actual = await to_player(ctx, voter)
         vote_actual = to_bool(vote, "vote")
-        if ctx.bot.game.current_day.current_vote.to_vote != voter_actual:
+        if ctx.table.game.current_day.current_vote.to_vote != voter_actual:
             await safe_send(
                 ctx,
                 "It is not {player}'s vote. It is {actual_voter}'s vote.".format(
-                    actual_voter=ctx.bot.game.current_day.current_vote.to_vote.nick,
+                    actual_voter=ctx.table.game.current_day.current_vote.to_vote.nick,
                     player=voter_actual.nick,
                 ),
             )
             return
-        await ctx.bot.game.current_day.current_vote.vote(ctx, voter_actual, vote_actual)
+        await ctx.table.game.current_day.current_vote.vote(
+            ctx, voter_actual, vote_actual
+        )
         await safe_send(ctx, f"Successfully voted for {voter_actual.nick}.")
 
     @commands.command()
@@ -257,8 +255,8 @@ class GameManagement(commands.Cog, name="[ST] Game Management"):
         """
         traveler_actual = await to_player(ctx, traveler)
         if not traveler_actual.character_type(ctx) == "traveler":
-            await safe_send(
-                ctx.bot.channel, f"{traveler_actual.nick} is not a traveler.",
+            await ctx.bot.dispatcher.send(
+                ctx.table.channel, f"{traveler_actual.nick} is not a traveler.",
             )
             return
 
@@ -275,8 +273,10 @@ class GameManagement(commands.Cog, name="[ST] Game Management"):
         player: The player to be revived.
         """
         player_actual = await to_player(ctx, player)
-        msg = await safe_send(ctx.bot.channel, await player_actual.revive(ctx))
-        await msg.pin()
+        msg = await ctx.bot.dispatcher.send(
+            ctx.table.channel, await player_actual.revive(ctx)
+        )
+        ctx.table.game.pins.pin(ctx, msg)
         await safe_send(ctx, f"Successfully revived {player_actual.nick}.")
 
 
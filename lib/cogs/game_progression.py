@@ -6,6 +6,7 @@ from typing import List
 from discord.ext import commands
 
 from lib import checks
+from lib.dispatcher import Priority
 from lib.logic.Effect import Dead
 from lib.logic.Player import Player
 from lib.logic.converters import to_script
@@ -47,7 +48,7 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
 
         winner: 'good' or 'evil'. Can be 'neutral' in the event of a rerack.
 
-        This command often takes a long time, as it unpins a large number of messages.
+        This unpins every message the bot pinned during the game.
         """
         with ctx.typing():
 
@@ -59,40 +60,44 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
                 )
 
             # set winner
-            ctx.bot.game.winner = winner
+            ctx.table.game.winner = winner
 
             # endgame message
             if winner != "neutral":
-                await safe_send(
-                    ctx.bot.channel,
-                    f"{ctx.bot.player_role.mention}, {winner} has won. Good game!",
+                await ctx.bot.dispatcher.send(
+                    ctx.table.channel,
+                    f"{ctx.table.player_role.mention}, {winner} has won. Good game!",
                 )
             else:
-                await safe_send(
-                    ctx.bot.channel,
-                    f"{ctx.bot.player_role.mention}, the game is being remade.",
+                await ctx.bot.dispatcher.send(
+                    ctx.table.channel,
+                    f"{ctx.table.player_role.mention}, the game is being remade.",
                 )
 
             # unpin messages
-            # TODO: unpin the script messages as well
-            for msg in await ctx.bot.channel.pins():
-                if msg.created_at >= ctx.bot.game.seating_order_message.created_at:
-                    await msg.unpin()
+            await ctx.table.game.pins.unpin_all(ctx)
 
             # backup
             i = 1
-            while isfile(f"{ctx.bot.bot_name}/old/game_{i}.pckl"):
+            while isfile(ctx.table.backup_path(f"old/game_{i}.pckl")):
                 i += 1
-            ctx.bot.backup(f"old/game_{i}.pckl")
+            ctx.table.backup(f"old/game_{i}.pckl")
 
             # thank storytellers
-            for st in ctx.bot.game.storytellers:
-                await safe_send(
-                    st.member, "Thank you for storytelling! We appreciate you <3"
-                )
+            await ctx.bot.dispatcher.send_many(
+                (
+                    (st.member, "Thank you for storytelling! We appreciate you <3")
+                    for st in ctx.table.game.storytellers
+                ),
+                Priority.DIRECT,
+            )
+
+            # send the game's last PM reports, so they don't go out with the next game
+            await ctx.table.observer_digest.flush(ctx.table)
 
             # delete game
-            ctx.bot.game = None
+            ctx.table.scheduler.cancel_all()
+            ctx.table.game = None
 
             # complete
             await safe_send(ctx, "Ended the game successfully.")
@@ -117,8 +122,8 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
             await safe_send(ctx, "Cancelled.")
             return
 
-        await safe_send(ctx.bot.channel, "No one was executed.")
-        await ctx.bot.game.current_day.end(ctx)
+        await ctx.bot.dispatcher.send(ctx.table.channel, "No one was executed.")
+        await ctx.table.game.current_day.end(ctx)
 
     @commands.group()
     @checks.is_night()
@@ -131,7 +136,7 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
         This will perform the action of most characters in the night order.
         It does not handle info roles or other roles with no effect on the gamestate.
         """
-        return await ctx.bot.game.startday(ctx)
+        return await ctx.table.game.startday(ctx)
 
     @startday.command()
     async def arbitrarykills(self, ctx: Context, *, kills: str):
@@ -150,7 +155,7 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
             if not player.ghost(ctx):
                 player.add_effect(ctx, Dead, player)
 
-        await ctx.bot.game.startday(ctx, kills_actual)
+        await ctx.table.game.startday(ctx, kills_actual)
 
     @commands.command(name="open")
     @checks.is_day()
@@ -159,8 +164,8 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
     @checks.is_dm()
     async def _open(self, ctx: Context):
         """Open PMs and nominations."""
-        await ctx.bot.game.current_day.open_pms(ctx)
-        await ctx.bot.game.current_day.open_noms(ctx)
+        await ctx.table.game.current_day.open_pms(ctx)
+        await ctx.table.game.current_day.open_noms(ctx)
 
     @commands.command()
     @checks.is_day()
@@ -169,7 +174,7 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
     @checks.is_dm()
     async def opennoms(self, ctx: Context):
         """Open nominations."""
-        await ctx.bot.game.current_day.open_noms(ctx)
+        await ctx.table.game.current_day.open_noms(ctx)
 
     @commands.command()
     @checks.is_day()
@@ -178,7 +183,7 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
     @checks.is_dm()
     async def openpms(self, ctx: Context):
         """Open PMs."""
-        await ctx.bot.game.current_day.open_pms(ctx)
+        await ctx.table.game.current_day.open_pms(ctx)
 
     @commands.command(name="close")
     @checks.is_day()
@@ -187,8 +192,8 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
     @checks.is_dm()
     async def _close(self, ctx: Context):
         """Close PMs and nominations."""
-        await ctx.bot.game.current_day.close_pms(ctx)
-        await ctx.bot.game.current_day.close_noms(ctx)
+        await ctx.table.game.current_day.close_pms(ctx)
+        await ctx.table.game.current_day.close_noms(ctx)
 
     @commands.command()
     @checks.is_day()
@@ -197,7 +202,7 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
     @checks.is_dm()
     async def closenoms(self, ctx: Context):
         """Close nominations."""
-        await ctx.bot.game.current_day.close_noms(ctx)
+        await ctx.table.game.current_day.close_noms(ctx)
 
     @commands.command()
     @checks.is_day()
@@ -206,7 +211,7 @@ class GameProgression(commands.Cog, name="[ST] Game Progression"):
     @checks.is_dm()
     async def closepms(self, ctx: Context):
         """Close PMs."""
-        await ctx.bot.game.current_day.close_pms(ctx)
+        await ctx.table.game.current_day.close_pms(ctx)
 
 
 def setup(bot):
@@ -20,7 +20,7 @@ class Info(commands.Cog, name="[ST] Info"):
     @checks.is_dm()
     async def notactive(self, ctx):
         """List the players yet to speak today."""
-        not_active = ctx.bot.game.not_active
+        not_active = ctx.table.game.not_active
 
         if not not_active:
             message_text = "Everyone has spoken!"
@@ -28,7 +28,7 @@ class Info(commands.Cog, name="[ST] Info"):
         else:
             message_text = "The following players have not spoken today:"
 
-            for player in ctx.bot.game.not_active:
+            for player in not_active:
                 message_text += f"\n{player.nick}"
 
         await safe_send(ctx, message_text)
@@ -45,9 +45,9 @@ class Info(commands.Cog, name="[ST] Info"):
         The message must be in the main gameplay channel.
         """
         try:
-            time = (await ctx.bot.channel.fetch_message(idn)).created_at
+            time = (await ctx.table.channel.fetch_message(idn)).created_at
             await safe_send(
-                ctx, generate_message_tally(ctx, lambda msg: msg["time"] >= time,),
+                ctx, generate_message_tally(ctx, lambda msg: msg.time >= time),
             )
         except discord.errors.NotFound:
             await safe_send(ctx, f"Message with ID {idn} not found.")
@@ -61,7 +61,7 @@ class Info(commands.Cog, name="[ST] Info"):
 
         message_text = "**Grimoire:**"
 
-        for player in ctx.bot.game.seating_order:
+        for player in ctx.table.game.seating_order:
             message_text += f"\n{player.epithet}"
             effect_list = [
                 effect
@@ -84,7 +84,7 @@ class Info(commands.Cog, name="[ST] Info"):
         player1_actual = await to_player(ctx, player1)
         player2_actual = await to_player(ctx, player2)
 
-        await safe_send(ctx, player1_actual.message_history_with(player2_actual))
+        await safe_send(ctx, player1_actual.message_history_with(ctx, player2_actual))
 
 
 def setup(bot: BOTCBot):
@@ -29,8 +29,8 @@ class Playing(commands.Cog, name="[Player] Playing"):
         nominee: The player to be nominated, or "the storytellers".
         """
         try:
-            await ctx.bot.game.current_day.nominate(
-                ctx, nominee, get_player(ctx.bot.game, ctx.message.author.id)
+            await ctx.table.game.current_day.nominate(
+                ctx, nominee, get_player(ctx.table.game, ctx.message.author.id)
             )
 
         # if they can't nominate
@@ -52,10 +52,10 @@ class Playing(commands.Cog, name="[Player] Playing"):
         """
         vote_actual = to_bool(vote, "vote")
 
-        player = get_player(ctx.bot.game, ctx.message.author.id)
+        player = get_player(ctx.table.game, ctx.message.author.id)
 
         # verify it's their turn to vote
-        if ctx.bot.game.current_day.current_vote.to_vote != player:
+        if ctx.table.game.current_day.current_vote.to_vote != player:
             await safe_send(
                 ctx,
                 (
@@ -63,12 +63,12 @@ class Playing(commands.Cog, name="[Player] Playing"):
                     "(Unless this is a bug. In which case I'm silly. "
                     "I hope I'm not silly.)"
                 ).format(
-                    actual_voter=ctx.bot.game.current_day.current_vote.to_vote.nick
+                    actual_voter=ctx.table.game.current_day.current_vote.to_vote.nick
                 ),
             )
 
         # do the vote
-        await ctx.bot.game.current_day.current_vote.vote(ctx, player, vote_actual)
+        await ctx.table.game.current_day.current_vote.vote(ctx, player, vote_actual)
 
     @commands.command(aliases=["message"])
     @checks.pms_open()
@@ -87,7 +87,7 @@ class Playing(commands.Cog, name="[Player] Playing"):
         recipient_actual = await to_player(ctx, recipient, includes_storytellers=True)
 
         await recipient_actual.message(
-            ctx, get_player(ctx.bot.game, ctx.message.author.id)
+            ctx, get_player(ctx.table.game, ctx.message.author.id)
         )
 
     @commands.command()
@@ -102,16 +102,18 @@ class Playing(commands.Cog, name="[Player] Playing"):
         You will be asked about the content of the message.
         You can cancel by saying "cancel".
         """
-        author_player = get_player(ctx.bot.game, ctx.message.author.id)
+        author_player = get_player(ctx.table.game, ctx.message.author.id)
 
-        most_recent_time = ctx.bot.game.seating_order_message.created_at
+        most_recent = ctx.table.game.message_log.last_received(author_player.id)
         most_recent_author = None  # type: Optional[Player]
 
-        for message in author_player.message_history:
-            if message["from"] != author_player:
-                if message["time"] > most_recent_time:
-                    most_recent_time = message["time"]
-                    most_recent_author = message["from"]
+        if most_recent:
+            try:
+                most_recent_author = get_player(ctx.table.game, most_recent.frm)
+            except ValueError as e:
+                # the author has left the game
+                if str(e) != "player not found":
+                    raise
 
         if not most_recent_author:
             await safe_send(ctx, "No messages to reply to.")
@@ -133,8 +135,8 @@ class Playing(commands.Cog, name="[Player] Playing"):
         When it's your turn to vote, this will automatically submit the queued vote.
         """
         actual_vt = int(to_bool(vote, "vote"))
-        await ctx.bot.game.current_day.current_vote.prevote(
-            ctx, get_player(ctx.bot.game, ctx.author.id), actual_vt
+        await ctx.table.game.current_day.current_vote.prevote(
+            ctx, get_player(ctx.table.game, ctx.author.id), actual_vt
         )
 
     @commands.command()
@@ -149,8 +151,8 @@ class Playing(commands.Cog, name="[Player] Playing"):
         player_actual = await to_player(ctx, player)
         await safe_send(
             ctx,
-            get_player(ctx.bot.game, ctx.author.id, False).message_history_with(
-                player_actual
+            get_player(ctx.table.game, ctx.author.id, False).message_history_with(
+                ctx, player_actual
             ),
         )
 
@@ -159,7 +159,7 @@ class PreferenceManagement(commands.Cog, name="[General] Preferences"):
             ),
         )
 
-    @commands.command(hidden=True)
+    @commands.command()
     @checks.is_dm()
     async def emergencyvote(
         self, ctx: Context, vote: str, time: int, specific: str = "yes",
@@ -198,7 +198,7 @@ class PreferenceManagement(commands.Cog, name="[General] Preferences"):
                 ).format(vote=("no", "yes")[vote_actual], time=str(time)),
             )
 
-    @commands.command(hidden=True)
+    @commands.command()
     @checks.is_dm()
     async def removeemergencyvote(self, ctx: Context, specific: str = "yes"):
         """Remove your emergency vote.
@@ -4,11 +4,11 @@ from discord.ext import commands
 
 from lib import checks
 from lib.bot import BOTCBot
-from lib.logic.Script import Script, script_list
-from lib.logic.converters import to_script, to_character, to_character_list
+from lib.logic.Script import Script, night_orders, parse_script_json, script_list
+from lib.logic.converters import to_script, to_character_list
 from lib.preferences import load_preferences
 from lib.typings.context import Context
-from lib.utils import get_input, safe_send
+from lib.utils import get_input, get_input_message, safe_send
 
 
 class ScriptManagement(commands.Cog, name="[General] Scripts"):
@@ -61,15 +61,23 @@ class ScriptManagement(commands.Cog, name="[General] Scripts"):
 
         # Get the characters
         if mode == "json":
-            raw_characters = (
-                await get_input(
-                    ctx,
-                    (
-                        "What characters are on the script? "
-                        "Send the text of the json from the script creator."
-                    ),
+            message = await get_input_message(
+                ctx,
+                (
+                    "What characters are on the script? Send the json from the "
+                    "script creator, as text or as a file."
+                ),
+            )
+            if message.attachments:
+                text = (await message.attachments[0].read()).decode("utf-8")
+            else:
+                text = message.content
+            try:
+                raw_characters = parse_script_json(text)
+            except ValueError:
+                raise commands.BadArgument(
+                    "That doesn't look like json from the script creator."
                 )
-            )[8:-3].split('"},{"id":"')
         elif mode == "text":
             raw_characters = (
                 await get_input(
@@ -87,56 +95,22 @@ class ScriptManagement(commands.Cog, name="[General] Scripts"):
         with ctx.typing():
 
             character_list = to_character_list(ctx, raw_characters)
-            playtest = False
-            for char_class in character_list:
-                if char_class(None).playtest:
-                    playtest = True
-                    break
+            playtest = any(char_class.playtest for char_class in character_list)
 
             # Make the script
+            first_night, other_nights = night_orders(character_list)
             script = Script(
                 name,
                 character_list,
+                first_night=first_night,
+                other_nights=other_nights,
                 editors=[ctx.message.author.id],
                 playtest=playtest,
             )
 
-        # First night order
-        raw_first_night = (
-            await get_input(
-                ctx,
-                "What is the first night order? Separate characters by line breaks.",
-            )
-        ).split("\n")
-
-        with ctx.typing():
-
-            first_night_list = []  # Here we're ok with duplicates
-            for char in raw_first_night:
-                char_class = to_character(ctx, char, script)
-                first_night_list.append(char_class)
-
-            script.first_night = first_night_list
-
-        # Other nights order
-        raw_other_nights = (
-            await get_input(
-                ctx,
-                (
-                    "What is the order for other nights?"
-                    "Separate characters by line breaks."
-                ),
-            )
-        ).split("\n")
-
-        with ctx.typing():
-
-            other_nights_list = []  # Here we're ok with duplicates
-            for char in raw_other_nights:
-                char_class = to_character(ctx, char, script)
-                other_nights_list.append(char_class)
-
-            script.other_nights = other_nights_list
+        # Playtest characters aren't in the basegame night order, so ask for it
+        if playtest:
+            await _ask_night_orders(ctx, script)
 
         # save
         script.save()
@@ -203,6 +177,36 @@ def _permission_to_edit(ctx: Context, idn: int, script: Script):
         raise commands.BadArgument(message_text)
 
 
+async def _ask_night_orders(ctx: Context, script: Script):
+    """Ask for a script's night orders."""
+    # First night order
+    raw_first_night = (
+        await get_input(
+            ctx,
+            "What is the first night order? Separate characters by line breaks.",
+        )
+    ).split("\n")
+
+    with ctx.typing():
+        # Here we're ok with duplicates
+        script.first_night = to_character_list(ctx, raw_first_night, script)
+
+    # Other nights order
+    raw_other_nights = (
+        await get_input(
+            ctx,
+            (
+                "What is the order for other nights? "
+                "Separate characters by line breaks."
+            ),
+        )
+    ).split("\n")
+
+    with ctx.typing():
+        # Here we're ok with duplicates
+        script.other_nights = to_character_list(ctx, raw_other_nights, script)
+
+
 def setup(bot: BOTCBot):
     """Set the cog up."""
     bot.add_cog(ScriptManagement(bot))
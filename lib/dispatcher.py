@@ -0,0 +1,327 @@
+"""Contains the Dispatcher class and the outbound message priorities."""
+
+import asyncio
+import heapq
+import itertools
+import time
+import traceback
+from collections import deque
+from enum import IntEnum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
+
+from discord import Message
+from discord.abc import Messageable
+
+from lib.utils import safe_send
+
+# How many requests may be in flight at once, across every route.
+_CONCURRENCY = 8
+
+# How many requests each route may make per _BUCKET_PERIOD seconds.
+_BUCKET_SIZE = 5
+_BUCKET_PERIOD = 5.0
+
+
+class Priority(IntEnum):
+    """The priority classes of outbound requests, most urgent first."""
+
+    PUBLIC = 0
+    """Messages in the gameplay channel."""
+
+    DIRECT = 1
+    """DMs needed to play, such as PMs and notifications to storytellers."""
+
+    OBSERVER = 2
+    """DMs to observers."""
+
+    COSMETIC = 3
+    """Pins, unpins and edits."""
+
+
+class RateBucket:
+    """A token bucket pacing the requests made on one route.
+
+    Parameters
+    ----------
+    size : int
+        How many requests may be made in a burst.
+    period : float
+        How many seconds it takes to refill the whole bucket.
+
+    Attributes
+    ----------
+    tokens : float
+        How many requests may be made now.
+    updated : float
+        When tokens was last brought up to date.
+    size
+    period
+    """
+
+    tokens: float
+    updated: float
+
+    def __init__(self, size: int = _BUCKET_SIZE, period: float = _BUCKET_PERIOD):
+        self.size = size
+        self.period = period
+        self.tokens = size
+        self.updated = time.monotonic()
+
+    def delay(self) -> float:
+        """Determine how many seconds until a request may be made."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.size, self.tokens + (now - self.updated) * self.size / self.period
+        )
+        self.updated = now
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) * self.period / self.size
+
+    def take(self):
+        """Spend a token on a request."""
+        self.tokens -= 1
+
+
+class _Job:
+    """A queued request."""
+
+    def __init__(
+        self,
+        priority: Priority,
+        factory: Callable[[], Awaitable[Any]],
+        future: asyncio.Future,
+        paced: bool,
+    ):
+        self.priority = priority
+        self.factory = factory
+        self.future = future
+        self.paced = paced
+
+
+class Dispatcher:
+    """Sends every outbound request in priority order.
+
+    Requests are grouped into routes, such as the messages sent to one channel. Each
+    route runs its requests one at a time, in the order they were submitted, and is
+    paced by its own rate bucket so that bursts wait locally instead of being
+    rejected by Discord. Among the routes with a request ready, the most urgent
+    request runs first, so public announcements never queue behind observer DMs.
+
+    Requests which only need ordering among themselves, such as the pin and unpin of
+    one message, can skip the bucket and leave their pacing to discord.py.
+
+    Parameters
+    ----------
+    concurrency : int
+        How many requests may be in flight at once, across every route.
+
+    Attributes
+    ----------
+    queues : Dict[Hashable, Deque[_Job]]
+        The requests waiting on each route.
+    buckets : Dict[Hashable, RateBucket]
+        The rate bucket of each route.
+    ready : List[Tuple[int, int, Hashable]]
+        A heap of the routes with a request ready to run, by the priority of their
+        first request, then by submission order.
+    busy : Set[Hashable]
+        The routes with a request in flight or waiting on their bucket.
+    concurrency
+    """
+
+    queues: Dict[Hashable, Deque[_Job]]
+    buckets: Dict[Hashable, RateBucket]
+    ready: List[Tuple[int, int, Hashable]]
+    busy: Set[Hashable]
+
+    def __init__(self, concurrency: int = _CONCURRENCY):
+        self.concurrency = concurrency
+        self.queues = {}
+        self.buckets = {}
+        self.ready = []
+        self.busy = set()
+        self._in_flight = 0
+        self._counter = itertools.count()
+
+    def submit(
+        self,
+        route: Hashable,
+        priority: Priority,
+        factory: Callable[[], Awaitable[Any]],
+        paced: bool = True,
+    ) -> asyncio.Future:
+        """Queue a request.
+
+        Parameters
+        ----------
+        route : Hashable
+            The request's route. Requests on the same route run in order.
+        priority : Priority
+            The request's priority class.
+        factory : Callable[[], Awaitable[Any]]
+            The coroutine function making the request.
+        paced : bool
+            Whether the request waits on its route's rate bucket.
+
+        Returns
+        -------
+        asyncio.Future
+            The request's result.
+        """
+        future = asyncio.get_event_loop().create_future()
+        queue = self.queues.setdefault(route, deque())
+        queue.append(_Job(priority, factory, future, paced))
+        if len(queue) == 1 and route not in self.busy:
+            self._push(route)
+        self._pump()
+        return future
+
+    def post(
+        self,
+        route: Hashable,
+        priority: Priority,
+        factory: Callable[[], Awaitable[Any]],
+        paced: bool = True,
+    ) -> asyncio.Future:
+        """Queue a request without waiting for it, printing any exception it raises.
+
+        Returns
+        -------
+        asyncio.Future
+            The request's result, for callers which want to react when it's done.
+        """
+        future = self.submit(route, priority, factory, paced)
+        future.add_done_callback(_report_exception)
+        return future
+
+    async def send(
+        self, target: Messageable, msg: str, priority: Priority = Priority.PUBLIC
+    ) -> Message:
+        """Send a message through the queue, as safe_send would.
+
+        Parameters
+        ----------
+        target : Messageable
+            The object to send the message to.
+        msg : str
+            The message to be sent.
+        priority : Priority
+            The message's priority class.
+
+        Returns
+        -------
+        Message
+            The first message sent.
+        """
+        return await self.submit(
+            ("send", target.id), priority, lambda: safe_send(target, msg)
+        )
+
+    async def send_many(
+        self, messages: Iterable[Tuple[Messageable, str]], priority: Priority
+    ) -> List[Union[Message, Exception]]:
+        """Send several messages through the queue at once.
+
+        Parameters
+        ----------
+        messages : Iterable[Tuple[Messageable, str]]
+            The targets and the messages to send them.
+        priority : Priority
+            The messages' priority class.
+
+        Returns
+        -------
+        List[Union[Message, Exception]]
+            For each message, in order, the first message sent, or the exception
+            raised while sending it. Exceptions are returned rather than raised, so
+            that one failure doesn't stop the other messages.
+        """
+        return await asyncio.gather(
+            *(self.send(target, msg, priority) for target, msg in messages),
+            return_exceptions=True,
+        )
+
+    def edit(self, message: Message, **fields):
+        """Queue an edit to a message without waiting for it."""
+        self.post(
+            ("edit", message.channel.id),
+            Priority.COSMETIC,
+            lambda: message.edit(**fields),
+        )
+
+    def _push(self, route: Hashable):
+        """Mark a route's first request as ready to run."""
+        heapq.heappush(
+            self.ready,
+            (self.queues[route][0].priority, next(self._counter), route),
+        )
+
+    def _pump(self):
+        """Start as many ready requests as there is room for."""
+        while self.ready and self._in_flight < self.concurrency:
+            _, _, route = heapq.heappop(self.ready)
+            self.busy.add(route)
+
+            if self.queues[route][0].paced:
+                bucket = self.buckets.setdefault(route, RateBucket())
+                delay = bucket.delay()
+                if delay:
+                    asyncio.get_event_loop().call_later(delay, self._wake, route)
+                    continue
+                bucket.take()
+
+            job = self.queues[route].popleft()
+            self._in_flight += 1
+            asyncio.ensure_future(self._run(route, job))
+
+    def _wake(self, route: Hashable):
+        """Make a route ready again once its bucket has refilled."""
+        self.busy.discard(route)
+        self._push(route)
+        self._pump()
+
+    async def _run(self, route: Hashable, job: _Job):
+        """Make a request and pass on its result."""
+        try:
+            result = await job.factory()
+        except asyncio.CancelledError:
+            job.future.cancel()
+            raise
+        except Exception as e:
+            if not job.future.cancelled():
+                job.future.set_exception(e)
+        else:
+            if not job.future.cancelled():
+                job.future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            self.busy.discard(route)
+            if self.queues[route]:
+                self._push(route)
+            else:
+                del self.queues[route]
+            self._pump()
+
+
+def _report_exception(future: asyncio.Future):
+    """Print the exception raised by a request nobody waited for, if any."""
+    if not future.cancelled() and future.exception() is not None:
+        print("Exception in queued request:")
+        traceback.print_exception(
+            type(future.exception()),
+            future.exception(),
+            future.exception().__traceback__,
+        )
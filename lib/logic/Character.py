@@ -31,6 +31,16 @@ if TYPE_CHECKING:
     from lib.logic.Player import Player
 
 
+def _find_rules_text(name: str, playtest: bool) -> str:
+    """Find a character's rules text by name."""
+    try:
+        if not playtest:
+            return rules_texts[str_cleanup(name)]
+        return playtest_rules_texts[str_cleanup(name)]
+    except KeyError:
+        return "Rules text not found."
+
+
 class Character:
     """A generic character.
 
@@ -45,6 +55,9 @@ class Character:
         Whether the character is playtest-only.
     name : str
         The character's name.
+    rules_text : str
+        The character's rules text. A class attribute, so it can be read without
+        constructing the character.
     default_effects : List[Type[Effect]]
         The effects a character starts with.
     parent: Player
@@ -52,8 +65,14 @@ class Character:
 
     name: str = "Character"
     playtest: bool = False
+    rules_text: str
     default_effects: List[Type["Effect"]]
 
+    def __init_subclass__(cls, **kwargs):
+        """Look up the subclass's rules text once, when the subclass is defined."""
+        super().__init_subclass__(**kwargs)
+        cls.rules_text = _find_rules_text(cls.name, cls.playtest)
+
     def __init__(self, parent: Optional["Player"]):
         self.parent = parent
         self.default_effects = []
@@ -127,24 +146,14 @@ class Character:
         """
         pass
 
-    @property
-    def rules_text(self) -> str:
-        """Generate the character's rules text.
-
-        Can't be defined in __init__ because self.name is Character then.
-        """
-        try:
-            if not self.playtest:
-                return rules_texts[str_cleanup(self.name)]
-            return playtest_rules_texts[str_cleanup(self.name)]
-        except KeyError:
-            return "Rules text not found."
-
     def exile(self, ctx: Context):
         """Overridden by traveler."""
         raise commands.BadArgument(f"{self.parent.nick} is not a traveler.")
 
 
+Character.rules_text = _find_rules_text(Character.name, Character.playtest)
+
+
 class Townsfolk(Character):
     """The Townsfolk class."""
 
@@ -203,20 +212,20 @@ class Traveler(Character):
     async def exile(self, ctx: Context):
         """Exiles the traveler."""
         if self.parent.ghost(ctx):
-            await safe_send(
-                ctx.bot.channel,
+            await ctx.bot.dispatcher.send(
+                ctx.table.channel,
                 f"{self.parent.nick} has been exiled, but is already dead.",
             )
 
         elif self.parent.is_status(ctx, "safe"):
-            await safe_send(
-                ctx.bot.channel,
+            await ctx.bot.dispatcher.send(
+                ctx.table.channel,
                 f"{self.parent.nick} has been exiled, but does not die.",
             )
 
         else:
-            await safe_send(
-                ctx.bot.channel, f"{self.parent.nick} has been exiled, and dies."
+            await ctx.bot.dispatcher.send(
+                ctx.table.channel, f"{self.parent.nick} has been exiled, and dies."
             )
             self.parent.add_effect(ctx, Dead, self.parent)
 
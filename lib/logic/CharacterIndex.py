@@ -0,0 +1,108 @@
+"""Contains the CharacterIndex class."""
+
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TYPE_CHECKING, Union
+
+from lib.logic.CharacterRegistry import CharacterInfo
+
+if TYPE_CHECKING:
+    from lib.logic.Character import Character
+
+# A character class, or the manifest's record of one.
+CharacterLike = Union[Type["Character"], CharacterInfo]
+
+# The lowest similarity a misspelling may have to the name it resolves to.
+_FUZZY_CUTOFF = 0.8
+
+# How much more similar the best name must be than any other character's.
+_FUZZY_MARGIN = 0.05
+
+
+class CharacterIndex:
+    """Finds characters by name, tolerating formatting and small misspellings.
+
+    Each character is indexed under its normalized class name and display name, so
+    "devil's advocate", "Devils-Advocate" and "DevilSAdvocate" all match directly.
+    Other inputs are compared to every indexed name, and resolve to the closest
+    character only if it is similar enough and clearly closer than any other.
+
+    Parameters
+    ----------
+    characters : Iterable[CharacterLike]
+        The characters to index, as classes or as manifest records. Lookups return
+        whichever was indexed.
+
+    Attributes
+    ----------
+    names : Dict[str, CharacterLike]
+        The characters, by normalized name.
+    """
+
+    names: Dict[str, CharacterLike]
+
+    def __init__(self, characters: Iterable[CharacterLike]):
+        self.names = {}
+        for character in characters:
+            for name in (_class_name(character), character.name):
+                self.names.setdefault(normalize(name), character)
+
+    def find(self, text: str) -> Optional[CharacterLike]:
+        """Find the character text names, or None.
+
+        Parameters
+        ----------
+        text : str
+            The name to search for.
+
+        Returns
+        -------
+        Optional[CharacterLike]
+            The matching character, if there is an exact match or a confident
+            fuzzy match.
+        """
+        key = normalize(text)
+        if key in self.names:
+            return self.names[key]
+
+        ranked = self.closest(key)
+        if not ranked or ranked[0][0] < _FUZZY_CUTOFF:
+            return None
+        if len(ranked) > 1 and ranked[0][0] - ranked[1][0] < _FUZZY_MARGIN:
+            return None
+        return ranked[0][1]
+
+    def suggestions(self, text: str, count: int = 3) -> List[CharacterLike]:
+        """Find the characters whose names are closest to text."""
+        return [character for _, character in self.closest(normalize(text))[:count]]
+
+    def closest(self, key: str) -> List[Tuple[float, CharacterLike]]:
+        """Rank the characters by the similarity of their closest name to key.
+
+        Characters with no name at least half as similar as _FUZZY_CUTOFF are left out.
+        """
+        floor = _FUZZY_CUTOFF / 2
+        best = {}  # type: Dict[CharacterLike, float]
+        matcher = SequenceMatcher()
+        matcher.set_seq2(key)
+        for name, character in self.names.items():
+            matcher.set_seq1(name)
+            # the cheap upper bounds skip most names without a full comparison
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            best[character] = max(best.get(character, 0), matcher.ratio())
+        return sorted(
+            ((score, character) for character, score in best.items()),
+            key=lambda pair: -pair[0],
+        )
+
+
+def normalize(text: str) -> str:
+    """Reduce a name to its lowercase letters and digits."""
+    return "".join(c for c in text.lower() if c.isalnum())
+
+
+def _class_name(character: CharacterLike) -> str:
+    """Determine the name of a character's class."""
+    if isinstance(character, CharacterInfo):
+        return character.class_name
+    return character.__name__
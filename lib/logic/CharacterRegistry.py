@@ -0,0 +1,195 @@
+"""Contains the CharacterRegistry class and the CharacterInfo record type.
+
+Run this module to regenerate the character manifests, of every package that exists
+or of the packages given:
+
+    python -m lib.logic.CharacterRegistry [package ...]
+"""
+
+import json
+import pkgutil
+import sys
+from importlib import import_module
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lib.logic.Character import Character
+
+# The packages characters are loaded from, basegame first.
+_PACKAGES = ("resources.basegame.characters", "resources.playtest.characters")
+
+
+class CharacterInfo(NamedTuple):
+    """What is known about a character without importing it.
+
+    Attributes
+    ----------
+    class_name : str
+        The name of the character's class, which is also the name of its module.
+    name : str
+        The character's name.
+    type : str
+        The character's type, such as "townsfolk".
+    playtest : bool
+        Whether the character is playtest-only.
+    package : str
+        The package containing the character's module.
+    """
+
+    class_name: str
+    name: str
+    type: str
+    playtest: bool
+    package: str
+
+
+class CharacterRegistry:
+    """Finds characters by class name, importing each one only when first used.
+
+    Characters' names, types and playtest status come from each package's generated
+    manifest, so they can be searched and listed before any character module is
+    imported. A package without a manifest has all its characters imported to
+    describe them instead.
+
+    Parameters
+    ----------
+    packages : Iterable[str]
+        The packages to read manifests from. Packages which don't exist are skipped.
+
+    Attributes
+    ----------
+    infos : Dict[str, CharacterInfo]
+        Every known character, by class name. Where class names collide, the
+        character found first wins.
+    loaded : Dict[str, Type[Character]]
+        The characters imported so far, by class name.
+    """
+
+    infos: Dict[str, CharacterInfo]
+    loaded: Dict[str, Type["Character"]]
+
+    def __init__(self, packages: Iterable[str] = _PACKAGES):
+        self.infos = {}
+        self.loaded = {}
+        for package in packages:
+            if not _package_exists(package):
+                continue
+            try:
+                manifest = import_module(package + ".manifest").manifest
+            except ModuleNotFoundError as e:
+                if e.name != package + ".manifest":
+                    raise
+                print(f"No character manifest for {package}, importing characters.")
+                manifest = generate_manifest(package)
+            for class_name, name, character_type, playtest in manifest:
+                self.infos.setdefault(
+                    class_name,
+                    CharacterInfo(class_name, name, character_type, playtest, package),
+                )
+
+    def __contains__(self, class_name: str) -> bool:
+        return class_name in self.infos
+
+    def characters(self, playtest: bool = False) -> List[CharacterInfo]:
+        """List the known characters, including playtest characters if requested."""
+        return [info for info in self.infos.values() if playtest or not info.playtest]
+
+    def load(self, class_name: str) -> Type["Character"]:
+        """Find a character class, importing its module if necessary.
+
+        Parameters
+        ----------
+        class_name : str
+            The name of the character's class.
+
+        Returns
+        -------
+        Type[Character]
+            The character class.
+
+        Raises
+        ------
+        AttributeError
+            If there is no such character.
+        """
+        if class_name not in self.loaded:
+            if class_name not in self.infos:
+                raise AttributeError(f"no character named {class_name}")
+            package = self.infos[class_name].package
+            character = getattr(import_module(f"{package}.{class_name}"), class_name)
+            # importing a submodule binds it on its package, over the lazy attribute
+            setattr(import_module(package), class_name, character)
+            self.loaded[class_name] = character
+        return self.loaded[class_name]
+
+
+def generate_manifest(package: str) -> List[Tuple[str, str, str, bool]]:
+    """Import every character in a package and describe it for its manifest.
+
+    Parameters
+    ----------
+    package : str
+        The package to describe.
+
+    Returns
+    -------
+    List[Tuple[str, str, str, bool]]
+        The class name, name, type and playtest status of every character.
+    """
+    from lib.logic.Character import Demon, Minion, Outsider, Townsfolk, Traveler
+
+    path = import_module(package).__path__
+    out = []
+    for module_info in pkgutil.iter_modules(path):
+        if module_info.name == "manifest" or module_info.name.startswith("_"):
+            continue
+        character = getattr(
+            import_module(f"{package}.{module_info.name}"), module_info.name
+        )
+        character_type = next(
+            cls.__name__.lower()
+            for cls in (Townsfolk, Outsider, Minion, Demon, Traveler)
+            if issubclass(character, cls)
+        )
+        out.append(
+            (module_info.name, character.name, character_type, character.playtest)
+        )
+    return out
+
+
+def write_manifest(package: str):
+    """Regenerate a package's manifest module."""
+    lines = [
+        f'"""Contains the manifest of the characters in {package}.',
+        "",
+        "Generated by lib.logic.CharacterRegistry; do not edit by hand.",
+        '"""',
+        "",
+        "manifest = [",
+    ]
+    for class_name, name, character_type, playtest in generate_manifest(package):
+        strings = (json.dumps(x) for x in (class_name, name, character_type))
+        lines.append("    ({}, {}, {}, {}),".format(*strings, playtest))
+    lines.append("]")
+
+    path = import_module(package).__path__[0]
+    with open(path + "/manifest.py", "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+def _package_exists(package: str) -> bool:
+    """Determine whether a package can be imported."""
+    try:
+        import_module(package)
+    except ImportError:
+        return False
+    return True
+
+
+# The characters shared by every command.
+character_registry = CharacterRegistry()
+
+
+if __name__ == "__main__":
+    for _package in sys.argv[1:] or filter(_package_exists, _PACKAGES):
+        write_manifest(_package)
@@ -8,7 +8,7 @@ from numpy import ceil
 from lib.logic.Player import Player
 from lib.logic.Vote import Vote
 from lib.logic.playerconverter import to_player
-from lib.logic.tools import generate_message_tally
+from lib.logic.tools import format_message_tally
 from lib.typings.context import Context
 from lib.utils import safe_send, safe_bug_report
 
@@ -63,7 +63,7 @@ class Day:
 
         # check effects
         proceed = True
-        for player in ctx.bot.game.seating_order:
+        for player in ctx.table.game.seating_order:
             proceed = (
                 await player.character.nomination(ctx, nominee, nominator) and proceed
             )
@@ -83,6 +83,7 @@ class Day:
         # close pms and nominations
         await self.close_pms(ctx)
         await self.close_noms(ctx)
+        await ctx.table.observer_digest.flush(ctx.table)
 
         # start the vote
         self.current_vote = Vote(ctx, nominee, nominator)
@@ -97,10 +98,10 @@ class Day:
             majority=int(ceil(self.current_vote.majority)),
             about_to_die=self.about_to_die,
         )
-        msg = await safe_send(ctx.bot.channel, message_text)
+        msg = await ctx.bot.dispatcher.send(ctx.table.channel, message_text)
 
         # pin
-        await msg.pin()
+        ctx.table.game.pins.pin(ctx, msg)
         self.current_vote.announcements.append(msg.id)
 
         # message tally
@@ -109,59 +110,41 @@ class Day:
         # start voting!
         await self.current_vote.call_next(ctx)
 
-    async def _send_message_tally(self, ctx):
-        try:
-            time = (
-                await ctx.bot.channel.fetch_message(self.vote_end_messages[-1])
-            ).created_at
-            await safe_send(
-                ctx.bot.channel,
-                generate_message_tally(ctx, lambda x: x["time"] >= time),
-            )
-        except IndexError:
-            await safe_send(
-                ctx.bot.channel,
-                generate_message_tally(
-                    ctx, lambda x: x["day"] == ctx.bot.game.day_number
-                ),
-            )
+    async def _send_message_tally(self, ctx: Context):
+        """Send a tally of the messages since the last vote ended, or the day began."""
+        await ctx.bot.dispatcher.send(
+            ctx.table.channel,
+            format_message_tally(ctx, ctx.table.game.message_tally.since_checkpoint()),
+        )
 
     async def open_pms(self, ctx: Context):
         """Open PMs."""
+        ctx.table.phase_notifier.record("PMs", self.is_pms, True)
         self.is_pms = True
-        for st in ctx.bot.game.storytellers:
-            await safe_send(st.member, "PMs are now open.")
-        await ctx.bot.update_status()
 
     async def open_noms(self, ctx: Context):
         """Open nominations."""
+        ctx.table.phase_notifier.record("nominations", self.is_noms, True)
         self.is_noms = True
-        for st in ctx.bot.game.storytellers:
-            await safe_send(st.member, "Nominations are now open.")
-        await ctx.bot.update_status()
 
     async def close_pms(self, ctx: Context):
         """Close PMs."""
+        ctx.table.phase_notifier.record("PMs", self.is_pms, False)
         self.is_pms = False
-        for st in ctx.bot.game.storytellers:
-            await safe_send(st.member, "PMs are now closed.")
-        await ctx.bot.update_status()
 
     async def close_noms(self, ctx: Context):
         """Close nominations."""
+        ctx.table.phase_notifier.record("nominations", self.is_noms, False)
         self.is_noms = False
-        for st in ctx.bot.game.storytellers:
-            await safe_send(st.member, "Nominations are now closed.")
-        await ctx.bot.update_status()
 
     async def end(self, ctx: Context):
         """End the day."""
         # remove the day
-        ctx.bot.game.past_days.append(self)
-        ctx.bot.game.current_day = None
+        ctx.table.game.past_days.append(self)
+        ctx.table.game.current_day = None
 
         # cleanup effects
-        for player in ctx.bot.game.seating_order:
+        for player in ctx.table.game.seating_order:
             effect_list = [x for x in player.effects]
             for effect in effect_list:
                 effect.evening_cleanup(ctx)
@@ -171,12 +154,13 @@ class Day:
             await self.current_vote.cancel(ctx)
 
         # announcement
-        await safe_send(
-            ctx.bot.channel, f"{ctx.bot.player_role.mention}, go to sleep!",
+        await ctx.bot.dispatcher.send(
+            ctx.table.channel, f"{ctx.table.player_role.mention}, go to sleep!",
         )
 
         # message tally
         await self._send_message_tally(ctx)
+        await ctx.table.observer_digest.flush(ctx.table)
 
         # complete
         if safe_bug_report(ctx):
@@ -186,7 +170,7 @@ class Day:
 def _check_valid_nominee(ctx: Context, nominator: Player, nominee: Player):
     """Check that the nominee is a valid nominee, else raise an exception."""
     if nominee.character_type(ctx) == "storyteller":  # atheist nominations
-        for st in ctx.bot.game.storytellers:
+        for st in ctx.table.game.storytellers:
             if not st.can_be_nominated(ctx, nominator):
                 raise commands.BadArgument(
                     "The storytellers cannot be nominated today."
@@ -207,15 +191,15 @@ def _check_valid_nominator(ctx: Context, nominator: Player, nominee: Player):
 
 async def _determine_nominee(ctx: Context, nominee_str: str) -> Player:
     """Determine the nominee from the string."""
-    if "storyteller" in nominee_str and ctx.bot.game.script.has_atheist:  #
+    if "storyteller" in nominee_str and ctx.table.game.script.has_atheist:  #
         # atheist nominations
-        nominee = ctx.bot.game.storytellers[0]
+        nominee = ctx.table.game.storytellers[0]
     else:
         nominee = await to_player(
             ctx,
             nominee_str,
             only_one=True,
-            includes_storytellers=ctx.bot.game.script.has_atheist,
+            includes_storytellers=ctx.table.game.script.has_atheist,
         )
     return nominee
 
@@ -266,14 +250,14 @@ def generate_nomination_message_text(
     if traveler:  # traveler nominations
         verb = "have" if nominator.character_type(ctx) == "storyteller" else "has"
         message_text = (
-            f"{ctx.bot.player_role.mention}, {nominator_mention} {verb} called for"
+            f"{ctx.table.player_role.mention}, {nominator_mention} {verb} called for"
             f" {nominee_mention}'s exile."
         )
 
     else:
         verb = "have" if nominee.character_type(ctx) == "storyteller" else "has"
         message_text = (
-            f"{ctx.bot.player_role.mention}, {nominee_mention} {verb} been nominated"
+            f"{ctx.table.player_role.mention}, {nominee_mention} {verb} been nominated"
             f" by {nominator_mention}."
         )
 
@@ -1,19 +1,26 @@
 """Contains the Game class."""
 
+from datetime import datetime
 from os import remove
 from random import shuffle
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Type, TYPE_CHECKING
 
 from discord import Message
 
 from lib.logic.Day import Day
+from lib.logic.MessageLog import MessageLog
+from lib.logic.MessageTally import MessageTally
+from lib.logic.PinLedger import PinLedger
 from lib.logic.Player import Player
+from lib.logic.SeatingOrder import SeatingOrder
 from lib.logic.tools import generate_game_info_message
 from lib.typings.context import Context
 from lib.utils import list_to_plural_string, safe_send
 
 if TYPE_CHECKING:
+    from lib.logic.Character import Character
     from lib.logic.Script import Script
+    from lib.table import Table
 
 
 class Game:
@@ -21,7 +28,7 @@ class Game:
 
     Parameters
     ----------
-    seating_order : List[Player]
+    seating_order : Iterable[Player]
         The game's players, in order.
     seating_order_message : Message
         The message announcing the seating order.
@@ -29,6 +36,8 @@ class Game:
         A list of characters on the game's script.
     storytellers : List[Player]
         A list of storytellers on the game's script.
+    pins : Optional[PinLedger]
+        The ledger of messages pinned so far, if any were pinned before the game began.
 
     Attributes
     ----------
@@ -36,46 +45,233 @@ class Game:
         The game's previous days.
     current_day : Optional[Day]
         The game's currently active day, or None.
-    seating_order
+    message_log : MessageLog
+        Every PM sent during the game.
+    message_tally : MessageTally
+        Running counts of the PMs between each pair of players.
+    seating_order : SeatingOrder
+        The game's players, in order.
+    not_spoken : Dict[int, None]
+        The member IDs of the players in the seating order who have not spoken
+        today. Kept up to date by set_spoken, add_player and remove_player.
+    night_plan : Optional[Dict[Type[Character], List[Player]]]
+        For each character class in play, including base classes, the players with
+        that character, in seat order. None if it must be rebuilt, after a change of
+        character or seating.
     seating_order_message
     script
     storytellers
+    pins
     """
 
+    not_spoken: Dict[int, None]
+    night_plan: Optional[Dict[Type["Character"], List[Player]]]
+    _storytellers_by_id: Dict[int, Player]
+
     def __init__(
         self,
-        seating_order: List[Player],
+        seating_order: Iterable[Player],
         seating_order_message: Message,
         script: "Script",
         storytellers: List[Player],
+        pins: Optional[PinLedger] = None,
     ):
         self.past_days = []  # type: List[Day]
         self.current_day = None  # type: Optional[Day]
-        self.seating_order = seating_order
+        self.seating_order = SeatingOrder(seating_order)
         self.seating_order_message = seating_order_message
         self.script = script
         self.storytellers = storytellers
+        self._storytellers_by_id = {st.id: st for st in storytellers}
+        self.pins = pins or PinLedger()
+        self.message_log = MessageLog()
+        self.message_tally = MessageTally()
+        self.not_spoken = {
+            player.id: None for player in self.seating_order if not player.has_spoken
+        }
+        self.night_plan = None
 
     def __getstate__(self) -> dict:
         """Cleanup when pickled."""
         state = self.__dict__.copy()
+        state["night_plan"] = None  # rebuilt when next needed
         state[
             "seating_order_message"
         ] = self.seating_order_message.id  # discord snowflake objects are not picklable
         return state
 
+    def __setstate__(self, state: dict):
+        """Restore when unpickled, filling in anything older backups lack.
+
+        Games backed up before the seating order became a SeatingOrder also need
+        upgrade, once their players' members are restored.
+        """
+        self.__dict__.update(state)
+        self.__dict__.setdefault("pins", PinLedger())
+        self.__dict__.setdefault("message_log", MessageLog())
+        self.__dict__.setdefault("message_tally", MessageTally())
+        self.night_plan = None
+
+    async def upgrade(self, table: "Table"):
+        """Rebuild the lookups missing from a game backed up by an older version.
+
+        Such a game's seating order is a plain list, its PMs are stored in each
+        player's message_history, and its pins aren't recorded. The seating order is
+        replaced by a SeatingOrder, the PMs are moved to the message log and tally,
+        with today's PMs counted since the tally's checkpoint, and the pins since the
+        seating order message are recorded in the ledger. Games already up to date
+        are left alone.
+
+        This must be called after the players' members and the seating order message
+        are restored.
+
+        Parameters
+        ----------
+        table : Table
+            The table the game is played at.
+        """
+        if isinstance(self.seating_order, SeatingOrder):
+            return
+
+        for msg in await table.channel.pins():
+            if msg.created_at >= self.seating_order_message.created_at:
+                self.pins.pinned[msg.id] = None
+
+        self.seating_order = SeatingOrder(self.seating_order)
+        self._storytellers_by_id = {st.id: st for st in self.storytellers}
+        self.not_spoken = {
+            player.id: None for player in self.seating_order if not player.has_spoken
+        }
+
+        # each PM is in both its author's and its recipient's history
+        messages = {}
+        for player in list(self.seating_order) + self.storytellers:
+            for message in player.__dict__.pop("message_history", []):
+                messages[id(message)] = message
+        ordered = sorted(messages.values(), key=lambda x: x["time"])
+
+        def log(message: dict):
+            """Record an old PM in the message log and tally."""
+            frm, to = _member_id(message["from"]), _member_id(message["to"])
+            self.message_log.append(
+                frm, to, message["day"], message["time"], message["content"]
+            )
+            self.message_tally.record(frm, to)
+
+        for message in ordered:
+            if message["day"] != self.day_number:
+                log(message)
+        self.message_tally.checkpoint()
+        for message in ordered:
+            if message["day"] == self.day_number:
+                log(message)
+
     @property
     def day_number(self) -> int:
         """Determine the current day number."""
         return len(self.past_days) + int(bool(self.current_day))
 
+    def get_player(self, idn: int, include_storytellers: bool = True) -> Player:
+        """Find the player whose member has the given ID.
+
+        Parameters
+        ----------
+        idn : int
+            The player's member's discord ID.
+        include_storytellers : bool
+            Whether to search the storytellers as well.
+
+        Returns
+        -------
+        Player
+            The matching player if found, else raises an exception.
+
+        Raises
+        ------
+        ValueError
+            If no matching player is found.
+        """
+        if include_storytellers and idn in self._storytellers_by_id:
+            return self._storytellers_by_id[idn]
+
+        player = self.seating_order.get(idn)
+        if player is None:
+            raise ValueError("player not found")
+        return player
+
+    def add_storyteller(self, storyteller: Player):
+        """Add a new storyteller to the game."""
+        if storyteller.id not in self._storytellers_by_id:
+            self.storytellers.append(storyteller)
+            self._storytellers_by_id[storyteller.id] = storyteller
+
+    def add_player(self, index: int, player: Player):
+        """Insert a player, such as a traveler, into the seating order."""
+        self.seating_order.insert(index, player)
+        self.set_spoken(player, player.has_spoken)
+        self.night_plan = None
+
+    def remove_player(self, player: Player):
+        """Remove a player, such as a traveler, from the seating order."""
+        self.seating_order.remove(player)
+        self.not_spoken.pop(player.id, None)
+        self.night_plan = None
+
+    def set_spoken(self, player: Player, has_spoken: bool = True):
+        """Record whether a player has spoken today."""
+        player.has_spoken = has_spoken
+        if has_spoken:
+            self.not_spoken.pop(player.id, None)
+        elif player in self.seating_order:
+            self.not_spoken[player.id] = None
+
+    def players_with_character(self, character: Type["Character"]) -> List[Player]:
+        """Find the players whose characters are instances of character, in order.
+
+        Parameters
+        ----------
+        character : Type[Character]
+            The character class to search for.
+
+        Returns
+        -------
+        List[Player]
+            The matching players, in seat order.
+        """
+        if self.night_plan is None:
+            self.night_plan = {}
+            for player in self.seating_order:
+                for cls in type(player.character).__mro__:
+                    self.night_plan.setdefault(cls, []).append(player)
+        return self.night_plan.get(character, [])
+
+    def log_message(self, frm: Player, to: Player, content: str, time: datetime):
+        """Record a PM in the message log and tally.
+
+        Parameters
+        ----------
+        frm : Player
+            The PM's author.
+        to : Player
+            The PM's recipient.
+        content : str
+            The PM's content.
+        time : datetime
+            The time the PM was sent.
+        """
+        self.message_log.append(frm.id, to.id, self.day_number, time, content)
+        self.message_tally.record(frm.id, to.id)
+
     @property
     def not_active(self) -> List[Player]:
         """Determine the players who have not spoken today."""
         if not self.current_day:
             return []
 
-        return [player for player in self.seating_order if not player.has_spoken]
+        return sorted(
+            (self.get_player(idn, False) for idn in self.not_spoken),
+            key=lambda player: player.position,
+        )
 
     async def reseat(self, ctx: Context, new_seating_order: List[Player]):
         """Modify the seating order and seating order message.
@@ -92,12 +288,15 @@ class Game:
             raise ValueError("unmatched seating order length")
 
         # Edit the message
-        await self.seating_order_message.edit(
-            content=generate_game_info_message(new_seating_order, ctx)
+        ctx.bot.dispatcher.edit(
+            self.seating_order_message,
+            content=generate_game_info_message(new_seating_order, ctx),
         )
 
         # Update seating order
-        self.seating_order = new_seating_order
+        if new_seating_order is not self.seating_order:
+            self.seating_order = SeatingOrder(new_seating_order)
+            self.night_plan = None
 
     async def startday(self, ctx: Context, kills: List[Player] = None):
         """Handle logic for startday.
@@ -109,7 +308,7 @@ class Game:
         kills : List[Player]
             Players to kill at the beginning of the night.
         """
-        ctx.bot.backup("special_backup.pckl")
+        ctx.table.backup("special_backup.pckl")
 
         kills = kills or []
         messages = []  # type: List[str]
@@ -121,11 +320,10 @@ class Game:
             else:
                 order = self.script.other_nights
             for character in order:
-                for player in self.seating_order:
-                    if isinstance(player.character, character):
-                        out_temp = await player.character.morning(ctx)
-                        kills += out_temp[0]
-                        messages += out_temp[1]
+                for player in self.players_with_character(character):
+                    out_temp = await player.character.morning(ctx)
+                    kills += out_temp[0]
+                    messages += out_temp[1]
 
             # cleanup stuff
             for player in self.seating_order:
@@ -136,14 +334,15 @@ class Game:
 
             # make the day
             self.current_day = Day()
+            self.message_tally.checkpoint()
             await ctx.bot.update_status()
 
-            remove("resources/backup/" + ctx.bot.bot_name + "/special_backup.pckl")
+            remove(ctx.table.backup_path("special_backup.pckl"))
 
         except Exception:
 
-            await ctx.bot.restore_backup("special_backup.pckl", mute=True)
-            remove("resources/backup/" + ctx.bot.bot_name + "/special_backup.pckl")
+            await ctx.table.restore_backup("special_backup.pckl", mute=True)
+            remove(ctx.table.backup_path("special_backup.pckl"))
             raise
 
         # announcements
@@ -151,24 +350,31 @@ class Game:
         # kills
         shuffle(kills)
         text = list_to_plural_string([x.nick for x in kills], alt="No one")
-        kill_msg = await safe_send(
-            ctx.bot.channel,
+        kill_msg = await ctx.bot.dispatcher.send(
+            ctx.table.channel,
             "{text} {verb} died.".format(text=text[0], verb=("has", "have")[text[1]]),
         )
 
         # other
         for content in messages:
             if content:
-                msg = await safe_send(ctx.bot.channel, content)
-                await msg.pin()
+                msg = await ctx.bot.dispatcher.send(ctx.table.channel, content)
+                self.pins.pin(ctx, msg)
 
         # start day
-        await safe_send(
-            ctx.bot.channel, f"{ctx.bot.player_role.mention}, wake up!",
+        await ctx.bot.dispatcher.send(
+            ctx.table.channel, f"{ctx.table.player_role.mention}, wake up!",
         )
         if kills:
-            await kill_msg.pin()
+            self.pins.pin(ctx, kill_msg)
 
         # complete
         await safe_send(ctx, "Successfully started the day.")
         return
+
+
+def _member_id(player: Player) -> int:
+    """Determine a player's member ID, even if their member hasn't been restored."""
+    if isinstance(player.member, int):
+        return player.member
+    return player.id
@@ -0,0 +1,118 @@
+"""Contains the MessageLog class and the PM record type."""
+
+from datetime import datetime
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class PM(NamedTuple):
+    """A record of a PM.
+
+    Attributes
+    ----------
+    frm : int
+        The author's member ID.
+    to : int
+        The recipient's member ID.
+    day : int
+        The day the message was sent.
+    time : datetime
+        The time the message was sent.
+    content : int
+        The offset of the message's content in MessageLog.contents.
+    """
+
+    frm: int
+    to: int
+    day: int
+    time: datetime
+    content: int
+
+
+class MessageLog:
+    """Stores every PM sent during a game, in order.
+
+    Each PM is stored once, with indexes by player and by pair, so looking up a
+    player's history or the history between two players takes time proportional to
+    the number of messages found.
+
+    Attributes
+    ----------
+    records : List[PM]
+        Every PM, in the order they were sent.
+    contents : List[str]
+        The content of every PM, in the order they were sent.
+    by_player : Dict[int, List[int]]
+        The offsets in records of the PMs each member ID sent or received.
+    by_pair : Dict[Tuple[int, int], List[int]]
+        The offsets in records of the PMs between each pair of member IDs, keyed by
+        the lower ID first.
+    """
+
+    records: List[PM]
+    contents: List[str]
+    by_player: Dict[int, List[int]]
+    by_pair: Dict[Tuple[int, int], List[int]]
+
+    def __init__(self):
+        self.records = []
+        self.contents = []
+        self.by_player = {}
+        self.by_pair = {}
+
+    def append(self, frm: int, to: int, day: int, time: datetime, content: str) -> PM:
+        """Record a PM.
+
+        Parameters
+        ----------
+        frm : int
+            The author's member ID.
+        to : int
+            The recipient's member ID.
+        day : int
+            The day the message was sent.
+        time : datetime
+            The time the message was sent.
+        content : str
+            The message's content.
+
+        Returns
+        -------
+        PM
+            The new record.
+        """
+        record = PM(frm, to, day, time, len(self.contents))
+        self.contents.append(content)
+
+        offset = len(self.records)
+        self.records.append(record)
+        self.by_player.setdefault(frm, []).append(offset)
+        if to != frm:
+            self.by_player.setdefault(to, []).append(offset)
+        self.by_pair.setdefault(_pair(frm, to), []).append(offset)
+        return record
+
+    def content(self, record: PM) -> str:
+        """Determine the content of a PM."""
+        return self.contents[record.content]
+
+    def history(self, idn: int) -> Iterator[PM]:
+        """Yield the PMs the member with ID idn sent or received, in order."""
+        for offset in self.by_player.get(idn, []):
+            yield self.records[offset]
+
+    def between(self, idn1: int, idn2: int) -> Iterator[PM]:
+        """Yield the PMs between two members, in order."""
+        for offset in self.by_pair.get(_pair(idn1, idn2), []):
+            yield self.records[offset]
+
+    def last_received(self, idn: int) -> Optional[PM]:
+        """Find the most recent PM the member with ID idn received, or None."""
+        for offset in reversed(self.by_player.get(idn, [])):
+            if self.records[offset].frm != idn:
+                return self.records[offset]
+        return None
+
+
+def _pair(idn1: int, idn2: int) -> Tuple[int, int]:
+    """Determine the key of a pair of member IDs."""
+    return (idn1, idn2) if idn1 <= idn2 else (idn2, idn1)
@@ -0,0 +1,50 @@
+"""Contains the MessageTally class."""
+
+from typing import Dict, Tuple
+
+
+class MessageTally:
+    """Stores running counts of PMs between pairs of players.
+
+    Counts since the last checkpoint are found by subtracting the counts at the
+    checkpoint, which are only recorded for pairs that have messaged since. Both
+    recording a message and taking a checkpoint are constant-time, and tallying costs
+    time proportional to the number of pairs active since the checkpoint.
+
+    Attributes
+    ----------
+    totals : Dict[Tuple[int, int], int]
+        The number of PMs between each pair of member IDs over the whole game. Each
+        pair is keyed in the direction of its first message.
+    checkpoint_totals : Dict[Tuple[int, int], int]
+        The totals at the last checkpoint, for the pairs active since then.
+    """
+
+    totals: Dict[Tuple[int, int], int]
+    checkpoint_totals: Dict[Tuple[int, int], int]
+
+    def __init__(self):
+        self.totals = {}
+        self.checkpoint_totals = {}
+
+    def record(self, frm: int, to: int):
+        """Count a PM from the member with ID frm to the member with ID to."""
+        key = (frm, to)
+        if key not in self.totals and (to, frm) in self.totals:
+            key = (to, frm)
+
+        total = self.totals.get(key, 0)
+        if key not in self.checkpoint_totals:
+            self.checkpoint_totals[key] = total
+        self.totals[key] = total + 1
+
+    def checkpoint(self):
+        """Start counting afresh, for instance at the end of a vote."""
+        self.checkpoint_totals = {}
+
+    def since_checkpoint(self) -> Dict[Tuple[int, int], int]:
+        """Count the PMs between each pair since the last checkpoint."""
+        return {
+            key: self.totals[key] - total
+            for key, total in self.checkpoint_totals.items()
+        }
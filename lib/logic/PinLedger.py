@@ -0,0 +1,114 @@
+"""Contains the PinLedger class."""
+
+import asyncio
+from typing import Dict, Iterable, Set, Tuple
+
+from discord import Message, NotFound
+
+from lib.dispatcher import Priority
+from lib.typings.context import Context
+
+# How many unpin requests may be in flight at once.
+_UNPIN_CONCURRENCY = 4
+
+
+class PinLedger:
+    """Stores which of the bot's messages in the gameplay channel are pinned.
+
+    Attributes
+    ----------
+    pinned : Dict[int, None]
+        The IDs of the pinned messages, in the order they were pinned.
+    pending : Set[int]
+        The IDs of the messages with a pin queued but not yet made.
+    """
+
+    pinned: Dict[int, None]
+    pending: Set[int]
+
+    def __init__(self):
+        self.pinned = {}
+        self.pending = set()
+
+    def is_pinned(self, idn: int) -> bool:
+        """Determine whether the message with the given ID is pinned."""
+        return idn in self.pinned
+
+    def pin(self, ctx: Context, message: Message):
+        """Queue a request to pin a message, recording it once the pin is made.
+
+        If the pin fails, for instance at the pin limit, the error is printed and the
+        message is left out of the ledger.
+        """
+        self.pending.add(message.id)
+
+        def record(future: asyncio.Future):
+            """Record the pin if it was made."""
+            self.pending.discard(message.id)
+            if not future.cancelled() and future.exception() is None:
+                self.pinned[message.id] = None
+
+        ctx.bot.dispatcher.post(
+            _route(message.channel.id, message.id),
+            Priority.COSMETIC,
+            message.pin,
+            paced=False,
+        ).add_done_callback(record)
+
+    async def unpin(self, ctx: Context, ids: Iterable[int]):
+        """Unpin every pinned message among ids.
+
+        Messages neither pinned nor waiting to be pinned are skipped without any
+        requests. The rest are unpinned concurrently, at most _UNPIN_CONCURRENCY at a
+        time, each behind its own pin if that is still waiting to be made; discord.py
+        holds requests to the same rate limit bucket until the bucket resets, so the
+        requests are paced rather than rejected.
+
+        Parameters
+        ----------
+        ctx : Context
+            The invocation context.
+        ids : Iterable[int]
+            The IDs of the messages to unpin.
+        """
+        channel_id = ctx.table.channel.id
+        semaphore = asyncio.Semaphore(_UNPIN_CONCURRENCY)
+
+        async def request(idn: int):
+            """Unpin a single message, tolerating messages which no longer exist."""
+            try:
+                await ctx.bot.http.unpin_message(channel_id, idn)
+            except NotFound:
+                pass
+            self.pinned.pop(idn, None)
+
+        async def unpin_one(idn: int):
+            """Queue the unpin of a single message once there is room for it."""
+            async with semaphore:
+                await ctx.bot.dispatcher.submit(
+                    _route(channel_id, idn),
+                    Priority.COSMETIC,
+                    lambda: request(idn),
+                    paced=False,
+                )
+
+        results = await asyncio.gather(
+            *(
+                unpin_one(idn)
+                for idn in dict.fromkeys(ids)
+                if idn in self.pinned or idn in self.pending
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def unpin_all(self, ctx: Context):
+        """Unpin every pinned message."""
+        await self.unpin(ctx, list(self.pinned) + list(self.pending))
+
+
+def _route(channel_id: int, idn: int) -> Tuple[str, int, int]:
+    """Determine the dispatcher route ordering a message's pin and unpin."""
+    return "pin", channel_id, idn
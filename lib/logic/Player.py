@@ -1,11 +1,13 @@
 """Contains the Player class."""
 
+import asyncio
 import traceback
 import typing
 from typing import Optional
 
 from discord import Member
 
+from lib.dispatcher import Priority
 from lib.logic.Effect import Effect, Dead
 from lib.preferences import load_preferences
 from lib.typings.context import Context
@@ -13,21 +15,7 @@ from lib.utils import safe_send, get_input, safe_bug_report
 
 if typing.TYPE_CHECKING:
     from lib.logic.Character import Character
-    from lib.logic.Game import Game
-
-
-def _get_neighbor(
-    ctx: Context,
-    condition: typing.Callable[["Player", Context], bool],
-    order: typing.List["Player"],
-) -> typing.Optional["Player"]:
-    """Determine the first player in order matching condition."""
-    out = None
-    for player in order:
-        if condition(player, ctx):
-            out = player
-            break
-    return out
+    from lib.table import Table
 
 
 class Player:
@@ -40,7 +28,8 @@ class Player:
     character : Type[Character]
         The player's character.
     position : Optional[int]
-        The player's position in the seating order.
+        The player's position in the seating order. Kept up to date by the game's
+        SeatingOrder.
 
     Attributes
     ----------
@@ -48,13 +37,6 @@ class Player:
         The effects currently on the player.
     dead_votes : int
         How many dead vote tokens the player has.
-    message_history : list[Dict[str, Any]]
-        The player's PM history.
-        "to": the message's author
-        "from": the message's recipient
-        "content": the message's content
-        "day": the day the message was sent
-        "time": the time the message was sent
     has_spoken : bool
         Whether the player has spoken today.
     nominations_today : int
@@ -72,7 +54,6 @@ class Player:
     # TODO: store all the day-related attributes more compactly
 
     character: "Character"
-    message_history: typing.List[typing.Dict[str, typing.Any]]
 
     def __init__(
         self,
@@ -85,7 +66,6 @@ class Player:
         self.position = position
         self.effects = [effect(self, self) for effect in self.character.default_effects]
         self.dead_votes = 1
-        self.message_history = []
         self.has_spoken = False
         self.nominations_today = 0
         self.has_been_nominated = False
@@ -111,19 +91,13 @@ class Player:
         typing.Tuple["Player", "Player"]
             The upwards neighbor and the downwards neighbor satisfying condition.
         """
-        seating_order_excluding_self = (
-            ctx.bot.game.seating_order[self.position + 1 :]
-            + ctx.bot.game.seating_order[: self.position]
-        )
-        out1 = _get_neighbor(ctx, condition, seating_order_excluding_self[::-1])
-        out2 = _get_neighbor(ctx, condition, seating_order_excluding_self)
-        return out1, out2
+        return ctx.table.game.seating_order.neighbors(ctx, self, condition)
 
     def source_effects(
         self, ctx: Context
     ) -> typing.Generator["Effect", typing.Any, typing.Any]:
         """Yield all effects for which the player is the source."""
-        for player in ctx.bot.game.seating_order:
+        for player in ctx.table.game.seating_order:
             for effect in player.effects:
                 if effect.source_player == self:
                     yield effect
@@ -254,11 +228,13 @@ class Player:
                 return status
         return None
 
-    def message_history_with(self, player: "Player") -> str:
+    def message_history_with(self, ctx: Context, player: "Player") -> str:
         """Generate the player's message history with a player.
 
         Parameters
         ----------
+        ctx : Context
+            The invocation context.
         player
             The player to generate the message history with.
 
@@ -267,21 +243,19 @@ class Player:
         str
             The message history.
         """
+        message_log = ctx.table.game.message_log
         message_text = "__Message History__"
         message_text += f" (with {player.nick})"
         message_text += ":"
-        previously_from: Optional[Player] = None
-        for message in self.message_history:
-
-            if player not in (message["from"], message["to"]):
-                # don't process messages not part of the relevant history
-                continue
+        previously_from: Optional[int] = None
+        for message in message_log.between(self.id, player.id):
 
-            if previously_from != message["from"]:
-                previously_from = message["from"]
-                message_text += f'\n{message["from"].nick}:'
+            if previously_from != message.frm:
+                previously_from = message.frm
+                author = self if message.frm == self.id else player
+                message_text += f"\n{author.nick}:"
 
-            message_text += f'\n> {message["content"]}'
+            message_text += f"\n> {message_log.content(message)}"
         return message_text
 
     # Gameplay Methods
@@ -290,13 +264,13 @@ class Player:
 
         Called by Game.startday.
         """
-        if self.member in ctx.bot.inactive_role.members:
+        if self.member in ctx.table.inactive_role.members:
             self.is_inactive = True
         else:
             self.is_inactive = False
         self.nominations_today = 0
         self.has_been_nominated = False
-        self.has_spoken = self.is_inactive
+        ctx.table.game.set_spoken(self, self.is_inactive)
         self.has_skipped = self.is_inactive
 
     async def revive(self, ctx: Context) -> str:
@@ -326,7 +300,10 @@ class Player:
     async def message(self, ctx: Context, frm: "Player"):
         """Handle inbound PMs to the player.
 
-        Reports the message in public and saves the message to both player's histories.
+        Sends the message to the recipient, then saves it and confirms to the author,
+        and then reports it in public and to the storytellers and observers. Copies are
+        sent concurrently, and failing to send a copy to a storyteller or observer
+        doesn't interrupt the others.
 
         Parameters
         ----------
@@ -339,59 +316,66 @@ class Player:
             ctx, f"Messaging {self.nick}. What would you like to send?"
         )
 
+        report = f"**[**{frm.nick} **>** {self.nick}**]** {content}"
+
         # messages to storytellers
         if self.character_type(ctx) == "storyteller":
-            for st in ctx.bot.game.storytellers:
-                message = await safe_send(
+            copies = [
+                (
                     st.member,
                     (
                         f"{st.member.mention}, message from {frm.nick} to "
                         f"storyteller {self.nick}: **{content}**"
                     ),
-                )  # STs get the bolded message for a message to any ST
-
-            for observer in ctx.bot.observer_role.members:
-                await safe_send(
-                    observer, f"**[**{frm.nick} **>** {self.nick}**]** {content}",
                 )
+                for st in ctx.table.game.storytellers
+            ]  # STs get the bolded message for a message to any ST
+            st_mirrors = []
 
         # other messages
         else:
-            message = await safe_send(
-                self.member, f"Message from {frm.nick}: **{content}**",
-            )
+            copies = [(self.member, f"Message from {frm.nick}: **{content}**")]
+            st_mirrors = [(st.member, report) for st in ctx.table.game.storytellers]
 
-            # inform sts and observers
-            for st in ctx.bot.game.storytellers:
-                await safe_send(
-                    st.member, f"**[**{frm.nick} **>** {self.nick}**]** {content}",
-                )
+        # observers
+        if ctx.bot.observer_digest_enabled:
+            ctx.table.observer_digest.add(ctx.table, report)
+            observer_mirrors = []
+        else:
+            observer_mirrors = [
+                (observer, report) for observer in ctx.table.observer_role.members
+            ]
 
-            for observer in ctx.bot.observer_role.members:
-                await safe_send(
-                    observer, f"**[**{frm.nick} **>** {self.nick}**]** {content}",
-                )
+        # send the recipient's copies
+        sent = await ctx.bot.dispatcher.send_many(copies, Priority.DIRECT)
+        messages = [x for x in sent if not isinstance(x, Exception)]
+        if not messages:
+            raise sent[0]
+
+        # update message histories
+        ctx.table.game.log_message(frm, self, content, messages[0].created_at)
+
+        # confirm as soon as the message has arrived
+        await frm.make_active(ctx.table)
+        await ctx.bot.dispatcher.send(frm.member, "Message sent!", Priority.DIRECT)
 
         # public report
         if ctx.bot.instant_message_reporting:
-            await safe_send(ctx.bot.channel, f"**{frm.nick}** > **{self.nick}**")
+            await ctx.bot.dispatcher.send(
+                ctx.table.channel, f"**{frm.nick}** > **{self.nick}**"
+            )
+
+        # inform sts and observers
+        results = await asyncio.gather(
+            ctx.bot.dispatcher.send_many(st_mirrors, Priority.DIRECT),
+            ctx.bot.dispatcher.send_many(observer_mirrors, Priority.OBSERVER),
+        )
+        for (target, _), result in zip(
+            st_mirrors + observer_mirrors, results[0] + results[1]
+        ):
+            if isinstance(result, Exception):
+                print(f"Failed to send a copy of a PM to {target}: {result}")
 
-        # update message histories
-        # noinspection PyUnboundLocalVariable
-        # think this is a false positive
-        message_dict = {
-            "from": frm,
-            "to": self,
-            "content": content,
-            "day": ctx.bot.game.day_number,
-            "time": message.created_at,
-        }
-        self.message_history.append(message_dict)
-        frm.message_history.append(message_dict)
-
-        # complete
-        await frm.make_active(ctx.bot.game)
-        await safe_send(frm.member, "Message sent!")
         return
 
     async def change_character(
@@ -405,6 +389,7 @@ class Player:
         self.character = new_character(self)
         for effect in self.character.default_effects:
             self.add_effect(ctx, effect, self)
+        ctx.table.game.night_plan = None
 
         await safe_send(
             ctx, f"Successfully changed {self.nick} to the {self.character.name}."
@@ -432,41 +417,45 @@ class Player:
         """Execute the player."""
         message_text = f"{self.nick} has been executed, "
         if self.ghost(ctx):
-            await safe_send(
-                ctx.bot.channel, message_text + "but is already dead.",
+            await ctx.bot.dispatcher.send(
+                ctx.table.channel, message_text + "but is already dead.",
             )
 
         elif self.is_status(ctx, "safe"):
-            await safe_send(
-                ctx.bot.channel, message_text + "but does not die.",
+            await ctx.bot.dispatcher.send(
+                ctx.table.channel, message_text + "but does not die.",
             )
 
         else:
-            await safe_send(ctx.bot.channel, message_text + "and dies.")
+            await ctx.bot.dispatcher.send(ctx.table.channel, message_text + "and dies.")
             self.add_effect(ctx, Dead, self)
 
         # Day.end has a "successfully ended the day" message so this is above that
         if safe_bug_report(ctx):
             await safe_send(ctx, f"Successfully executed {self.nick}.")
 
-        if ctx.bot.game.current_day:
+        if ctx.table.game.current_day:
             # TODO: currently doesn't support extra-nomination effects
-            await ctx.bot.game.current_day.end(ctx)
+            await ctx.table.game.current_day.end(ctx)
 
-    async def make_active(self, game: "Game"):
+    async def make_active(self, table: "Table"):
         """Set has_spoken to true and update storytellers."""
+        game = table.game
         if not self.has_spoken:
-            self.has_spoken = True
-
-            not_active = game.not_active
-
-            if len(not_active) == 0:
-                for st in game.storytellers:
-                    await safe_send(st.member, "Everyone has spoken!")
-
-            elif len(not_active) == 1:
-                for st in game.storytellers:
-                    await safe_send(st.member, f"Just {not_active[0].nick} to speak.")
+            game.set_spoken(self)
+
+            if len(game.not_spoken) == 0:
+                message_text = "Everyone has spoken!"
+            elif len(game.not_spoken) == 1:
+                last = game.get_player(next(iter(game.not_spoken)), False)
+                message_text = f"Just {last.nick} to speak."
+            else:
+                return
+
+            await table.bot.dispatcher.send_many(
+                ((st.member, message_text) for st in game.storytellers),
+                Priority.DIRECT,
+            )
 
     # Helpful properties
     @property
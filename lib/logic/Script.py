@@ -1,22 +1,30 @@
-"""Contains the Script class and script_list generator."""
+"""Contains the Script class, the script registry and script_list generator."""
 
-from os import listdir
-from typing import List, Generator, Type, Tuple
+import json
+import re
+from os import listdir, stat
+from os.path import isdir
+from time import monotonic
+from typing import Callable, Dict, Generator, Iterator, List, Optional, Tuple, Type
 
 from dill import dump, load
 
-from resources.basegame import characters
-
-try:
-    # noinspection PyUnresolvedReferences
-    from resources.playtest import playtestcharacters
-except ImportError:
-    pass
+from resources.basegame import night_order
 
 from lib.logic.Character import Character, Townsfolk, Outsider, Minion, Demon
+from lib.logic.CharacterRegistry import character_registry
 from lib.typings.context import Context
 from lib.utils import list_to_plural_string
 
+# The rendered info posts of each script, by name, with the contents they render.
+_info_cache = {}  # type: Dict[str, Tuple[Tuple[Tuple[str, ...], ...], List[str]]]
+
+# A code block around a script's JSON, with an optional language tag.
+_CODE_BLOCK = re.compile(r"```[A-Za-z]*\s*(.*?)\s*```", re.DOTALL)
+
+# The directories custom scripts are stored in, basegame first.
+_SCRIPT_DIRECTORIES = ("resources/basegame/scripts/", "resources/playtest/scripts/")
+
 
 class Script:
     """Stores information about a specific script.
@@ -79,13 +87,17 @@ class Script:
     @property
     def has_atheist(self) -> bool:
         """Whether the atheist is on the script."""
-        try:
-            return self.has_character(playtestcharacters.Atheist.Atheist)
-        except NameError:
-            return False
+        return any(
+            character.__name__ == "Atheist" and character.playtest
+            for character in self.character_list
+        )
 
     def save(self):
-        """Save the script."""
+        """Save the script, discarding its cached info posts.
+
+        The registry sweeps the script directories again on its next lookup.
+        """
+        _info_cache.pop(self.name, None)
         if self.playtest:
             with open(
                 "resources/playtest/scripts/" + self.name + ".pckl", "wb"
@@ -96,32 +108,55 @@ class Script:
                 "resources/basegame/scripts/" + self.name + ".pckl", "wb"
             ) as file:
                 dump(self, file)
+        script_registry.expire()
 
     def info(self, ctx: Context) -> Generator[str, None, None]:
-        """Return a generator with information about the script."""
+        """Return a generator with information about the script.
+
+        The posts are rendered once per version of the script and then reused.
+        """
+        key = self._info_key()
+        cached = _info_cache.get(self.name)
+        if cached is None or cached[0] != key:
+            with ctx.typing():
+                cached = (key, self._render_info())
+            _info_cache[self.name] = cached
+        yield from cached[1]
+
+    def _info_key(self) -> Tuple[Tuple[str, ...], ...]:
+        """Determine the contents of the script that its info depends on."""
+        return (
+            tuple(character.__name__ for character in self.character_list),
+            tuple(character.__name__ for character in self.first_night),
+            tuple(character.__name__ for character in self.other_nights),
+        )
+
+    def _render_info(self) -> List[str]:
+        """Generate the posts with information about the script."""
         # maybe we should do more specific message length handling here than in safe_send
+        posts = []
 
-        with ctx.typing():
-            message_text = f"**__{self.name}:__**"
-            message_text += self._character_type_info(Townsfolk)
-            yield message_text  # we want to separate townsfolk from other characters
+        message_text = f"**__{self.name}:__**"
+        message_text += self._character_type_info(Townsfolk)
+        posts.append(message_text)  # we want to separate townsfolk from other characters
 
-            message_text = ""
-            for cls in (Outsider, Minion, Demon):
-                message_text += self._character_type_info(cls)
-            yield message_text
+        message_text = ""
+        for cls in (Outsider, Minion, Demon):
+            message_text += self._character_type_info(cls)
+        posts.append(message_text)
 
-            message_text = "__First Night:__\nDusk\nMinion Info\nDemon Info"
-            for character in self.first_night:
-                message_text += "\n" + character.name
-            message_text += "\nDawn"
+        message_text = "__First Night:__\nDusk\nMinion Info\nDemon Info"
+        for character in self.first_night:
+            message_text += "\n" + character.name
+        message_text += "\nDawn"
 
-            message_text += "\n\n__Other Nights:__\nDusk"
-            for character in self.other_nights:
-                message_text += "\n" + character.name
-            message_text += "\nDawn"
+        message_text += "\n\n__Other Nights:__\nDusk"
+        for character in self.other_nights:
+            message_text += "\n" + character.name
+        message_text += "\nDawn"
 
-            yield message_text
+        posts.append(message_text)
+        return posts
 
     def editor_names(self, ctx: Context) -> Tuple[str, bool]:
         """Determine the names of the bot's editors."""
@@ -145,11 +180,74 @@ class Script:
         for character in self.character_list:
             if issubclass(character, cls):
                 out += "\n> **{char_name}** - {char_rules}".format(
-                    char_name=character.name, char_rules=character(None).rules_text,
+                    char_name=character.name, char_rules=character.rules_text,
                 )
         return out
 
 
+def parse_script_json(text: str) -> List[str]:
+    """Find the character IDs in a script from the official script tool.
+
+    Entries may be IDs or objects with an "id" key, and the "_meta" entry is skipped.
+    The JSON may be wrapped in a code block.
+
+    Parameters
+    ----------
+    text : str
+        The script's JSON.
+
+    Returns
+    -------
+    List[str]
+        The IDs of the script's characters, in order.
+
+    Raises
+    ------
+    ValueError
+        If the text is not a list of script entries.
+    """
+    text = text.strip()
+    match = _CODE_BLOCK.fullmatch(text)
+    if match:
+        text = match.group(1)
+
+    data = json.loads(text)
+    if not isinstance(data, list):
+        raise ValueError("script is not a list")
+
+    ids = []
+    for entry in data:
+        if isinstance(entry, dict):
+            entry = entry.get("id")
+        if not isinstance(entry, str):
+            raise ValueError("script entry has no id")
+        if entry != "_meta":
+            ids.append(entry)
+    return ids
+
+
+def night_orders(
+    character_list: List[Type[Character]],
+) -> Tuple[List[Type[Character]], List[Type[Character]]]:
+    """Determine a script's night orders from the basegame night order.
+
+    Parameters
+    ----------
+    character_list : List[Type[Character]]
+        The characters on the script.
+
+    Returns
+    -------
+    Tuple[List[Type[Character]], List[Type[Character]]]
+        The first night order and the order for other nights.
+    """
+    by_name = {character.__name__: character for character in character_list}
+    return (
+        [by_name[name] for name in night_order.first_night if name in by_name],
+        [by_name[name] for name in night_order.other_nights if name in by_name],
+    )
+
+
 def script_list(ctx: Context, playtest: bool = False) -> Generator[Script, None, None]:
     """Find all scripts.
 
@@ -165,198 +263,343 @@ def script_list(ctx: Context, playtest: bool = False) -> Generator[Script, None,
     Script
         Default scripts, or scripts stored in resources.
     """
-    # Add the three default scripts
-    # not sure this will work so it needs testing
-    yield Script(
-        "Trouble Brewing",
+    yield from script_registry.scripts(playtest)
+
+
+def _default_scripts() -> Generator[Script, None, None]:
+    """Generate the three default scripts."""
+    for name, (aliases, build) in _DEFAULT_SCRIPTS.items():
+        yield build(name, list(aliases))
+
+
+def _trouble_brewing(name: str, aliases: List[str]) -> Script:
+    """Build Trouble Brewing."""
+    load = character_registry.load
+
+    return Script(
+        name,
         [
-            characters.Investigator,
-            characters.Chef,
-            characters.Washerwoman,
-            characters.Librarian,
-            characters.Empath,
-            characters.FortuneTeller,
-            characters.Undertaker,
-            characters.Monk,
-            characters.Slayer,
-            characters.Soldier,
-            characters.Ravenkeeper,
-            characters.Virgin,
-            characters.Mayor,
-            characters.Butler,
-            characters.Saint,
-            characters.Recluse,
-            characters.Drunk,
-            characters.Poisoner,
-            characters.Spy,
-            characters.Baron,
-            characters.ScarletWoman,
-            characters.Imp,
+            load("Investigator"),
+            load("Chef"),
+            load("Washerwoman"),
+            load("Librarian"),
+            load("Empath"),
+            load("FortuneTeller"),
+            load("Undertaker"),
+            load("Monk"),
+            load("Slayer"),
+            load("Soldier"),
+            load("Ravenkeeper"),
+            load("Virgin"),
+            load("Mayor"),
+            load("Butler"),
+            load("Saint"),
+            load("Recluse"),
+            load("Drunk"),
+            load("Poisoner"),
+            load("Spy"),
+            load("Baron"),
+            load("ScarletWoman"),
+            load("Imp"),
         ],
         first_night=[
-            characters.Poisoner,
-            characters.Washerwoman,
-            characters.Librarian,
-            characters.Chef,
-            characters.Investigator,
-            characters.Empath,
-            characters.FortuneTeller,
-            characters.Butler,
-            characters.Spy,
+            load("Poisoner"),
+            load("Washerwoman"),
+            load("Librarian"),
+            load("Chef"),
+            load("Investigator"),
+            load("Empath"),
+            load("FortuneTeller"),
+            load("Butler"),
+            load("Spy"),
         ],
         other_nights=[
-            characters.Poisoner,
-            characters.Monk,
-            characters.ScarletWoman,
-            characters.Imp,
-            characters.Ravenkeeper,
-            characters.Empath,
-            characters.FortuneTeller,
-            characters.Butler,
-            characters.Undertaker,
-            characters.Spy,
+            load("Poisoner"),
+            load("Monk"),
+            load("ScarletWoman"),
+            load("Imp"),
+            load("Ravenkeeper"),
+            load("Empath"),
+            load("FortuneTeller"),
+            load("Butler"),
+            load("Undertaker"),
+            load("Spy"),
         ],
-        aliases=["TB"],
+        aliases=aliases,
         editors=[],
     )
-    yield Script(
-        "Bad Moon Rising",
+
+
+def _bad_moon_rising(name: str, aliases: List[str]) -> Script:
+    """Build Bad Moon Rising."""
+    load = character_registry.load
+
+    return Script(
+        name,
         [
-            characters.Grandmother,
-            characters.Sailor,
-            characters.Chambermaid,
-            characters.Innkeeper,
-            characters.Gambler,
-            characters.Exorcist,
-            characters.Gossip,
-            characters.Courtier,
-            characters.Professor,
-            characters.Fool,
-            characters.Pacifist,
-            characters.TeaLady,
-            characters.Minstrel,
-            characters.Tinker,
-            characters.Moonchild,
-            characters.Goon,
-            characters.Lunatic,
-            characters.Godfather,
-            characters.DevilSAdvocate,
-            characters.Assassin,
-            characters.Mastermind,
-            characters.Pukka,
-            characters.Shabaloth,
-            characters.Po,
-            characters.Zombuul,
+            load("Grandmother"),
+            load("Sailor"),
+            load("Chambermaid"),
+            load("Innkeeper"),
+            load("Gambler"),
+            load("Exorcist"),
+            load("Gossip"),
+            load("Courtier"),
+            load("Professor"),
+            load("Fool"),
+            load("Pacifist"),
+            load("TeaLady"),
+            load("Minstrel"),
+            load("Tinker"),
+            load("Moonchild"),
+            load("Goon"),
+            load("Lunatic"),
+            load("Godfather"),
+            load("DevilSAdvocate"),
+            load("Assassin"),
+            load("Mastermind"),
+            load("Pukka"),
+            load("Shabaloth"),
+            load("Po"),
+            load("Zombuul"),
         ],
         first_night=[
-            characters.Lunatic,
-            characters.Sailor,
-            characters.Courtier,
-            characters.Godfather,
-            characters.DevilSAdvocate,
-            characters.Pukka,
-            characters.Grandmother,
-            characters.Chambermaid,
-            characters.Goon,
+            load("Lunatic"),
+            load("Sailor"),
+            load("Courtier"),
+            load("Godfather"),
+            load("DevilSAdvocate"),
+            load("Pukka"),
+            load("Grandmother"),
+            load("Chambermaid"),
+            load("Goon"),
         ],
         other_nights=[
-            characters.Sailor,
-            characters.Innkeeper,
-            characters.Courtier,
-            characters.DevilSAdvocate,
-            characters.Gambler,
-            characters.Exorcist,
-            characters.Lunatic,
-            characters.Zombuul,
-            characters.Pukka,
-            characters.Shabaloth,
-            characters.Po,
-            characters.Assassin,
-            characters.Gossip,
-            characters.Tinker,
-            characters.Moonchild,
-            characters.Godfather,
-            characters.Professor,
-            characters.Chambermaid,
-            characters.Goon,
+            load("Sailor"),
+            load("Innkeeper"),
+            load("Courtier"),
+            load("DevilSAdvocate"),
+            load("Gambler"),
+            load("Exorcist"),
+            load("Lunatic"),
+            load("Zombuul"),
+            load("Pukka"),
+            load("Shabaloth"),
+            load("Po"),
+            load("Assassin"),
+            load("Gossip"),
+            load("Tinker"),
+            load("Moonchild"),
+            load("Godfather"),
+            load("Professor"),
+            load("Chambermaid"),
+            load("Goon"),
         ],
-        aliases=["BMR"],
+        aliases=aliases,
         editors=[],
     )
-    yield Script(
-        "Sects & Violets",
+
+
+def _sects_and_violets(name: str, aliases: List[str]) -> Script:
+    """Build Sects & Violets."""
+    load = character_registry.load
+
+    return Script(
+        name,
         [
-            characters.Clockmaker,
-            characters.Dreamer,
-            characters.SnakeCharmer,
-            characters.Mathematician,
-            characters.Flowergirl,
-            characters.TownCrier,
-            characters.Oracle,
-            characters.Savant,
-            characters.Artist,
-            characters.Seamstress,
-            characters.Philosopher,
-            characters.Juggler,
-            characters.Sage,
-            characters.Sweetheart,
-            characters.Mutant,
-            characters.Barber,
-            characters.Klutz,
-            characters.EvilTwin,
-            characters.Witch,
-            characters.Cerenovus,
-            characters.PitHag,
-            characters.NoDashii,
-            characters.Vigormortis,
-            characters.FangGu,
-            characters.Vortox,
+            load("Clockmaker"),
+            load("Dreamer"),
+            load("SnakeCharmer"),
+            load("Mathematician"),
+            load("Flowergirl"),
+            load("TownCrier"),
+            load("Oracle"),
+            load("Savant"),
+            load("Artist"),
+            load("Seamstress"),
+            load("Philosopher"),
+            load("Juggler"),
+            load("Sage"),
+            load("Sweetheart"),
+            load("Mutant"),
+            load("Barber"),
+            load("Klutz"),
+            load("EvilTwin"),
+            load("Witch"),
+            load("Cerenovus"),
+            load("PitHag"),
+            load("NoDashii"),
+            load("Vigormortis"),
+            load("FangGu"),
+            load("Vortox"),
         ],
         first_night=[
-            characters.Philosopher,
-            characters.SnakeCharmer,
-            characters.EvilTwin,
-            characters.Witch,
-            characters.Cerenovus,
-            characters.Clockmaker,
-            characters.Dreamer,
-            characters.Seamstress,
-            characters.Mathematician,
+            load("Philosopher"),
+            load("SnakeCharmer"),
+            load("EvilTwin"),
+            load("Witch"),
+            load("Cerenovus"),
+            load("Clockmaker"),
+            load("Dreamer"),
+            load("Seamstress"),
+            load("Mathematician"),
         ],
         other_nights=[
-            characters.Philosopher,
-            characters.SnakeCharmer,
-            characters.Witch,
-            characters.Cerenovus,
-            characters.PitHag,
-            characters.FangGu,
-            characters.NoDashii,
-            characters.Vortox,
-            characters.Vigormortis,
-            characters.Barber,
-            characters.Sage,
-            characters.Dreamer,
-            characters.Seamstress,
-            characters.Flowergirl,
-            characters.TownCrier,
-            characters.Oracle,
-            characters.Juggler,
-            characters.Mathematician,
+            load("Philosopher"),
+            load("SnakeCharmer"),
+            load("Witch"),
+            load("Cerenovus"),
+            load("PitHag"),
+            load("FangGu"),
+            load("NoDashii"),
+            load("Vortox"),
+            load("Vigormortis"),
+            load("Barber"),
+            load("Sage"),
+            load("Dreamer"),
+            load("Seamstress"),
+            load("Flowergirl"),
+            load("TownCrier"),
+            load("Oracle"),
+            load("Juggler"),
+            load("Mathematician"),
         ],
-        aliases=["Sects and Violets", "SV", "S&V", "SnV"],
+        aliases=aliases,
         editors=[],
     )
 
-    # get custom scripts from resources
-    for filename in listdir("resources/basegame/scripts/"):
-        if filename.endswith(".pckl"):
-            with open("resources/basegame/scripts/" + filename, "rb") as file:
-                script: Script = load(file)
+
+# The default scripts' aliases and builders, by name.
+_DEFAULT_SCRIPTS = {
+    "Trouble Brewing": (("TB",), _trouble_brewing),
+    "Bad Moon Rising": (("BMR",), _bad_moon_rising),
+    "Sects & Violets": (
+        ("Sects and Violets", "SV", "S&V", "SnV"),
+        _sects_and_violets,
+    ),
+}  # type: Dict[str, Tuple[Tuple[str, ...], Callable[[str, List[str]], Script]]]
+
+# How many seconds the registry trusts its view of the script directories.
+_SWEEP_INTERVAL = 10.0
+
+
+class ScriptRegistry:
+    """Stores every script, loading each script only when it's needed.
+
+    Each default script is built the first time it's looked up, so that only its
+    own characters are imported. Custom scripts are unpickled the first time they
+    are seen and again only if their file's modification time changes. The script
+    directories are swept for changes at most once per interval, and straight away
+    after a script is saved.
+
+    Parameters
+    ----------
+    interval : float
+        How many seconds to wait between sweeps of the script directories.
+
+    Attributes
+    ----------
+    defaults : Dict[str, Script]
+        The default scripts built so far, by name.
+    files : Dict[str, Tuple[float, Script]]
+        The modification time and script of each custom script file, by path.
+    index : Dict[str, str]
+        The source of every script, by lowercase name and alias: the name of a
+        default script, or the path of a custom script file. Where names collide,
+        the script found first wins.
+    interval
+    """
+
+    defaults: Dict[str, Script]
+    files: Dict[str, Tuple[float, Script]]
+    index: Dict[str, str]
+
+    def __init__(self, interval: float = _SWEEP_INTERVAL):
+        self.interval = interval
+        self.defaults = {}
+        self.files = {}
+        self.index = {}
+        self._swept = None  # type: Optional[float]
+
+    def expire(self):
+        """Sweep the script directories on the next lookup, however recent the last."""
+        self._swept = None
+
+    def refresh(self):
+        """Reload the custom scripts whose files were added, changed or deleted.
+
+        Does nothing if the directories were swept less than interval seconds ago.
+        """
+        now = monotonic()
+        if self._swept is not None and now - self._swept < self.interval:
+            return
+        self._swept = now
+
+        stale = not self.index
+        seen = set()
+        for directory in _SCRIPT_DIRECTORIES:
+            if not isdir(directory):
+                continue
+            for filename in listdir(directory):
+                if not filename.endswith(".pckl"):
+                    continue
+                path = directory + filename
+                seen.add(path)
+                mtime = stat(path).st_mtime
+                if path not in self.files or self.files[path][0] != mtime:
+                    with open(path, "rb") as file:
+                        self.files[path] = (mtime, load(file))
+                    stale = True
+
+        for path in set(self.files) - seen:
+            del self.files[path]
+            stale = True
+
+        if stale:
+            self.index = {}
+            for name, (aliases, _) in _DEFAULT_SCRIPTS.items():
+                for key in (name,) + aliases:
+                    self.index.setdefault(key.lower(), name)
+            for path in self._paths():
+                script = self.files[path][1]
+                for key in [script.name] + script.aliases:
+                    self.index.setdefault(key.lower(), path)
+
+    def scripts(self, playtest: bool = False) -> Iterator[Script]:
+        """Yield every script, in order, including playtest scripts if requested."""
+        self.refresh()
+        for source in list(_DEFAULT_SCRIPTS) + list(self._paths()):
+            script = self._load(source)
+            if playtest or not script.playtest:
                 yield script
 
-    if playtest:
-        for filename in listdir("resources/playtest/scripts/"):
-            if filename.endswith(".pckl"):
-                with open("resources/playtest/scripts/" + filename, "rb") as file:
-                    script: Script = load(file)
-                    yield script
+    def get(self, name: str, playtest: bool = False) -> Optional[Script]:
+        """Find the script with a name or alias, ignoring case, or None."""
+        self.refresh()
+        source = self.index.get(name.lower())
+        if source is None:
+            return None
+        script = self._load(source)
+        if playtest or not script.playtest:
+            return script
+        return None
+
+    def _load(self, source: str) -> Script:
+        """Find the script from a source, building it if it's a new default script."""
+        if source in self.files:
+            return self.files[source][1]
+        if source not in self.defaults:
+            aliases, build = _DEFAULT_SCRIPTS[source]
+            self.defaults[source] = build(source, list(aliases))
+        return self.defaults[source]
+
+    def _paths(self) -> Iterator[str]:
+        """Yield the path of every custom script file, in order."""
+        for directory in _SCRIPT_DIRECTORIES:
+            for path in sorted(self.files):
+                if path.startswith(directory):
+                    yield path
+
+
+# The scripts shared by every command.
+script_registry = ScriptRegistry()
@@ -0,0 +1,128 @@
+"""Contains the SeatingOrder class."""
+
+import typing
+from typing import Callable, Dict, Generator, Iterable, Iterator, List, Optional
+
+from lib.typings.context import Context
+
+if typing.TYPE_CHECKING:
+    from lib.logic.Player import Player
+
+
+class SeatingOrder:
+    """Stores the game's players as a ring, with constant-time position lookups.
+
+    Parameters
+    ----------
+    players : Iterable[Player]
+        The game's players, in order.
+
+    Notes
+    -----
+    The ring keeps a map from each player's member ID to their index, and keeps every
+    player's position attribute in sync with it, so it should be modified through its
+    own methods rather than by reassigning positions.
+    """
+
+    _players: List["Player"]
+    _positions: Dict[int, int]
+
+    def __init__(self, players: Iterable["Player"]):
+        self._players = list(players)
+        self._positions = {}
+        self._reindex()
+
+    def _reindex(self, start: int = 0):
+        """Update the position map and player positions from start onwards."""
+        for index in range(start, len(self._players)):
+            player = self._players[index]
+            self._positions[player.id] = index
+            player.position = index
+
+    def index(self, player: "Player") -> int:
+        """Determine the player's position in the seating order.
+
+        Raises
+        ------
+        ValueError
+            If the player is not seated.
+        """
+        try:
+            return self._positions[player.id]
+        except KeyError:
+            raise ValueError("player not found")
+
+    def get(self, idn: int) -> Optional["Player"]:
+        """Find the player whose member has the given ID, or None."""
+        try:
+            return self._players[self._positions[idn]]
+        except KeyError:
+            return None
+
+    def insert(self, index: int, player: "Player"):
+        """Seat a player at index, moving everyone after them along by one."""
+        self._players.insert(index, player)
+        self._reindex(index)
+
+    def remove(self, player: "Player"):
+        """Remove a player from the seating order."""
+        index = self.index(player)
+        del self._players[index]
+        del self._positions[player.id]
+        self._reindex(index)
+
+    def walk(
+        self, player: "Player", step: int = 1
+    ) -> Generator["Player", None, None]:
+        """Lazily yield everyone else in the ring, starting next to the player.
+
+        Parameters
+        ----------
+        player : Player
+            The player to start from. They are not yielded.
+        step : int
+            1 to walk downwards through the seating order, -1 to walk upwards.
+        """
+        start = self.index(player)
+        length = len(self._players)
+        for offset in range(1, length):
+            yield self._players[(start + step * offset) % length]
+
+    def neighbors(
+        self,
+        ctx: Context,
+        player: "Player",
+        condition: Callable[["Player", Context], bool] = lambda x, y: True,
+    ) -> typing.Tuple[Optional["Player"], Optional["Player"]]:
+        """Determine the player's nearest neighbors satisfying a given condition.
+
+        Returns
+        -------
+        Tuple[Optional[Player], Optional[Player]]
+            The upwards neighbor and the downwards neighbor satisfying condition.
+        """
+        return (
+            next((x for x in self.walk(player, -1) if condition(x, ctx)), None),
+            next((x for x in self.walk(player, 1) if condition(x, ctx)), None),
+        )
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __iter__(self) -> Iterator["Player"]:
+        return iter(self._players)
+
+    def __getitem__(self, item):
+        return self._players[item]
+
+    def __contains__(self, player) -> bool:
+        try:
+            return player.id in self._positions
+        except AttributeError:
+            return False
+
+    def __add__(self, other: Iterable["Player"]) -> List["Player"]:
+        return self._players + list(other)
+
+    def __radd__(self, other: Iterable["Player"]) -> List["Player"]:
+        return list(other) + self._players
@@ -1,7 +1,10 @@
 """Contains the Vote class."""
 
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, Dict, Sequence, Tuple, TYPE_CHECKING
 
+from discord import Member
+
+from lib.dispatcher import Priority
 from lib.preferences import load_preferences
 from lib.typings.context import Context
 from lib.utils import list_to_plural_string, safe_send, get_bool_input
@@ -9,6 +12,9 @@ from lib.utils import list_to_plural_string, safe_send, get_bool_input
 if TYPE_CHECKING:
     from lib.logic.Player import Player
 
+# The scheduler key for the current voter's emergency vote.
+EMERGENCY_VOTE_TIMER = "emergency vote"
+
 
 class Vote:
     """Stores information about a specific vote.
@@ -65,16 +71,11 @@ class Vote:
 
         # determine the order
         if self.storyteller:
-            self.order = ctx.bot.game.seating_order
+            self.order = list(ctx.table.game.seating_order)
         else:
-            self.order = (
-                ctx.bot.game.seating_order[
-                    ctx.bot.game.seating_order.index(self.nominee) + 1 :
-                ]
-                + ctx.bot.game.seating_order[
-                    : ctx.bot.game.seating_order.index(self.nominee) + 1
-                ]
-            )
+            self.order = list(ctx.table.game.seating_order.walk(self.nominee)) + [
+                self.nominee
+            ]
 
         # determine the majority
         if self.traveler:
@@ -90,15 +91,18 @@ class Vote:
                 )
                 / 2
             )
-            if ctx.bot.game.current_day.about_to_die:
+            if ctx.table.game.current_day.about_to_die:
                 self.majority = max(
-                    self.majority, float(ctx.bot.game.current_day.about_to_die[1] + 1)
+                    self.majority, float(ctx.table.game.current_day.about_to_die[1] + 1)
                 )
 
         # check if anyone can vote twice
+        order = []  # type: List[Player]
         for player in self.order:
             if player.is_status(ctx, "can_vote_twice"):
-                self.order.insert(self.order.index(player), player)
+                order.append(player)
+            order.append(player)
+        self.order = order
 
     @property
     def to_vote(self):
@@ -121,7 +125,19 @@ class Vote:
             # Generally caught on the command level, so no handling here
             return
 
-        # Increment the posiiton.
+        ctx.table.scheduler.cancel(EMERGENCY_VOTE_TIMER)
+        await self._announce(ctx, [self._record_vote(ctx, voter, vt)])
+        await self.call_next(ctx)
+
+    def _record_vote(self, ctx: Context, voter: "Player", vt: int) -> str:
+        """Count the current voter's vote and move to the next voter.
+
+        Returns
+        -------
+        str
+            The line announcing the vote and the running total.
+        """
+        # Increment the position.
         self.position += 1
 
         # the actual vote
@@ -141,44 +157,86 @@ class Vote:
             # tracking
             self.voted.append(voter)
 
-        # announcement
-        msg = await safe_send(
-            ctx.bot.channel,
-            "{voter} votes {vote}. {votes} votes.".format(
-                voter=voter.nick, vote=["no", "yes"][vt], votes=self.votes
-            ),
+        return "{voter} votes {vote}. {votes} votes.".format(
+            voter=voter.nick, vote=["no", "yes"][vt], votes=self.votes
         )
-        await msg.pin()
-        self.announcements.append(msg.id)
 
-        # call next
-        if self.position != len(self.order):
-            await self.call_next(ctx)
-        else:
-            await self.end(ctx)
+    async def _announce(
+        self, ctx: Context, lines: List[str], dms: Sequence[Tuple[Member, str]] = ()
+    ):
+        """Announce and pin one or more votes in a single message.
+
+        Any DMs about the votes are sent afterwards, all at once.
+        """
+        if lines:
+            msg = await ctx.bot.dispatcher.send(ctx.table.channel, "\n".join(lines))
+            ctx.table.game.pins.pin(ctx, msg)
+            self.announcements.append(msg.id)
+        if dms:
+            await ctx.bot.dispatcher.send_many(dms, Priority.DIRECT)
 
     async def call_next(self, ctx: Context):
-        """Call the next voter."""
-        # check dead votes
-        if not self.to_vote.can_vote(ctx, self.traveler):
-            await self.vote(ctx, self.to_vote, 0)
-            return await safe_send(
-                self.to_vote.member, "You have no dead votes. Voting no."
-            )
+        """Call the next voter.
 
-        # check prevote
-        if self.to_vote in self.prevotes:
-            return await self.vote(ctx, self.to_vote, self.prevotes[self.to_vote])
+        Voters whose votes are already determined, by a prevote or by having no dead
+        vote, are resolved in this same pass, so this runs at most once per position.
+        If the bot batches vote announcements, each run of such votes is announced in
+        a single message. Ends the vote if everyone has voted.
+        """
+        pending = []  # type: List[str]
+        dms = []  # type: List[Tuple[Member, str]]
+        while self.position < len(self.order):
+            voter = self.to_vote
 
-        # announcement
-        await safe_send(
-            ctx.bot.channel,
-            f"{self.to_vote.member.mention}, your vote on {self.nominee.nick}.",
-        )
+            # check dead votes
+            if not voter.can_vote(ctx, self.traveler):
+                pending.append(self._record_vote(ctx, voter, 0))
+                dms.append((voter.member, "You have no dead votes. Voting no."))
 
-        # TODO: emergency vote processing
-        # subject to decision about what emergency processing looks like
-        return
+            # check prevote
+            elif voter in self.prevotes:
+                pending.append(self._record_vote(ctx, voter, self.prevotes[voter]))
+
+            # announcement
+            else:
+                await self._announce(ctx, pending, dms)
+                await ctx.bot.dispatcher.send(
+                    ctx.table.channel,
+                    f"{voter.member.mention}, your vote on {self.nominee.nick}.",
+                )
+                self._arm_emergency_vote(ctx, voter)
+                return
+
+            if not ctx.bot.batch_vote_announcements:
+                await self._announce(ctx, pending, dms)
+                pending = []
+                dms = []
+
+        await self._announce(ctx, pending, dms)
+        await self.end(ctx)
+
+    def _arm_emergency_vote(self, ctx: Context, voter: "Player"):
+        """Schedule the voter's emergency vote, if they have one."""
+        vt, minutes = load_preferences(voter).get_emergency_vote(ctx.bot.user.id)
+        if minutes is None:
+            return
+        position = self.position
+
+        async def emergency_vote():
+            """Submit the emergency vote if the voter still hasn't voted."""
+            day = ctx.table.game and ctx.table.game.current_day
+            if day and day.current_vote is self and self.position == position:
+                await ctx.bot.dispatcher.send(
+                    voter.member,
+                    "Submitting your emergency vote of {vote}.".format(
+                        vote=["no", "yes"][vt]
+                    ),
+                    Priority.DIRECT,
+                )
+                await self.vote(ctx, voter, int(vt))
+                await ctx.bot.after_command(ctx)
+
+        ctx.table.scheduler.arm(EMERGENCY_VOTE_TIMER, minutes * 60, emergency_vote)
 
     async def prevote(self, ctx, voter: "Player", vt: int):
         """Implement a prevote."""
@@ -203,11 +261,12 @@ class Vote:
     async def end(self, ctx: Context):
         """End the vote."""
         # TODO: refactor probably
-        if ctx.bot.game.current_day.current_vote == self:
+        if ctx.table.game.current_day.current_vote == self:
+            ctx.table.scheduler.cancel(EMERGENCY_VOTE_TIMER)
 
             # end the vote
-            ctx.bot.game.current_day.past_votes.append(self)
-            ctx.bot.game.current_day.current_vote = None
+            ctx.table.game.current_day.past_votes.append(self)
+            ctx.table.game.current_day.current_vote = None
 
             # announcement
             end_msg, result = await self._send_vote_end_message(ctx)
@@ -217,8 +276,8 @@ class Vote:
                 await self.nominee.character.exile(ctx)
 
             # open PMs and Nominations
-            await ctx.bot.game.current_day.open_pms(ctx)
-            await ctx.bot.game.current_day.open_noms(ctx)
+            await ctx.table.game.current_day.open_pms(ctx)
+            await ctx.table.game.current_day.open_noms(ctx)
 
             # cleanup for non-traveler nominations
             if not self.traveler:
@@ -228,37 +287,37 @@ class Vote:
 
                 # change about_to_die
                 if result:
-                    ctx.bot.game.current_day.about_to_die = (
+                    ctx.table.game.current_day.about_to_die = (
                         self.nominee,
                         self.votes,
                         end_msg.id,
                     )
 
             # cleanup pins
-            for msg in self.announcements:
-                msg = await ctx.bot.channel.fetch_message(msg)
-                if msg.pinned:
-                    await msg.unpin()
+            await ctx.table.game.pins.unpin(ctx, self.announcements)
 
     async def _update_old_vote_end_message(self, ctx: Context, result: bool):
         """Update the old vote end message as appropriate."""
-        if ctx.bot.game.current_day.about_to_die:
-            if result or self.votes == ctx.bot.game.current_day.about_to_die[1]:
-                msg = await ctx.bot.channel.fetch_message(
-                    ctx.bot.game.current_day.about_to_die[2]
+        if ctx.table.game.current_day.about_to_die:
+            if result or self.votes == ctx.table.game.current_day.about_to_die[1]:
+                msg = await ctx.table.channel.fetch_message(
+                    ctx.table.game.current_day.about_to_die[2]
+                )
+                ctx.bot.dispatcher.edit(
+                    msg, content=msg.content[:-22] + " not" + msg.content[-22:]
                 )
-                await msg.edit(content=msg.content[:-22] + " not" + msg.content[-22:])
 
                 # remove about_to_die
                 if not result:
-                    ctx.bot.game.current_day.about_to_die = None
+                    ctx.table.game.current_day.about_to_die = None
 
     async def _send_vote_end_message(self, ctx: Context):
         """Send a message ending the vote."""
         message_text, result = await self._generate_vote_end_message()
-        end_msg = await safe_send(ctx.bot.channel, message_text)
-        await end_msg.pin()
-        ctx.bot.game.current_day.vote_end_messages.append(end_msg.id)
+        end_msg = await ctx.bot.dispatcher.send(ctx.table.channel, message_text)
+        ctx.table.game.pins.pin(ctx, end_msg)
+        ctx.table.game.current_day.vote_end_messages.append(end_msg.id)
+        ctx.table.game.message_tally.checkpoint()
         return end_msg, result
 
     async def _generate_vote_end_message(self):
@@ -284,17 +343,18 @@ class Vote:
 
     async def cancel(self, ctx: Context):
         """Cancel the vote."""
-        if ctx.bot.game.current_day.current_vote == self:
+        if ctx.table.game.current_day.current_vote == self:
+            ctx.table.scheduler.cancel(EMERGENCY_VOTE_TIMER)
 
             # Delete the vote
-            ctx.bot.game.current_day.current_vote = None
+            ctx.table.game.current_day.current_vote = None
 
             # Announcement
-            await safe_send(ctx.bot.channel, "Nomination cancelled.")
+            await ctx.bot.dispatcher.send(ctx.table.channel, "Nomination cancelled.")
 
             # Open PMs and Nominations
-            await ctx.bot.game.current_day.open_pms(ctx)
-            await ctx.bot.game.current_day.open_noms(ctx)
+            await ctx.table.game.current_day.open_pms(ctx)
+            await ctx.table.game.current_day.open_noms(ctx)
 
             # Cleanup character data
             if not self.nominee.character_type(ctx) in ("storyteller", "traveler"):
@@ -302,9 +362,6 @@ class Vote:
             self.nominee.has_been_nominated = False
 
             # Cleanup pins
-            for idn in self.announcements:
-                msg = await ctx.bot.channel.fetch_message(idn)
-                if msg.pinned:
-                    await msg.unpin()
+            await ctx.table.game.pins.unpin(ctx, self.announcements)
 
         return
@@ -1,23 +1,29 @@
 """Contains several pseudo-converters for coercing strings to custom types."""
 
-from typing import Type, Optional, List, TYPE_CHECKING
+from functools import lru_cache
+from typing import Type, Optional, List, Tuple, TYPE_CHECKING
 
 from discord.ext import commands
 
-from resources.basegame import characters
-
-try:
-    from resources.playtest import characters as playtestcharacters
-except ImportError:
-    playtestcharacters = None
-
+from lib.logic.Character import Character
+from lib.logic.CharacterIndex import CharacterIndex
+from lib.logic.CharacterRegistry import character_registry
 from lib.typings.context import Context
-from lib.utils import str_cleanup
-from lib.logic.Script import script_list
+from lib.logic.Script import script_list, script_registry
 
 if TYPE_CHECKING:
     from lib.logic.Script import Script
-    from lib.logic.Character import Character
+
+
+# Built from the manifests, so no character is imported until it's found.
+_BASEGAME_INDEX = CharacterIndex(character_registry.characters())
+_PLAYTEST_INDEX = CharacterIndex(character_registry.characters(playtest=True))
+
+
+@lru_cache(maxsize=32)
+def _script_index(character_list: Tuple[Type[Character], ...]) -> CharacterIndex:
+    """Index the characters on a script, reusing the index for repeated lookups."""
+    return CharacterIndex(character_list)
 
 
 def to_character(
@@ -25,7 +31,8 @@ def to_character(
 ) -> Type["Character"]:
     """Convert a string to a Character class with a matching name.
 
-    The string must be an exact match, except capitalization and special characters.
+    Capitalization and special characters are ignored, and a close misspelling is
+    accepted if it clearly matches one character better than any other.
 
     Parameters
     ----------
@@ -41,50 +48,64 @@ def to_character(
     Type["Character"]
         The matching character class.
     """
-    text = str_cleanup(argument)
-
     if script:
-        character: Type["Character"]
-        for character in script.character_list:
-            if text == character.__name__:
-                return character
+        index = _script_index(tuple(script.character_list))
+        character = index.find(argument)
+        if character is None:
+            raise commands.BadArgument(
+                f'Character "{argument}" not found on the script {script.name}.'
+                + _did_you_mean(index, argument)
+            )
+        return character
+
+    if ctx.bot.playtest_role in ctx.bot.server.get_member(ctx.message.author.id).roles:
+        index = _PLAYTEST_INDEX
+    else:
+        index = _BASEGAME_INDEX
+
+    info = index.find(argument)
+    if info is None:
         raise commands.BadArgument(
-            f'Character "{argument}" not found on the script {script.name}.'
+            f'Character "{argument}" not found.' + _did_you_mean(index, argument)
         )
+    if info.playtest and not ctx.bot.playtest:
+        raise commands.BadArgument("Playtest characters are not enabled on this bot.")
+    return character_registry.load(info.class_name)
+
 
-    try:
-        return getattr(characters, text)
-    except AttributeError:
-        if (
-            ctx.bot.playtest_role
-            in ctx.bot.server.get_member(ctx.message.author.id).roles
-        ):
-            try:
-                character = getattr(playtestcharacters, text)
-                if ctx.bot.playtest:
-                    raise commands.BadArgument(
-                        "Playtest characters are not enabled on this bot."
-                    )
-                return character
-            except AttributeError:
-                pass
-        raise commands.BadArgument(f'Character "{argument}" not found.')
+def _did_you_mean(index: CharacterIndex, argument: str) -> str:
+    """Suggest the characters closest to a name that wasn't found."""
+    names = [character.name for character in index.suggestions(argument)]
+    if not names:
+        return ""
+    return " Did you mean {names}?".format(names=" or ".join(names))
 
 
 def to_character_list(
     ctx: Context, arguments: List[str], script: Optional["Script"] = None
 ) -> List[Type["Character"]]:
-    """Convert a list of strings into characters with corresponding names."""
+    """Convert a list of strings into characters with corresponding names.
+
+    Every string is checked before any error is raised, so that all the unmatched
+    strings are reported together.
+    """
     out = []  # type: List[Type[Character]]
+    errors = []  # type: List[str]
     for character in arguments:
-        out.append(to_character(ctx, character, script))
+        try:
+            out.append(to_character(ctx, character, script))
+        except commands.BadArgument as e:
+            errors.append(str(e))
+    if errors:
+        raise commands.BadArgument("\n".join(errors))
     return out
 
 
 def to_script(ctx: Context, argument: str) -> "Script":
     """Convert a string to a Script with a matching name.
 
-    The match does not have to be exact. The string must be contained in script.name.
+    The match does not have to be exact. An exact name or alias is found directly;
+    otherwise the string must be contained in script.name.
 
     Parameters
     ----------
@@ -98,17 +119,19 @@ def to_script(ctx: Context, argument: str) -> "Script":
     Script
         The matching script.
     """
-    for script in script_list(
-        ctx,
-        playtest=ctx.bot.playtest_role
-        in ctx.bot.server.get_member(ctx.message.author.id).roles,
-    ):
-        if argument.lower() in script.name.lower() or argument.lower() in [
-            x.lower() for x in script.aliases
-        ]:
-            if script.playtest and not ctx.bot.playtest:
-                raise commands.BadArgument(
-                    "Playtest scripts are not enabled on this bot."
-                )
-            return script
-    raise commands.BadArgument(f'Script "{argument}" not found.')
+    playtest = (
+        ctx.bot.playtest_role in ctx.bot.server.get_member(ctx.message.author.id).roles
+    )
+
+    script = script_registry.get(argument, playtest)
+    if script is None:
+        for candidate in script_list(ctx, playtest=playtest):
+            if argument.lower() in candidate.name.lower():
+                script = candidate
+                break
+        else:
+            raise commands.BadArgument(f'Script "{argument}" not found.')
+
+    if script.playtest and not ctx.bot.playtest:
+        raise commands.BadArgument("Playtest scripts are not enabled on this bot.")
+    return script
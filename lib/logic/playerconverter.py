@@ -1,17 +1,27 @@
 """Contains converters replacements from strings to Players and Members."""
 
-from typing import List, Callable, TYPE_CHECKING
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Tuple, TYPE_CHECKING
 
 from discord import Member
 from discord.ext import commands
 
 from lib.preferences import load_preferences
 from lib.typings.context import Context
-from lib.utils import get_input, get_player
+from lib.utils import get_input, get_player, list_to_plural_string
 
 if TYPE_CHECKING:
     from lib.logic.Player import Player
 
+# How many candidates to list when asking which member was meant.
+_MAX_CANDIDATES = 5
+
+# The lowest similarity a misspelled name may have to the name it matches.
+_FUZZY_CUTOFF = 0.75
+
+# How much more similar the best match must be than the next to be chosen outright.
+_FUZZY_MARGIN = 0.1
+
 
 async def to_member(
     ctx: Context,
@@ -22,8 +32,10 @@ async def to_member(
 ) -> Member:
     """Convert a string to a member with a matching name.
 
-    The match does not have to be exact.
-    The string must be contained in member.nick, member.display_name, or member.name.
+    The match does not have to be exact. Members are ranked by how well member.nick,
+    member.display_name, or member.name matches the string: exact matches first, then
+    prefixes, then substrings, then close misspellings. A single best match is
+    returned without asking the user.
 
     Parameters
     ----------
@@ -36,37 +48,42 @@ async def to_member(
     includes_storytellers : bool
         If all_members, whether to include storytellers.
     only_one : bool
-        Whether to require exactly one initial match.
+        Whether to require exactly one best match.
 
     Returns
     -------
     Member
         The matching member.
     """
-    # Generate possible matches
+    members = _member_pool(ctx, all_members, includes_storytellers)
+    return await _choose_member(ctx, argument, members, only_one)
+
+
+def _member_pool(
+    ctx: Context, all_members: bool, includes_storytellers: bool
+) -> List[Member]:
+    """Determine the members a name may refer to."""
     if all_members:
-        possibilities = _generate_possibilities(argument, ctx.bot.server.members)
-    else:
+        return ctx.bot.server.members
+    if includes_storytellers:
+        return [
+            x.member for x in ctx.table.game.seating_order + ctx.table.game.storytellers
+        ]
+    return [x.member for x in ctx.table.game.seating_order]
 
-        if includes_storytellers:
-            possibilities = _generate_possibilities(
-                argument,
-                [
-                    x.member
-                    for x in ctx.bot.game.seating_order + ctx.bot.game.storytellers
-                ],
-            )
-        else:
-            possibilities = _generate_possibilities(
-                argument, [x.member for x in ctx.bot.game.seating_order]
-            )
+
+async def _choose_member(
+    ctx: Context, argument: str, members: List[Member], only_one: bool
+) -> Member:
+    """Find the member best matching argument, asking the user if it's unclear."""
+    possibilities, certain = best_matches(argument, members)
 
     # No matches
     if len(possibilities) == 0:
         raise commands.BadArgument(f'User containing "{argument}" not found.')
 
-    # One match
-    if len(possibilities) == 1:
+    # One best match
+    if certain:
         return possibilities[0]
 
     if only_one:
@@ -80,13 +97,8 @@ async def to_member(
         message_text = 'Who do you mean? or say "cancel"'
     else:
         message_text = f'Who do you mean by {argument}? or say "cancel"'
-    for person in possibilities:
-        message_text += "\n({i}). ".format(i=possibilities.index(person) + 1)
-        if (
-            ctx.bot.game and person in ctx.bot.game.storytellers
-        ) or person in ctx.bot.storyteller_role.members:
-            message_text += "**[ST]** "
-        message_text += f"{load_preferences(person).nick}"
+    possibilities = possibilities[:_MAX_CANDIDATES]
+    message_text += _list_candidates(ctx, possibilities)
 
     # Wait for response
     choice = await get_input(ctx, message_text)
@@ -95,9 +107,24 @@ async def to_member(
     try:
         return possibilities[int(choice) - 1]
 
-    # If the choice is a name
+    # If the choice is a name, look among the listed members first
     except ValueError:
-        return await to_member(ctx, choice)
+        if best_matches(choice, possibilities)[0]:
+            return await _choose_member(ctx, choice, possibilities, False)
+        return await _choose_member(ctx, choice, members, False)
+
+
+def _list_candidates(ctx: Context, possibilities: List[Member]) -> str:
+    """Generate a numbered list of members to choose from."""
+    message_text = ""
+    for i, person in enumerate(possibilities):
+        message_text += f"\n({i + 1}). "
+        if (
+            ctx.table.game and person in ctx.table.game.storytellers
+        ) or person in ctx.table.storyteller_role.members:
+            message_text += "**[ST]** "
+        message_text += f"{load_preferences(person).nick}"
+    return message_text
 
 
 async def to_member_list(
@@ -107,12 +134,78 @@ async def to_member_list(
     includes_storytellers: bool = False,
     only_one: bool = False,
 ) -> List[Member]:
-    """Convert a list of strings into members with corresponding names."""
-    out = []  # type: List[Member]
-    for member in arguments:
-        out.append(
-            await to_member(ctx, member, all_members, includes_storytellers, only_one)
+    """Convert a list of strings into members with corresponding names.
+
+    Every string is matched in one pass. Strings with no match are reported together,
+    and the user is asked about every ambiguous string in a single message.
+
+    Parameters
+    ----------
+    ctx : Context
+        The invocation context.
+    arguments : List[str]
+        The strings to match to members.
+    all_members : bool
+        Whether to include all server members or just game players.
+    includes_storytellers : bool
+        If all_members, whether to include storytellers.
+    only_one : bool
+        Whether to require exactly one best match for each string.
+
+    Returns
+    -------
+    List[Member]
+        The matching members, in order.
+    """
+    members = _member_pool(ctx, all_members, includes_storytellers)
+    matches = [best_matches(argument, members) for argument in arguments]
+
+    # No matches
+    missing = [arg for arg, (found, _) in zip(arguments, matches) if not found]
+    if missing:
+        raise commands.BadArgument(
+            "\n".join(
+                f'User containing "{argument}" not found.' for argument in missing
+            )
+        )
+
+    # Multiple matches
+    unclear = [
+        (i, possibilities[:_MAX_CANDIDATES])
+        for i, (possibilities, certain) in enumerate(matches)
+        if not certain
+    ]
+    if unclear and only_one:
+        raise commands.BadArgument(
+            "Multiple users match {names}. Please try again.".format(
+                names=list_to_plural_string([arguments[i] for i, _ in unclear], "")[0]
+            )
+        )
+
+    out = [possibilities[0] for possibilities, _ in matches]
+    if not unclear:
+        return out
+
+    # Request clarification for every unclear string at once
+    message_text = (
+        "Who do you mean? Reply with one number per line, in this order, "
+        'or say "cancel"'
+    )
+    for i, possibilities in unclear:
+        message_text += f"\n\n**{arguments[i]}:**"
+        message_text += _list_candidates(ctx, possibilities)
+
+    choices = (await get_input(ctx, message_text)).split()
+    if len(choices) != len(unclear):
+        raise commands.BadArgument(
+            f"Expected {len(unclear)} numbers but got {len(choices)}. Please try again."
         )
+    for (i, possibilities), choice in zip(unclear, choices):
+        if not choice.isdigit() or not 1 <= int(choice) <= len(possibilities):
+            raise commands.BadArgument(
+                f'"{choice}" is not one of the options for {arguments[i]}.'
+            )
+        out[i] = possibilities[int(choice) - 1]
     return out
 
 
@@ -155,7 +248,7 @@ async def to_player(
     """
     try:
         player = get_player(
-            ctx.bot.game,
+            ctx.table.game,
             (
                 await to_member(
                     ctx, argument, all_members, includes_storytellers, only_one
@@ -172,27 +265,60 @@ async def to_player(
         raise
 
 
-def _generate_possibilities(argument: str, possibilities: List[Member]) -> List[Member]:
-    """Determine all members with marching nicknames or usernames.
+def best_matches(argument: str, members: List[Member]) -> Tuple[List[Member], bool]:
+    """Find the members whose names best match argument.
+
+    Each member is matched against their nickname, display name and username. Only
+    the best kind of match found is returned: exact matches, else prefixes, else
+    substrings, else names at least _FUZZY_CUTOFF similar, ranked by similarity.
 
     Parameters
     ----------
     argument : str
         The string to be matched.
-    possibilities : List[Member]
+    members : List[Member]
         The possible members to search for matches.
 
     Returns
     -------
-    List[Member]
-        The matching members.
+    Tuple[List[Member], bool]
+        The best matching members, most likely first, and whether the first is
+        clearly the best.
     """
-    out = []
-    for person in possibilities:
-        if (
-            argument.lower() in load_preferences(person).nick.lower()
-            or argument.lower() in person.display_name.lower()
-            or argument.lower() in person.name.lower()
-        ):
-            out.append(person)
-    return out
+    key = argument.lower()
+    names = {}  # type: Dict[Member, Tuple[str, str, str]]
+    exact, prefix, substring = [], [], []
+    for person in members:
+        names[person] = (
+            load_preferences(person).nick.lower(),
+            person.display_name.lower(),
+            person.name.lower(),
+        )
+        if key in names[person]:
+            exact.append(person)
+        elif any(name.startswith(key) for name in names[person]):
+            prefix.append(person)
+        elif any(key in name for name in names[person]):
+            substring.append(person)
+
+    for tier in (exact, prefix, substring):
+        if tier:
+            return tier, len(tier) == 1
+
+    # fall back to the closest misspellings
+    matcher = SequenceMatcher()
+    matcher.set_seq2(key)
+    scores = {}  # type: Dict[Member, float]
+    for person in members:
+        for name in names[person]:
+            matcher.set_seq1(name)
+            if matcher.quick_ratio() >= _FUZZY_CUTOFF:
+                scores[person] = max(scores.get(person, 0), matcher.ratio())
+    fuzzy = sorted(
+        (person for person in scores if scores[person] >= _FUZZY_CUTOFF),
+        key=lambda person: -scores[person],
+    )
+    certain = len(fuzzy) == 1 or (
+        len(fuzzy) > 1 and scores[fuzzy[0]] - scores[fuzzy[1]] >= _FUZZY_MARGIN
+    )
+    return fuzzy, certain
@@ -1,7 +1,7 @@
 """Contains tools for managing game logic."""
-import itertools
 from functools import wraps
-from typing import List, Optional, Type, Callable, TYPE_CHECKING, Dict
+from math import comb
+from typing import List, Optional, Type, Callable, TYPE_CHECKING, Dict, Tuple
 
 import numpy as np
 from discord import Message
@@ -16,6 +16,7 @@ from lib.utils import safe_send, get_input, safe_bug_report
 if TYPE_CHECKING:
     from lib.logic.Player import Player
     from lib.logic.Effect import Effect
+    from lib.logic.MessageLog import PM
 
 # TODO: sort these into more sensible locations
 
@@ -37,7 +38,7 @@ def generate_game_info_message(order, ctx: Context) -> str:
 
     Notes
     -----
-    Generally, ctx.bot.game may be none during this call (in particular, during the
+    Generally, ctx.table.game may be none during this call (in particular, during the
     startgame procedure), so it should not be referenced here.
     """
     message_text = _generate_seating_order_message(ctx, order)
@@ -94,32 +95,44 @@ def _generate_distribution_message(order: List["Player"]):
     return message_text
 
 
-def generate_message_tally(ctx: Context, condition: Callable[[Dict], bool]):
-    """Generate a tally of messages."""
-    # TODO: clean this up lol
-    message_tally = {
-        X: 0 for X in itertools.combinations(ctx.bot.game.seating_order, 2)
-    }
-    for person in ctx.bot.game.seating_order:
-        for msg in person.message_history:
-            if msg["from"] == person:
-                if condition(msg):
-                    if (person, msg["to"]) in message_tally:
-                        message_tally[(person, msg["to"])] += 1
-                    elif (msg["to"], person) in message_tally:
-                        message_tally[(msg["to"], person)] += 1
-                    else:
-                        message_tally[(person, msg["to"])] = 1
-    sorted_tally = sorted(message_tally.items(), key=lambda x: -x[1])
+def generate_message_tally(ctx: Context, condition: Callable[["PM"], bool]) -> str:
+    """Generate a tally of the logged messages satisfying condition."""
+    message_tally = {}  # type: Dict[Tuple[int, int], int]
+    for msg in ctx.table.game.message_log.records:
+        if condition(msg):
+            key = (msg.frm, msg.to)
+            if key not in message_tally and key[::-1] in message_tally:
+                key = key[::-1]
+            message_tally[key] = message_tally.get(key, 0) + 1
+    return format_message_tally(ctx, message_tally)
+
+
+def format_message_tally(ctx: Context, message_tally: Dict[Tuple[int, int], int]):
+    """Format a tally of messages between pairs of member IDs."""
     message_text = "**Message Tally**:"
-    for pair in sorted_tally:
-        if pair[1] > 0:
-            message_text += "\n> {person1} - {person2}: {n}".format(
-                person1=pair[0][0].nick, person2=pair[0][1].nick, n=pair[1]
-            )
-        else:
-            message_text += "\n> All other pairs: 0"
-            break
+    for pair, n in sorted(message_tally.items(), key=lambda x: -x[1]):
+        if n > 0:
+            try:
+                message_text += "\n> {person1} - {person2}: {n}".format(
+                    person1=ctx.table.game.get_player(pair[0]).nick,
+                    person2=ctx.table.game.get_player(pair[1]).nick,
+                    n=n,
+                )
+            except ValueError:
+                # one of them has left the game
+                continue
+
+    # pairs with a storyteller or a departed player don't count towards the total
+    seated = {player.id for player in ctx.table.game.seating_order}
+    n_seated_pairs = len(
+        [
+            pair
+            for pair, n in message_tally.items()
+            if n > 0 and pair[0] in seated and pair[1] in seated
+        ]
+    )
+    if n_seated_pairs < comb(len(seated), 2):
+        message_text += "\n> All other pairs: 0"
     return message_text
 
 
@@ -0,0 +1,125 @@
+"""Contains classes for batching notifications to storytellers and observers."""
+
+import typing
+from typing import Dict, List, Tuple
+
+from lib.dispatcher import Priority
+from lib.utils import list_to_plural_string
+
+if typing.TYPE_CHECKING:
+    from lib.table import Table
+
+# The scheduler key for the next observer digest.
+_DIGEST_TIMER = "observer digest"
+
+
+class PhaseNotifier:
+    """Collects changes to whether PMs and nominations are open.
+
+    Storytellers are sent one DM summarising every change made since the last flush,
+    rather than one DM per change. A phase which ends up as it started, for instance
+    closing and reopening within one command, isn't mentioned.
+
+    Attributes
+    ----------
+    changes : Dict[str, Tuple[bool, bool]]
+        The phases which have changed, with whether each was open before its first
+        change since the last flush and whether it is open now.
+    """
+
+    changes: Dict[str, Tuple[bool, bool]]
+
+    def __init__(self):
+        self.changes = {}
+
+    def record(self, phase: str, was_open: bool, is_open: bool):
+        """Record that a phase, such as "PMs" or "nominations", opened or closed.
+
+        Parameters
+        ----------
+        phase : str
+            The phase's name.
+        was_open : bool
+            Whether the phase was open before the change.
+        is_open : bool
+            Whether the phase is open after the change.
+        """
+        start = self.changes.get(phase, (was_open, is_open))[0]
+        self.changes[phase] = (start, is_open)
+
+    async def flush(self, table: "Table"):
+        """Send the table's storytellers a summary of the recorded changes."""
+        changes = {
+            phase: is_open
+            for phase, (was_open, is_open) in self.changes.items()
+            if is_open != was_open
+        }
+        self.changes = {}
+
+        if not changes or not table.game:
+            return
+
+        message_text = _describe_changes(changes)
+        await table.bot.dispatcher.send_many(
+            ((st.member, message_text) for st in table.game.storytellers),
+            Priority.DIRECT,
+        )
+
+
+class ObserverDigest:
+    """Buffers PM reports for observers, to be delivered as one DM.
+
+    The buffer is flushed a set interval after the first report in it, and whenever
+    flush is called, for instance at the start of a vote or the end of the day.
+
+    Attributes
+    ----------
+    lines : List[str]
+        The reports waiting to be sent.
+    """
+
+    lines: List[str]
+
+    def __init__(self):
+        self.lines = []
+
+    def add(self, table: "Table", line: str):
+        """Buffer a report, scheduling a flush if the bot has a digest interval."""
+        self.lines.append(line)
+        interval = table.bot.observer_digest_interval
+        if interval and not table.scheduler.is_armed(_DIGEST_TIMER):
+            table.scheduler.arm(_DIGEST_TIMER, interval, lambda: self.flush(table))
+
+    async def flush(self, table: "Table"):
+        """Send every buffered report to every observer of the table in one message."""
+        table.scheduler.cancel(_DIGEST_TIMER)
+        if not self.lines:
+            return
+        lines, self.lines = self.lines, []
+
+        observers = table.observer_role.members
+        message_text = "\n".join(lines)
+        for observer, result in zip(
+            observers,
+            await table.bot.dispatcher.send_many(
+                ((observer, message_text) for observer in observers),
+                Priority.OBSERVER,
+            ),
+        ):
+            if isinstance(result, Exception):
+                print(f"Failed to send a PM digest to {observer}: {result}")
+
+
+def _describe_changes(changes: Dict[str, bool]) -> str:
+    """Generate a summary of changes, such as 'PMs and nominations are now closed.'"""
+    sentences = []
+    for is_open in (True, False):
+        phases = [phase for phase, state in changes.items() if state == is_open]
+        if phases:
+            text = list_to_plural_string(phases, "")[0]
+            sentences.append(
+                "{text} are now {state}.".format(
+                    text=text[0].upper() + text[1:], state=["closed", "open"][is_open]
+                )
+            )
+    return " ".join(sentences)
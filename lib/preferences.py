@@ -1,5 +1,6 @@
-"""Contains the preferences class and load_preferences funciton."""
+"""Contains the Preferences and PreferenceStore classes and load_preferences."""
 
+from os import stat
 from typing import Dict, Tuple, Optional, Union, TYPE_CHECKING
 
 from dill import load, dump
@@ -55,8 +56,7 @@ class Preferences:
 
     def save_preferences(self):
         """Save preferences."""
-        with open("resources/preferences/" + str(self.id) + ".pckl", "wb") as file:
-            dump(self, file)
+        preference_store.save(self)
 
     def get_emergency_vote(self, bot_id: int) -> Tuple[int, Optional[int]]:
         """Generate the (potentially bot-specific) emergency vote.
@@ -90,8 +90,56 @@ def load_preferences(member: Union["Player", Member]) -> Preferences:
     Preferences
         The member's preferences.
     """
-    try:
-        with open("resources/preferences/" + str(member.id) + ".pckl", "rb") as file:
-            return load(file)
-    except FileNotFoundError:
-        return Preferences(member)
+    return preference_store.load(member)
+
+
+class PreferenceStore:
+    """Caches members' saved preferences, shared by every bot in the process.
+
+    A member's file is unpickled the first time their preferences are loaded, and
+    again only if the file's modification time changes, for instance because a bot in
+    another process saved it.
+
+    Attributes
+    ----------
+    cache : Dict[int, Tuple[float, Preferences]]
+        The modification time of each loaded file and the preferences in it, by
+        member ID.
+    """
+
+    cache: Dict[int, Tuple[float, Preferences]]
+
+    def __init__(self):
+        self.cache = {}
+
+    def load(self, member: Union["Player", Member]) -> Preferences:
+        """Load a member's preferences, from the cache if their file is unchanged."""
+        path = _preferences_path(member.id)
+        try:
+            mtime = stat(path).st_mtime
+        except FileNotFoundError:
+            self.cache.pop(member.id, None)
+            return Preferences(member)
+
+        cached = self.cache.get(member.id)
+        if cached is None or cached[0] != mtime:
+            with open(path, "rb") as file:
+                cached = (mtime, load(file))
+            self.cache[member.id] = cached
+        return cached[1]
+
+    def save(self, preferences: Preferences):
+        """Save a member's preferences and cache them."""
+        path = _preferences_path(preferences.id)
+        with open(path, "wb") as file:
+            dump(preferences, file)
+        self.cache[preferences.id] = (stat(path).st_mtime, preferences)
+
+
+def _preferences_path(idn: int) -> str:
+    """Determine the path of the file storing a member's preferences."""
+    return "resources/preferences/" + str(idn) + ".pckl"
+
+
+# The preferences shared by every bot in the process.
+preference_store = PreferenceStore()
@@ -0,0 +1,75 @@
+"""Contains the PresenceManager class."""
+
+import typing
+from typing import Optional, Tuple
+
+import discord
+
+if typing.TYPE_CHECKING:
+    from lib.bot import BOTCBot
+
+# The scheduler key for the pending presence update.
+_PRESENCE_TIMER = "presence"
+
+
+class PresenceManager:
+    """Sends presence updates, skipping repeats and merging bursts.
+
+    Presence updates go over the gateway and are heavily rate limited, so an update
+    is held for a short window, during which later updates replace it, and is only
+    sent if it differs from the last presence sent.
+
+    Parameters
+    ----------
+    bot : BOTCBot
+        The bot whose presence to manage.
+    delay : float
+        How many seconds to wait for further updates before sending.
+
+    Attributes
+    ----------
+    sent : Optional[Tuple[discord.Status, str]]
+        The last status and activity name sent, or None.
+    pending : Optional[Tuple[discord.Status, str]]
+        The status and activity name waiting to be sent, or None.
+    bot
+    delay
+    """
+
+    sent: Optional[Tuple[discord.Status, str]]
+    pending: Optional[Tuple[discord.Status, str]]
+
+    def __init__(self, bot: "BOTCBot", delay: float = 2.0):
+        self.bot = bot
+        self.delay = delay
+        self.sent = None
+        self.pending = None
+
+    def update(self, status: discord.Status, name: str):
+        """Queue a presence update.
+
+        Parameters
+        ----------
+        status : discord.Status
+            The bot's status.
+        name : str
+            The name of the bot's activity.
+        """
+        self.pending = (status, name)
+        if self.pending == self.sent:
+            return
+        if not self.bot.scheduler.is_armed(_PRESENCE_TIMER):
+            self.bot.scheduler.arm(_PRESENCE_TIMER, self.delay, self._send)
+
+    def reset(self):
+        """Forget the last presence sent, for instance after reconnecting."""
+        self.sent = None
+
+    async def _send(self):
+        """Send the pending presence, unless it is already the bot's presence."""
+        pending, self.pending = self.pending, None
+        if pending is not None and pending != self.sent:
+            await self.bot.change_presence(
+                status=pending[0], activity=discord.Game(name=pending[1])
+            )
+            self.sent = pending
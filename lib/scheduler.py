@@ -0,0 +1,73 @@
+"""Contains the Scheduler class."""
+
+import asyncio
+import traceback
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class Scheduler:
+    """Runs coroutines after a delay, with at most one pending timer per key.
+
+    Arming and cancelling a timer are both constant-time. A timer's coroutine is only
+    created when the timer fires, so cancelled timers leave no tasks behind.
+
+    Attributes
+    ----------
+    timers : Dict[Hashable, asyncio.TimerHandle]
+        The pending timers.
+    """
+
+    timers: Dict[Hashable, asyncio.TimerHandle]
+
+    def __init__(self):
+        self.timers = {}
+
+    def arm(
+        self, key: Hashable, delay: float, callback: Callable[[], Awaitable[Any]]
+    ):
+        """Run callback after delay seconds, replacing any pending timer for key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The timer's key.
+        delay : float
+            The number of seconds to wait.
+        callback : Callable[[], Awaitable[Any]]
+            The coroutine function to run.
+        """
+        self.cancel(key)
+        self.timers[key] = asyncio.get_event_loop().call_later(
+            delay, self._fire, key, callback
+        )
+
+    def cancel(self, key: Hashable):
+        """Cancel the pending timer for key, if any."""
+        handle = self.timers.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+    def cancel_all(self):
+        """Cancel every pending timer."""
+        for handle in self.timers.values():
+            handle.cancel()
+        self.timers.clear()
+
+    def is_armed(self, key: Hashable) -> bool:
+        """Determine whether a timer is pending for key."""
+        return key in self.timers
+
+    def _fire(self, key: Hashable, callback: Callable[[], Awaitable[Any]]):
+        """Start a timer's coroutine."""
+        # removed before the callback runs, so the callback can re-arm the same key
+        del self.timers[key]
+        asyncio.ensure_future(callback()).add_done_callback(_report_exception)
+
+
+def _report_exception(task: asyncio.Future):
+    """Print the exception raised by a timer's coroutine, if any."""
+    if not task.cancelled() and task.exception() is not None:
+        print("Exception in scheduled callback:")
+        traceback.print_exception(
+            type(task.exception()), task.exception(), task.exception().__traceback__
+        )
@@ -0,0 +1,181 @@
+"""Contains the Table class."""
+
+import typing
+from os import makedirs, remove
+from os.path import dirname, isfile
+from typing import Optional, Set
+
+import discord
+from dill import dump, load
+
+from lib.notifications import ObserverDigest, PhaseNotifier
+from lib.scheduler import Scheduler
+
+if typing.TYPE_CHECKING:
+    from lib.bot import BOTCBot
+    from lib.logic.Game import Game
+
+
+class Table:
+    """A channel the bot runs games in, with its own roles, game and backups.
+
+    Parameters
+    ----------
+    bot : BOTCBot
+        The bot running the table.
+    name : str
+        The table's name. The bot's main table is unnamed, and keeps its backups
+        directly in the bot's backup directory.
+    channelid : int
+        The ID of the table's gameplay channel.
+    storytellerid : int
+        The ID of the table's Storyteller role.
+    playerid : int
+        The ID of the table's player role.
+    inactiveid : int
+        The ID of the table's inactive role.
+    observerid : int
+        The ID of the table's observer role.
+
+    Attributes
+    ----------
+    game : Optional[Game]
+        The table's current game, if any.
+    scheduler : Scheduler
+        The timers for the table's game.
+    phase_notifier : PhaseNotifier
+        The phase changes waiting to be sent to the table's storytellers.
+    observer_digest : ObserverDigest
+        The PM reports waiting to be sent to the table's observers.
+    member_ids : Set[int]
+        The IDs of the members indexed by the bot as being in the table's game.
+    bot
+    name
+    """
+
+    game: Optional["Game"]
+    scheduler: Scheduler
+    phase_notifier: PhaseNotifier
+    observer_digest: ObserverDigest
+    member_ids: Set[int]
+
+    def __init__(
+        self,
+        bot: "BOTCBot",
+        name: str,
+        channelid: int,
+        storytellerid: int,
+        playerid: int,
+        inactiveid: int,
+        observerid: int,
+    ):
+        self.bot = bot
+        self.name = name
+        self._channelid = channelid
+        self._storytellerid = storytellerid
+        self._playerid = playerid
+        self._inactiveid = inactiveid
+        self._observerid = observerid
+        self.game = None
+        self.scheduler = Scheduler()
+        self.phase_notifier = PhaseNotifier()
+        self.observer_digest = ObserverDigest()
+        self.member_ids = set()
+
+    @property
+    def channel(self) -> discord.TextChannel:
+        """Determine the table's gameplay channel."""
+        return self.bot.get_channel(self._channelid)
+
+    @property
+    def channel_id(self) -> int:
+        """Determine the ID of the table's gameplay channel."""
+        return self._channelid
+
+    @property
+    def storyteller_role(self) -> discord.Role:
+        """Determine the table's Storyteller role."""
+        return self.bot.server.get_role(self._storytellerid)
+
+    @property
+    def player_role(self) -> discord.Role:
+        """Determine the table's player role."""
+        return self.bot.server.get_role(self._playerid)
+
+    @property
+    def inactive_role(self) -> discord.Role:
+        """Determine the table's inactive role."""
+        return self.bot.server.get_role(self._inactiveid)
+
+    @property
+    def observer_role(self) -> discord.Role:
+        """Determine the table's observer role."""
+        return self.bot.server.get_role(self._observerid)
+
+    @property
+    def role_ids(self) -> Set[int]:
+        """Determine the IDs of the table's Storyteller, player and observer roles."""
+        return {self._storytellerid, self._playerid, self._observerid}
+
+    def backup_path(self, file_name: str) -> str:
+        """Determine the path of one of the table's backup files."""
+        directory = "resources/backup/" + self.bot.bot_name + "/"
+        if self.name:
+            directory += self.name + "/"
+        return directory + file_name
+
+    def backup(self, file_name: str = "current_game.pckl"):
+        """Backs up the current gamestate."""
+        file_name = self.backup_path(file_name)
+
+        if self.game:
+            makedirs(dirname(file_name), exist_ok=True)
+            with open(file_name, "wb") as file:
+                dump(self.game, file)
+        else:
+            if isfile(file_name):
+                remove(file_name)
+
+    async def restore_backup(self, file_name: str = "current_game.pckl", mute=False):
+        """Restores a backup."""
+        file_name = self.backup_path(file_name)
+
+        # restore backups
+        try:
+
+            with open(file_name, "rb") as file:
+                self.game = load(file)
+
+            # catch game being none
+            # should never be possible if the file exists, but just in case
+            assert self.game
+
+            # do some unpickling
+            # noinspection PyTypeChecker
+            # the seating order message is pickled as an int so this is fine
+            self.game.seating_order_message = await self.channel.fetch_message(
+                self.game.seating_order_message
+            )
+            for player in self.game.seating_order + self.game.storytellers:
+                player.member = self.bot.server.get_member(player.member)
+            await self.game.upgrade(self)
+
+            # print
+            if not mute:
+                print("Backup restored!")
+            return True
+
+        except (FileNotFoundError, AssertionError):
+            self.game = None
+            if not mute:
+                print("No backup found.")
+            return None
+
+        except EOFError:
+            self.game = None
+            print("Backup incomplete.")  # do this even if mute because it
+            # represents an error
+            return None
+
+        finally:
+            self.bot.index_members(self)
@@ -3,6 +3,7 @@ from typing import Any, Optional, TypeVar, List, Dict, Union
 import discord
 from discord.ext import commands
 from lib.bot import BOTCBot
+from lib.table import Table
 
 _C = TypeVar("_C", bound=Context)
 
@@ -10,6 +11,7 @@ _C = TypeVar("_C", bound=Context)
 class Context(commands.Context):
     message: discord.Message
     bot: BOTCBot
+    table: Table
     args: List[Any]
     kwargs: Dict[str, Any]
     prefix: str
@@ -1,9 +1,9 @@
 """Contains several utilities, generally not for game logic management."""
 
 import re
-from typing import Any, List, Tuple, TYPE_CHECKING
+from typing import Any, Iterable, List, Tuple, TYPE_CHECKING
 
-from discord import Message, HTTPException
+from discord import Message
 from discord.abc import Messageable
 from discord.ext import commands
 
@@ -13,6 +13,12 @@ if TYPE_CHECKING:
     from lib.logic.Game import Game
     from lib.logic.Player import Player
 
+# The maximum length of a Discord message.
+_MESSAGE_LIMIT = 2000
+
+# Matches the formatting markers that chunk_message keeps balanced.
+_MARKDOWN_MARKERS = re.compile(r"```|\*\*|~~")
+
 
 async def aexec(code: str, ctx: Context) -> Any:
     """Execute code asynchronously.
@@ -60,16 +66,7 @@ def get_player(game: "Game", idn: int, include_storytellers: bool = True) -> "Pl
     ValueError
         If no matching player is found.
     """
-    if include_storytellers:
-        for st in game.storytellers:
-            if st.member.id == idn:
-                return st
-
-    for player in game.seating_order:
-        if player.member.id == idn:
-            return player
-
-    raise ValueError("player not found")
+    return game.get_player(idn, include_storytellers)
 
 
 async def get_input(ctx: Context, text: str, timeout: int = 200) -> str:
@@ -89,6 +86,26 @@ async def get_input(ctx: Context, text: str, timeout: int = 200) -> str:
     str
         The content of the first message sent in ctx.channel by ctx.author.
     """
+    return (await get_input_message(ctx, text, timeout)).content
+
+
+async def get_input_message(ctx: Context, text: str, timeout: int = 200) -> Message:
+    """Ask for a response in a given context, keeping its attachments.
+
+    Parameters
+    ----------
+    ctx : Context
+        The context to ask for a response in.
+    text : str
+        The text to ask for a response to.
+    timeout : int
+        The number of seconds to wait for a response.
+
+    Returns
+    -------
+    Message
+        The first message sent in ctx.channel by ctx.author.
+    """
     await safe_send(ctx, text)
     out = await ctx.bot.wait_for(
         "message",
@@ -102,7 +119,7 @@ async def get_input(ctx: Context, text: str, timeout: int = 200) -> str:
     if out.content.startswith(ctx.bot.command_prefix):
         raise ValueError("command called")
 
-    return out.content
+    return out
 
 
 async def get_bool_input(ctx: Context, text: str, timeout: int = 200) -> bool:
@@ -149,7 +166,9 @@ def str_cleanup(text: str, chars: Tuple[str] = (",", " ", "-", "'", "_")) -> str
 async def safe_send(target: Messageable, msg: str) -> Message:
     """Send a message with protection from message length errors.
 
-    Functionally a wrapper of target.send.
+    Functionally a wrapper of target.send. Long messages are split into chunks before
+    sending, preferably on line boundaries, with any open formatting closed at the
+    end of each chunk and reopened at the start of the next.
 
     Parameters
     ----------
@@ -163,18 +182,107 @@ async def safe_send(target: Messageable, msg: str) -> Message:
     Message
         The first message sent this way.
     """
-    try:
-        return await target.send(msg)
+    chunks = chunk_message(msg)
+    out = await target.send(chunks[0])
+    for chunk in chunks[1:]:
+        await target.send(chunk)
+    return out
 
-    except HTTPException as e:
-        if e.code == 50035:
 
-            n = len(msg) // 2
-            out = await safe_send(target, msg[:n])
-            await safe_send(target, msg[n:])
-            return out
+def chunk_message(msg: str, limit: int = _MESSAGE_LIMIT) -> List[str]:
+    """Split a message into chunks no longer than limit.
 
-        raise
+    Messages are split between lines where possible, then between words, then
+    anywhere. Bold, strikethrough and code blocks left open at the end of a chunk are
+    closed there and reopened at the start of the next chunk.
+
+    Parameters
+    ----------
+    msg : str
+        The message to split.
+    limit : int
+        The maximum length of a chunk.
+
+    Returns
+    -------
+    List[str]
+        The chunks, in order.
+    """
+    if len(msg) <= limit:
+        return [msg]
+
+    chunks = []
+    body = ""
+    opening = ""
+    markers = []  # type: List[str]
+    for sep, piece in _split_pieces(msg, limit // 2):
+        new_markers = _update_markers(markers, piece)
+        candidate = body + sep + piece if body else piece
+        if len(opening + candidate + _closing(new_markers)) > limit and body:
+            chunks.append(opening + body + _closing(markers))
+            opening = _opening(markers)
+            candidate = piece
+        body = candidate
+        markers = new_markers
+    chunks.append(opening + body)
+    return chunks
+
+
+def _split_pieces(msg: str, width: int) -> Iterable[Tuple[str, str]]:
+    """Yield the lines of msg, with lines longer than width split further.
+
+    Each piece is yielded with the separator that precedes it in msg.
+    """
+    for line in msg.split("\n"):
+        sep = "\n"
+        while len(line) > width:
+            cut = line.rfind(" ", 0, width + 1)
+            if cut <= 0:
+                yield sep, line[:width]
+                line, sep = line[width:], ""
+            else:
+                yield sep, line[:cut]
+                line, sep = line[cut + 1 :], " "
+        yield sep, line
+
+
+def _update_markers(markers: List[str], text: str) -> List[str]:
+    """Determine which formatting markers are open after text.
+
+    Code blocks are stored with their language, as in "```py".
+    """
+    markers = markers.copy()
+    for match in _MARKDOWN_MARKERS.finditer(text):
+        if markers and markers[-1].startswith("```"):
+            if match.group() == "```":
+                markers.pop()
+        elif match.group() == "```":
+            language = text[match.end() :]
+            markers.append("```" + (language if language.isalnum() else ""))
+        elif match.group() in markers:
+            markers.remove(match.group())
+        else:
+            markers.append(match.group())
+    return markers
+
+
+def _opening(markers: List[str]) -> str:
+    """Generate the text reopening markers at the start of a chunk."""
+    text = ""
+    for marker in markers:
+        if marker.startswith("```"):
+            # a code block must start on its own line
+            text += ("\n" if text else "") + marker + "\n"
+        else:
+            text += marker
+    return text
+
+
+def _closing(markers: List[str]) -> str:
+    """Generate the text closing markers at the end of a chunk."""
+    return "".join(
+        "\n```" if marker.startswith("```") else marker for marker in reversed(markers)
+    )
 
 
 def list_to_plural_string(initial_list: List[str], alt: str) -> Tuple[str, bool]:
@@ -220,4 +328,4 @@ def safe_bug_report(ctx: Context) -> bool:
     For instance, it's unsafe to send those messages in public.
     This is because they may contain privileged game info.
     """
-    return ctx.guild is None and ctx.author in ctx.bot.storyteller_role.members
+    return ctx.guild is None and ctx.author in ctx.table.storyteller_role.members
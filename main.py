@@ -10,13 +10,31 @@ from sys import exit as sysexit, argv
 from lib.bot import BOTCBot
 from lib.typings.context import Context
 
-bot_name = " ".join(argv[1:])
 
-config = ConfigParser()
-config.read("config.ini")
+def create_bot(bot_name: str, config: ConfigParser) -> BOTCBot:
+    """Define a bot from its section of the config and load its extensions.
 
-# Define the bot
-try:
+    Besides the main table in its own section, the bot gets a table for each section
+    named "<bot name>/<table name>", which must define the table's channel,
+    storytellerid, playerid, inactiveid and observerid.
+
+    Parameters
+    ----------
+    bot_name : str
+        The bot's name, which is also the name of its config section.
+    config : ConfigParser
+        The config.
+
+    Returns
+    -------
+    BOTCBot
+        The bot, ready to be started.
+
+    Raises
+    ------
+    KeyError
+        If the bot or one of its or its tables' required keys is not in the config.
+    """
     bot = BOTCBot(
         bot_name,
         int(config[bot_name]["server"]),
@@ -38,37 +56,54 @@ try:
         case_insensitive=True,
         owner_id=149969652141785088,
     )
-except KeyError as e:
-    if str(e) == f"'{bot_name}'":
-        print(f'Bot "{bot_name}" not found.')
-        print("Shutting down.")
-        sysexit()
-    else:
-        print(f'Key {str(e)} not defined in config.ini for "{bot_name}".')
-        print("Shutting down.")
-        sysexit()
 
+    # Add tables
+    for section in config.sections():
+        if section.startswith(bot_name + "/"):
+            bot.add_table(
+                section[len(bot_name) + 1 :],
+                int(config[section]["channel"]),
+                int(config[section]["storytellerid"]),
+                int(config[section]["playerid"]),
+                int(config[section]["inactiveid"]),
+                int(config[section]["observerid"]),
+            )
 
-# Backup wrapper
-# noinspection PyUnboundLocalVariable
-# if we get here, bot is guaranteed to be defined
-@bot.after_invoke
-async def command_cleanup(ctx: Context):
-    """Run after every command.
+    # Backup wrapper
+    @bot.after_invoke
+    async def command_cleanup(ctx: Context):
+        """Run after every command.
+
+        Backs up the bot and updates the status.
+        """
+        await ctx.bot.after_command(ctx)
+
+    # Load extensions
+    for file in listdir("lib/cogs"):
+        if file.endswith(".py") and not file.startswith("_"):
+            bot.load_extension("lib.cogs." + file[:-3])
+
+    return bot
 
-    Backs up the bot and updates the status.
-    """
-    if ctx.bot.game:
-        await ctx.bot.game.reseat(ctx, ctx.bot.game.seating_order)
-    ctx.bot.backup()
-    await ctx.bot.update_status()
 
+def create_bot_or_exit(bot_name: str, config: ConfigParser) -> BOTCBot:
+    """Define a bot, shutting down with an explanation if its config is incomplete."""
+    try:
+        return create_bot(bot_name, config)
+    except KeyError as e:
+        if str(e) == f"'{bot_name}'":
+            print(f'Bot "{bot_name}" not found.')
+        else:
+            print(f'Key {str(e)} not defined in config.ini for "{bot_name}".')
+        print("Shutting down.")
+        sysexit()
 
-# Load extensions
-for file in listdir("lib/cogs"):
-    if file.endswith(".py") and not file.startswith("_"):
-        bot.load_extension("lib.cogs." + file[:-3])
 
 # Run the bot
 if __name__ == "__main__":
-    bot.run(config[bot_name]["TOKEN"])
+    bot_name = " ".join(argv[1:])
+
+    config = ConfigParser()
+    config.read("config.ini")
+
+    create_bot_or_exit(bot_name, config).run(config[bot_name]["TOKEN"])
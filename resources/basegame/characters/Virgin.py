@@ -4,7 +4,6 @@ from lib.logic.Character import Townsfolk
 from lib.logic.Day import generate_nomination_message_text
 from lib.logic.Effect import UsedAbility
 from lib.logic.tools import if_functioning, onetime_use
-from lib.utils import safe_send
 
 
 class Virgin(Townsfolk):
@@ -25,8 +24,8 @@ class Virgin(Townsfolk):
         if nominee == self.parent:
             self.parent.add_effect(ctx, UsedAbility, self.parent)
             if enabled and nominator.is_status(ctx, "townsfolk", registers=True):
-                await safe_send(
-                    ctx.bot.channel,
+                await ctx.bot.dispatcher.send(
+                    ctx.table.channel,
                     generate_nomination_message_text(
                         ctx, nominator, nominee, traveler=False, proceed=False
                     ),
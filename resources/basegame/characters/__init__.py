@@ -1,75 +1,35 @@
-"""Contains basegame characters."""
+"""Contains basegame characters.
 
-from .Artist import Artist
-from .Assassin import Assassin
-from .Barber import Barber
-from .Baron import Baron
-from .Butler import Butler
-from .Cerenovus import Cerenovus
-from .Chambermaid import Chambermaid
-from .Chef import Chef
-from .Clockmaker import Clockmaker
-from .Courtier import Courtier
-from .DevilSAdvocate import DevilSAdvocate
-from .Dreamer import Dreamer
-from .Drunk import Drunk
-from .Empath import Empath
-from .EvilTwin import EvilTwin
-from .Exorcist import Exorcist
-from .FangGu import FangGu
-from .Flowergirl import Flowergirl
-from .Fool import Fool
-from .FortuneTeller import FortuneTeller
-from .Gambler import Gambler
-from .Godfather import Godfather
-from .Goon import Goon
-from .Gossip import Gossip
-from .Grandmother import Grandmother
-from .Gunslinger import Gunslinger
-from .Imp import Imp
-from .Innkeeper import Innkeeper
-from .Investigator import Investigator
-from .Juggler import Juggler
-from .Klutz import Klutz
-from .Librarian import Librarian
-from .Lunatic import Lunatic
-from .Mastermind import Mastermind
-from .Mathematician import Mathematician
-from .Mayor import Mayor
-from .Minstrel import Minstrel
-from .Monk import Monk
-from .Moonchild import Moonchild
-from .Mutant import Mutant
-from .NoDashii import NoDashii
-from .Oracle import Oracle
-from .Pacifist import Pacifist
-from .Philosopher import Philosopher
-from .PitHag import PitHag
-from .Po import Po
-from .Poisoner import Poisoner
-from .Professor import Professor
-from .Pukka import Pukka
-from .Ravenkeeper import Ravenkeeper
-from .Recluse import Recluse
-from .Sage import Sage
-from .Sailor import Sailor
-from .Saint import Saint
-from .Savant import Savant
-from .ScarletWoman import ScarletWoman
-from .Seamstress import Seamstress
-from .Shabaloth import Shabaloth
-from .Slayer import Slayer
-from .SnakeCharmer import SnakeCharmer
-from .Soldier import Soldier
-from .Spy import Spy
-from .Sweetheart import Sweetheart
-from .TeaLady import TeaLady
-from .Tinker import Tinker
-from .TownCrier import TownCrier
-from .Undertaker import Undertaker
-from .Vigormortis import Vigormortis
-from .Virgin import Virgin
-from .Vortox import Vortox
-from .Washerwoman import Washerwoman
-from .Witch import Witch
-from .Zombuul import Zombuul
+Character modules are imported lazily, the first time each character is accessed as
+an attribute of this package. The characters' names, types and playtest status are
+listed in the generated manifest.
+"""
+
+from typing import List, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lib.logic.Character import Character
+
+
+def __getattr__(name: str) -> Type["Character"]:
+    """Import a character the first time it's accessed."""
+    from lib.logic.CharacterRegistry import character_registry
+
+    info = character_registry.infos.get(name)
+    if info is None or info.package != __name__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return character_registry.load(name)
+
+
+def __dir__() -> List[str]:
+    """List the characters, as well as the package's own attributes."""
+    from lib.logic.CharacterRegistry import character_registry
+
+    return sorted(
+        list(globals())
+        + [
+            info.class_name
+            for info in character_registry.characters(playtest=True)
+            if info.package == __name__
+        ]
+    )
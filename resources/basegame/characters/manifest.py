@@ -0,0 +1,80 @@
+"""Contains the manifest of the characters in resources.basegame.characters.
+
+Generated by lib.logic.CharacterRegistry; do not edit by hand.
+"""
+
+manifest = [
+    ("Artist", "Artist", "townsfolk", False),
+    ("Assassin", "Assassin", "minion", False),
+    ("Barber", "Barber", "outsider", False),
+    ("Baron", "Baron", "minion", False),
+    ("Butler", "Butler", "outsider", False),
+    ("Cerenovus", "Cerenovus", "minion", False),
+    ("Chambermaid", "Chambermaid", "townsfolk", False),
+    ("Chef", "Chef", "townsfolk", False),
+    ("Clockmaker", "Clockmaker", "townsfolk", False),
+    ("Courtier", "Courtier", "townsfolk", False),
+    ("DevilSAdvocate", "Devil's Advocate", "minion", False),
+    ("Dreamer", "Dreamer", "townsfolk", False),
+    ("Drunk", "Drunk", "outsider", False),
+    ("Empath", "Empath", "townsfolk", False),
+    ("EvilTwin", "Evil Twin", "minion", False),
+    ("Exorcist", "Exorcist", "townsfolk", False),
+    ("FangGu", "Fang Gu", "demon", False),
+    ("Flowergirl", "Flowergirl", "townsfolk", False),
+    ("Fool", "Fool", "townsfolk", False),
+    ("FortuneTeller", "Fortune Teller", "townsfolk", False),
+    ("Gambler", "Gambler", "townsfolk", False),
+    ("Godfather", "Godfather", "minion", False),
+    ("Goon", "Goon", "outsider", False),
+    ("Gossip", "Gossip", "townsfolk", False),
+    ("Grandmother", "Grandmother", "townsfolk", False),
+    ("Gunslinger", "Gunslinger", "traveler", False),
+    ("Imp", "Imp", "demon", False),
+    ("Innkeeper", "Innkeeper", "townsfolk", False),
+    ("Investigator", "Investigator", "townsfolk", False),
+    ("Juggler", "Juggler", "townsfolk", False),
+    ("Klutz", "Klutz", "outsider", False),
+    ("Librarian", "Librarian", "townsfolk", False),
+    ("Lunatic", "Lunatic", "outsider", False),
+    ("Mastermind", "Mastermind", "minion", False),
+    ("Mathematician", "Mathematician", "townsfolk", False),
+    ("Mayor", "Mayor", "townsfolk", False),
+    ("Minstrel", "Minstrel", "townsfolk", False),
+    ("Monk", "Monk", "townsfolk", False),
+    ("Moonchild", "Moonchild", "outsider", False),
+    ("Mutant", "Mutant", "outsider", False),
+    ("NoDashii", "No Dashii", "demon", False),
+    ("Oracle", "Oracle", "townsfolk", False),
+    ("Pacifist", "Pacifist", "townsfolk", False),
+    ("Philosopher", "Philosopher", "townsfolk", False),
+    ("PitHag", "Pit-Hag", "minion", False),
+    ("Po", "Po", "demon", False),
+    ("Poisoner", "Poisoner", "minion", False),
+    ("Professor", "Professor", "townsfolk", False),
+    ("Pukka", "Pukka", "demon", False),
+    ("Ravenkeeper", "Ravenkeeper", "townsfolk", False),
+    ("Recluse", "Recluse", "outsider", False),
+    ("Sage", "Sage", "townsfolk", False),
+    ("Sailor", "Sailor", "townsfolk", False),
+    ("Saint", "Saint", "outsider", False),
+    ("Savant", "Savant", "townsfolk", False),
+    ("ScarletWoman", "Scarlet Woman", "minion", False),
+    ("Seamstress", "Seamstress", "townsfolk", False),
+    ("Shabaloth", "Shabaloth", "demon", False),
+    ("Slayer", "Slayer", "townsfolk", False),
+    ("SnakeCharmer", "Snake Charmer", "townsfolk", False),
+    ("Soldier", "Soldier", "townsfolk", False),
+    ("Spy", "Spy", "minion", False),
+    ("Sweetheart", "Sweetheart", "outsider", False),
+    ("TeaLady", "Tea Lady", "townsfolk", False),
+    ("Tinker", "Tinker", "outsider", False),
+    ("TownCrier", "Town Crier", "townsfolk", False),
+    ("Undertaker", "Undertaker", "townsfolk", False),
+    ("Vigormortis", "Vigormortis", "demon", False),
+    ("Virgin", "Virgin", "townsfolk", False),
+    ("Vortox", "Vortox", "demon", False),
+    ("Washerwoman", "Washerwoman", "townsfolk", False),
+    ("Witch", "Witch", "minion", False),
+    ("Zombuul", "Zombuul", "demon", False),
+]
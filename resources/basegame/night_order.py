@@ -0,0 +1,86 @@
+"""Contains the night order of the basegame characters.
+
+Each list holds the class names of the characters who wake on that kind of night, in
+the order they wake. Scripts take their night orders from these lists, keeping only
+the characters they include.
+"""
+
+first_night = [
+    "Philosopher",
+    "Lunatic",
+    "Sailor",
+    "Poisoner",
+    "Courtier",
+    "SnakeCharmer",
+    "Godfather",
+    "DevilSAdvocate",
+    "EvilTwin",
+    "Witch",
+    "Cerenovus",
+    "Pukka",
+    "Washerwoman",
+    "Librarian",
+    "Chef",
+    "Investigator",
+    "Empath",
+    "FortuneTeller",
+    "Butler",
+    "Grandmother",
+    "Clockmaker",
+    "Dreamer",
+    "Seamstress",
+    "Spy",
+    "Mathematician",
+    "Chambermaid",
+    "Goon",
+]
+
+other_nights = [
+    "Philosopher",
+    "Sailor",
+    "Innkeeper",
+    "Poisoner",
+    "Courtier",
+    "Monk",
+    "SnakeCharmer",
+    "Witch",
+    "Cerenovus",
+    "PitHag",
+    "ScarletWoman",
+    "DevilSAdvocate",
+    "Gambler",
+    "Exorcist",
+    "Lunatic",
+    "Imp",
+    "Zombuul",
+    "Pukka",
+    "Shabaloth",
+    "Po",
+    "FangGu",
+    "NoDashii",
+    "Vortox",
+    "Vigormortis",
+    "Assassin",
+    "Gossip",
+    "Tinker",
+    "Moonchild",
+    "Godfather",
+    "Barber",
+    "Sage",
+    "Professor",
+    "Ravenkeeper",
+    "Empath",
+    "FortuneTeller",
+    "Butler",
+    "Undertaker",
+    "Dreamer",
+    "Seamstress",
+    "Flowergirl",
+    "TownCrier",
+    "Oracle",
+    "Juggler",
+    "Mathematician",
+    "Spy",
+    "Chambermaid",
+    "Goon",
+]
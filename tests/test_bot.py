@@ -0,0 +1,113 @@
+"""Tests for the BOTCBot class."""
+
+import asyncio
+from configparser import ConfigParser
+from types import SimpleNamespace
+
+import pytest
+from discord.ext import commands
+
+from lib import bot as bot_module
+from lib.bot import BOTCBot, _choose_table
+from lib.table import Table
+
+
+@pytest.fixture
+def bot():
+    """Make a bot with a main table in channel 10 and a second table in channel 20."""
+    config = ConfigParser()
+    config["test"] = {}
+    out = BOTCBot(
+        "test", 1, 10, 11, 12, 13, 14, 15, config=config["test"], command_prefix="!"
+    )
+    out.add_table("second", 20, 21, 22, 23, 25)
+    return out
+
+
+def _start(bot, channelid, player_ids, storyteller_ids=()):
+    """Give a table a game with the given members and index it."""
+    table = bot.tables[channelid]
+    table.game = SimpleNamespace(
+        seating_order=[SimpleNamespace(id=idn) for idn in player_ids],
+        storytellers=[SimpleNamespace(id=idn) for idn in storyteller_ids],
+    )
+    bot.index_members(table)
+    return table
+
+
+def _end(bot, table):
+    """End a table's game and index it."""
+    table.game = None
+    bot.index_members(table)
+
+
+def test_index_members(bot):
+    """Index a game's players and storytellers, and forget them when it ends."""
+    table = _start(bot, 20, [1, 2], [3])
+    assert bot.member_tables == {1: [table], 2: [table], 3: [table]}
+
+    _end(bot, table)
+    assert bot.member_tables == {}
+
+
+def test_index_members_tracks_changes(bot):
+    """Reindex only the members who joined or left a game."""
+    table = _start(bot, 10, [1, 2])
+    _start(bot, 10, [2, 3])
+    assert bot.member_tables == {2: [table], 3: [table]}
+
+
+def test_member_in_two_games_keeps_the_remaining_game(bot):
+    """Offer a member in two games both tables, and the other when one ends."""
+    main = _start(bot, 10, [1, 2])
+    second = _start(bot, 20, [2, 3])
+    assert bot.tables_for_member(SimpleNamespace(id=2)) == [main, second]
+
+    _end(bot, second)
+    assert bot.member_tables == {1: [main], 2: [main]}
+
+    _end(bot, main)
+    assert bot.member_tables == {}
+
+
+def _name_channels(monkeypatch):
+    """Give the tables' channels names and mentions without a connection."""
+    names = {10: "main", 20: "second"}
+    monkeypatch.setattr(
+        Table,
+        "channel",
+        property(
+            lambda table: SimpleNamespace(
+                mention=f"<#{table.channel_id}>", name=names[table.channel_id]
+            )
+        ),
+    )
+
+
+@pytest.mark.parametrize("choice, channel", [("2", 20), ("#Second", 20), ("1", 10)])
+def test_choose_table(bot, monkeypatch, choice, channel):
+    """Ask a member of several tables which one they mean, by number or channel."""
+    asked = []
+
+    async def get_input(ctx, text):
+        asked.append(text)
+        return choice
+
+    monkeypatch.setattr(bot_module, "get_input", get_input)
+    _name_channels(monkeypatch)
+    tables = [bot.tables[10], bot.tables[20]]
+
+    assert asyncio.run(_choose_table(None, tables)) is bot.tables[channel]
+    assert asked == ['Which table is this for? or say "cancel"\n(1). <#10>\n(2). <#20>']
+
+
+def test_choose_table_rejects_other_tables(bot, monkeypatch):
+    """Refuse a choice which isn't one of the member's tables."""
+
+    async def get_input(ctx, text):
+        return "3"
+
+    monkeypatch.setattr(bot_module, "get_input", get_input)
+    _name_channels(monkeypatch)
+    with pytest.raises(commands.BadArgument):
+        asyncio.run(_choose_table(None, [bot.tables[10], bot.tables[20]]))
@@ -0,0 +1,45 @@
+"""Tests for the CharacterIndex class."""
+
+from lib.logic.CharacterIndex import CharacterIndex, normalize
+from lib.logic.CharacterRegistry import CharacterInfo
+
+
+def _info(class_name, name):
+    """Make a manifest record of a basegame townsfolk."""
+    return CharacterInfo(class_name, name, "townsfolk", False, "characters")
+
+
+_INDEX = CharacterIndex(
+    [
+        _info("DevilSAdvocate", "Devil's Advocate"),
+        _info("Fool", "Fool"),
+        _info("Pukka", "Pukka"),
+        _info("Pixie", "Pixie"),
+    ]
+)
+
+
+def test_normalize():
+    """Keep only lowercase letters and digits."""
+    assert normalize("Devil's-Advocate 2") == "devilsadvocate2"
+
+
+def test_exact_names():
+    """Find characters by class name or display name, however formatted."""
+    for text in ("devil's advocate", "Devils-Advocate", "DevilSAdvocate"):
+        assert _INDEX.find(text).class_name == "DevilSAdvocate"
+
+
+def test_misspellings():
+    """Find a character from a close misspelling, but not from a distant one."""
+    assert _INDEX.find("devils advocat").class_name == "DevilSAdvocate"
+    assert _INDEX.find("zzz") is None
+
+
+def test_ambiguous_misspellings():
+    """Refuse to guess between characters which are about as close as each other."""
+    assert _INDEX.find("Pukie") is None
+    assert {info.class_name for info in _INDEX.suggestions("Pukie", 2)} == {
+        "Pukka",
+        "Pixie",
+    }
@@ -0,0 +1,49 @@
+"""Tests for the CharacterRegistry class."""
+
+from lib.logic.CharacterRegistry import (
+    CharacterInfo,
+    CharacterRegistry,
+    generate_manifest,
+)
+from resources.basegame.characters.manifest import manifest
+
+_CHARACTER = """
+from lib.logic.Character import Minion
+
+
+class Scapegoat(Minion):
+    name = "Scapegoat"
+    playtest = True
+"""
+
+
+def test_manifest_is_up_to_date():
+    """Describe every basegame character in the generated manifest."""
+    assert sorted(manifest) == sorted(
+        generate_manifest("resources.basegame.characters")
+    )
+
+
+def test_missing_packages_are_skipped():
+    """Skip packages which don't exist."""
+    registry = CharacterRegistry(["no.such.package"])
+    assert registry.infos == {}
+
+
+def test_packages_without_a_manifest(tmp_path, monkeypatch):
+    """Describe the characters of a package without a manifest by importing them."""
+    package = tmp_path / "playtestcharacters"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "Scapegoat.py").write_text(_CHARACTER)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    registry = CharacterRegistry(
+        ["resources.basegame.characters", "playtestcharacters"]
+    )
+    assert registry.infos["Scapegoat"] == CharacterInfo(
+        "Scapegoat", "Scapegoat", "minion", True, "playtestcharacters"
+    )
+    assert "Scapegoat" not in {info.class_name for info in registry.characters()}
+    assert registry.load("Scapegoat").name == "Scapegoat"
+    assert "Imp" in registry
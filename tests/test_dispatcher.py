@@ -0,0 +1,97 @@
+"""Tests for the Dispatcher and RateBucket classes."""
+
+import asyncio
+
+import pytest
+
+from lib.dispatcher import Dispatcher, Priority, RateBucket
+
+
+def test_rate_bucket():
+    """Allow a burst of requests, then make the next one wait."""
+    bucket = RateBucket(size=2, period=10)
+    for _ in range(2):
+        assert bucket.delay() == 0
+        bucket.take()
+    assert 4.9 < bucket.delay() <= 5
+
+
+def _recorder(ran, name):
+    """Make a request factory which records its name when run."""
+
+    async def request():
+        ran.append(name)
+        return name
+
+    return request
+
+
+def test_priority_order():
+    """Run the most urgent ready request first."""
+
+    async def run():
+        dispatcher = Dispatcher(concurrency=1)
+        ran = []
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        first = dispatcher.submit("a", Priority.PUBLIC, blocker)
+        futures = [
+            dispatcher.submit("b", Priority.COSMETIC, _recorder(ran, "cosmetic")),
+            dispatcher.submit("c", Priority.OBSERVER, _recorder(ran, "observer")),
+            dispatcher.submit("d", Priority.PUBLIC, _recorder(ran, "public")),
+        ]
+        release.set()
+        await asyncio.gather(first, *futures)
+        return ran
+
+    assert asyncio.run(run()) == ["public", "observer", "cosmetic"]
+
+
+def test_route_order():
+    """Run the requests on one route in the order they were submitted."""
+
+    async def run():
+        dispatcher = Dispatcher()
+        ran = []
+        futures = [
+            dispatcher.submit("a", Priority.COSMETIC, _recorder(ran, 1)),
+            dispatcher.submit("a", Priority.PUBLIC, _recorder(ran, 2)),
+        ]
+        return ran, await asyncio.gather(*futures)
+
+    assert asyncio.run(run()) == ([1, 2], [1, 2])
+
+
+def test_exceptions_are_passed_on():
+    """Raise a request's exception to whoever awaits it."""
+
+    async def fail():
+        raise ValueError("failed")
+
+    async def run():
+        with pytest.raises(ValueError, match="failed"):
+            await Dispatcher().submit("a", Priority.PUBLIC, fail)
+
+    asyncio.run(run())
+
+
+def test_cancellation_is_passed_on():
+    """Cancel a request's future if the request is cancelled."""
+
+    async def cancelled():
+        raise asyncio.CancelledError
+
+    async def run():
+        dispatcher = Dispatcher()
+        future = dispatcher.submit("a", Priority.PUBLIC, cancelled)
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(future, 1)
+        assert future.cancelled()
+
+        # the route is free for the next request
+        assert await dispatcher.submit("a", Priority.PUBLIC, _recorder([], 1)) == 1
+
+    asyncio.run(run())
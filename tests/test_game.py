@@ -0,0 +1,139 @@
+"""Tests for the Game class."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from lib.logic.Game import Game
+
+
+class _Townsfolk:
+    pass
+
+
+class _Chef(_Townsfolk):
+    pass
+
+
+class _Imp:
+    pass
+
+
+def _player(idn, character):
+    """Make a stand-in player with an instance of character."""
+    return SimpleNamespace(
+        id=idn, character=character(), has_spoken=False, position=None
+    )
+
+
+def _game():
+    """Make a game with a chef, an imp and a storyteller."""
+    return Game(
+        [_player(1, _Chef), _player(2, _Imp)],
+        None,
+        None,
+        [SimpleNamespace(id=9)],
+    )
+
+
+def test_get_player():
+    """Find players and storytellers by member ID."""
+    game = _game()
+    assert game.get_player(2).id == 2
+    assert game.get_player(9).id == 9
+    with pytest.raises(ValueError, match="player not found"):
+        game.get_player(9, include_storytellers=False)
+
+    game.add_storyteller(_player(8, _Chef))
+    game.add_storyteller(_player(8, _Chef))
+    assert [storyteller.id for storyteller in game.storytellers] == [9, 8]
+    assert game.get_player(8).id == 8
+
+
+def test_players_with_character():
+    """Find players by character, including through their character's base classes."""
+    game = _game()
+    assert [player.id for player in game.players_with_character(_Chef)] == [1]
+    assert [player.id for player in game.players_with_character(_Townsfolk)] == [1]
+    assert game.players_with_character(int) == []
+
+
+def test_night_plan_invalidation():
+    """Rebuild the night plan after players are added or removed."""
+    game = _game()
+    assert len(game.players_with_character(_Imp)) == 1
+
+    traveler = _player(3, _Imp)
+    game.add_player(1, traveler)
+    assert [player.id for player in game.players_with_character(_Imp)] == [3, 2]
+
+    game.remove_player(traveler)
+    assert [player.id for player in game.players_with_character(_Imp)] == [2]
+
+
+def test_not_spoken():
+    """Track who hasn't spoken, in seat order, for seated players only."""
+    game = _game()
+    game.current_day = True
+    assert [player.id for player in game.not_active] == [1, 2]
+
+    game.set_spoken(game.get_player(1))
+    assert [player.id for player in game.not_active] == [2]
+
+    traveler = _player(3, _Imp)
+    game.add_player(0, traveler)
+    assert [player.id for player in game.not_active] == [3, 2]
+
+    game.remove_player(traveler)
+    game.set_spoken(game.get_player(9), False)
+    assert [player.id for player in game.not_active] == [2]
+
+
+def test_old_backups_are_upgraded():
+    """Fill in the lookups, log and pins of a game backed up by an older version."""
+    chef, imp = _player(1, _Chef), _player(2, _Imp)
+    storyteller = SimpleNamespace(id=9, member=SimpleNamespace(id=9))
+    for player in (chef, imp):
+        player.member = SimpleNamespace(id=player.id)
+    chef.has_spoken = True
+    old_pm = {"from": chef, "to": imp, "content": "hi", "day": 1, "time": 1}
+    new_pm = {"from": imp, "to": chef, "content": "hey", "day": 2, "time": 2}
+    chef.message_history = [old_pm, new_pm]
+    imp.message_history = [old_pm, new_pm]
+
+    game = Game.__new__(Game)
+    game.__setstate__(
+        {
+            "past_days": [None],
+            "current_day": True,
+            "seating_order": [chef, imp],
+            "seating_order_message": SimpleNamespace(created_at=5),
+            "script": None,
+            "storytellers": [storyteller],
+        }
+    )
+
+    async def pins():
+        return [
+            SimpleNamespace(id=10, created_at=4),
+            SimpleNamespace(id=11, created_at=6),
+        ]
+
+    table = SimpleNamespace(channel=SimpleNamespace(pins=pins))
+    asyncio.run(game.upgrade(table))
+
+    assert game.get_player(2) is imp
+    assert game.get_player(9) is storyteller
+    assert [player.id for player in game.not_active] == [2]
+    assert [game.message_log.content(pm) for pm in game.message_log.records] == [
+        "hi",
+        "hey",
+    ]
+    assert game.message_tally.since_checkpoint() == {(1, 2): 1}
+    assert not hasattr(chef, "message_history")
+    assert list(game.pins.pinned) == [11]
+
+    # a second upgrade changes nothing
+    asyncio.run(game.upgrade(table))
+    assert len(game.message_log.records) == 2
@@ -0,0 +1,38 @@
+"""Tests for the MessageLog class."""
+
+from datetime import datetime
+
+from lib.logic.MessageLog import MessageLog
+
+
+def _log():
+    """Make a log of a few PMs between members 1, 2 and 3."""
+    log = MessageLog()
+    time = datetime(2020, 1, 1)
+    log.append(1, 2, 1, time, "a")
+    log.append(2, 1, 1, time, "b")
+    log.append(3, 1, 1, time, "c")
+    log.append(2, 3, 2, time, "d")
+    return log
+
+
+def test_history():
+    """Find the PMs a member sent or received, in order."""
+    log = _log()
+    assert [log.content(pm) for pm in log.history(1)] == ["a", "b", "c"]
+    assert list(log.history(4)) == []
+
+
+def test_between():
+    """Find the PMs between two members, in either order."""
+    log = _log()
+    assert [log.content(pm) for pm in log.between(2, 1)] == ["a", "b"]
+    assert [log.content(pm) for pm in log.between(1, 3)] == ["c"]
+
+
+def test_last_received():
+    """Find the latest PM a member received rather than sent."""
+    log = _log()
+    assert log.content(log.last_received(1)) == "c"
+    assert log.content(log.last_received(3)) == "d"
+    assert MessageLog().last_received(1) is None
@@ -0,0 +1,26 @@
+"""Tests for the MessageTally class."""
+
+from lib.logic.MessageTally import MessageTally
+
+
+def test_pairs_are_counted_in_either_direction():
+    """Count messages between a pair under one key, whichever way they go."""
+    tally = MessageTally()
+    tally.record(1, 2)
+    tally.record(2, 1)
+    tally.record(1, 3)
+    assert tally.totals == {(1, 2): 2, (1, 3): 1}
+
+
+def test_checkpoint():
+    """Count only the messages since the last checkpoint."""
+    tally = MessageTally()
+    tally.record(1, 2)
+    tally.record(1, 3)
+    tally.checkpoint()
+    assert tally.since_checkpoint() == {}
+
+    tally.record(2, 1)
+    tally.record(2, 1)
+    assert tally.since_checkpoint() == {(1, 2): 2}
+    assert tally.totals == {(1, 2): 3, (1, 3): 1}
@@ -0,0 +1,31 @@
+"""Tests for the basegame night order and lib.logic.Script.night_orders."""
+
+import pytest
+
+from lib.logic.CharacterRegistry import character_registry
+from lib.logic.Script import _default_scripts, night_orders
+from resources.basegame import night_order
+
+
+@pytest.mark.parametrize("order", [night_order.first_night, night_order.other_nights])
+def test_night_order_names(order):
+    """List each known character at most once."""
+    assert len(order) == len(set(order))
+    assert all(class_name in character_registry for class_name in order)
+
+
+@pytest.mark.parametrize("script", list(_default_scripts()), ids=lambda s: s.name)
+def test_default_scripts(script):
+    """Reproduce the default scripts' night orders."""
+    assert night_orders(script.character_list) == (
+        script.first_night,
+        script.other_nights,
+    )
+
+
+def test_characters_off_the_script_are_skipped():
+    """Leave characters not on the script out of its night orders."""
+    load = character_registry.load
+    first_night, other_nights = night_orders([load("Imp"), load("Chef"), load("Mayor")])
+    assert first_night == [load("Chef")]
+    assert other_nights == [load("Imp")]
@@ -0,0 +1,86 @@
+"""Tests for the PhaseNotifier and ObserverDigest classes."""
+
+import asyncio
+from types import SimpleNamespace
+
+from lib.notifications import ObserverDigest, PhaseNotifier
+from lib.scheduler import Scheduler
+
+
+class _Dispatcher:
+    """Records the messages sent instead of sending them."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_many(self, messages, priority):
+        messages = list(messages)
+        self.sent.extend(messages)
+        return [None for _ in messages]
+
+
+def _table():
+    """Make a stand-in table with one storyteller and one observer."""
+    return SimpleNamespace(
+        bot=SimpleNamespace(dispatcher=_Dispatcher(), observer_digest_interval=0),
+        game=SimpleNamespace(storytellers=[SimpleNamespace(member="st")]),
+        observer_role=SimpleNamespace(members=["observer"]),
+        scheduler=Scheduler(),
+    )
+
+
+def test_phase_changes_are_summarised():
+    """Send one summary of every change to the storytellers."""
+    table = _table()
+    notifier = PhaseNotifier()
+    notifier.record("PMs", False, True)
+    notifier.record("nominations", False, True)
+    asyncio.run(notifier.flush(table))
+    assert table.bot.dispatcher.sent == [("st", "PMs and nominations are now open.")]
+    assert notifier.changes == {}
+
+    asyncio.run(notifier.flush(table))
+    assert len(table.bot.dispatcher.sent) == 1
+
+
+def test_latest_change_wins():
+    """Report only the latest state of a phase which changed more than once."""
+    table = _table()
+    notifier = PhaseNotifier()
+    notifier.record("PMs", True, False)
+    notifier.record("nominations", False, True)
+    notifier.record("PMs", False, True)
+    notifier.record("PMs", True, False)
+    asyncio.run(notifier.flush(table))
+    assert table.bot.dispatcher.sent == [
+        ("st", "Nominations are now open. PMs are now closed.")
+    ]
+
+
+def test_phase_ending_where_it_started_is_skipped():
+    """Leave out a phase which closed and reopened since the last flush."""
+    table = _table()
+    notifier = PhaseNotifier()
+    notifier.record("nominations", True, False)
+    notifier.record("PMs", True, False)
+    notifier.record("nominations", False, True)
+    asyncio.run(notifier.flush(table))
+    assert table.bot.dispatcher.sent == [("st", "PMs are now closed.")]
+
+    notifier.record("PMs", False, True)
+    notifier.record("PMs", True, False)
+    asyncio.run(notifier.flush(table))
+    assert len(table.bot.dispatcher.sent) == 1
+
+
+def test_observer_digest():
+    """Send every buffered report to each observer in one message, then clear it."""
+    table = _table()
+    digest = ObserverDigest()
+    digest.add(table, "a")
+    digest.add(table, "b")
+    asyncio.run(digest.flush(table))
+    assert table.bot.dispatcher.sent == [("observer", "a\nb")]
+
+    asyncio.run(digest.flush(table))
+    assert len(table.bot.dispatcher.sent) == 1
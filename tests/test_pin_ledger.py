@@ -0,0 +1,159 @@
+"""Tests for the PinLedger class."""
+
+import asyncio
+from types import SimpleNamespace
+
+from discord import NotFound
+
+from lib.dispatcher import Dispatcher
+from lib.logic.PinLedger import PinLedger
+
+
+def _message(idn, pin_error=None):
+    """Make a stand-in message whose pin raises pin_error, if given."""
+
+    async def pin():
+        if pin_error:
+            raise pin_error
+
+    return SimpleNamespace(id=idn, channel=SimpleNamespace(id=1), pin=pin)
+
+
+class _HTTP:
+    """Records the messages unpinned instead of unpinning them."""
+
+    def __init__(self, missing=()):
+        self.missing = missing
+        self.unpinned = []
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def unpin_message(self, channel_id, idn):
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.unpinned.append(idn)
+        if idn in self.missing:
+            raise NotFound()
+
+
+def _ctx(http=None):
+    """Make a stand-in context whose bot uses http."""
+    return SimpleNamespace(
+        bot=SimpleNamespace(dispatcher=Dispatcher(), http=http),
+        table=SimpleNamespace(channel=SimpleNamespace(id=1)),
+    )
+
+
+def _run(ids, unpin=None, missing=()):
+    """Pin messages with a new ledger, then unpin some, returning the ledger."""
+    http = _HTTP(missing)
+
+    async def run():
+        ledger = PinLedger()
+        ctx = _ctx(http)
+        for idn in ids:
+            ledger.pin(ctx, _message(idn))
+        if unpin is None:
+            await ledger.unpin_all(ctx)
+        else:
+            await ledger.unpin(ctx, unpin)
+        return ledger
+
+    return asyncio.run(run()), http.unpinned
+
+
+def _pin(*messages):
+    """Pin messages with a new ledger, returning it once the pins are done."""
+
+    async def run():
+        ledger = PinLedger()
+        ctx = _ctx()
+        for message in messages:
+            ledger.pin(ctx, message)
+        assert ledger.pending == {message.id for message in messages}
+        await asyncio.sleep(0.01)
+        return ledger
+
+    return asyncio.run(run())
+
+
+def test_pins_are_recorded():
+    """Record pins in the order they're made."""
+    ledger = _pin(_message(2), _message(1))
+    assert list(ledger.pinned) == [2, 1]
+    assert ledger.is_pinned(1)
+    assert not ledger.is_pinned(3)
+    assert ledger.pending == set()
+
+
+def test_failed_pins_are_not_recorded():
+    """Leave a message out of the ledger if pinning it fails."""
+    ledger = _pin(_message(1, ValueError("pin limit")), _message(2))
+    assert ledger.is_pinned(2)
+    assert not ledger.is_pinned(1)
+    assert ledger.pending == set()
+
+
+def test_only_pinned_messages_are_unpinned():
+    """Skip messages the ledger doesn't have, and forget the rest once unpinned."""
+    ledger, unpinned = _run([1, 2, 3], unpin=[2, 4, 2])
+    assert unpinned == [2]
+    assert list(ledger.pinned) == [1, 3]
+    assert ledger.pending == set()
+
+
+def test_unpin_all_tolerates_deleted_messages():
+    """Forget messages which were deleted before they could be unpinned."""
+    ledger, unpinned = _run([1, 2], missing={1})
+    assert sorted(unpinned) == [1, 2]
+    assert ledger.pinned == {}
+    assert ledger.pending == set()
+
+
+def test_unpins_run_concurrently():
+    """Unpin several messages at once, rather than one after another."""
+    http = _HTTP()
+
+    async def run():
+        ledger = PinLedger()
+        ctx = _ctx(http)
+        for idn in range(50):
+            ledger.pin(ctx, _message(idn))
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(ledger.unpin_all(ctx), 1)
+        return ledger
+
+    ledger = asyncio.run(run())
+    assert sorted(http.unpinned) == list(range(50))
+    assert http.most_in_flight == 4
+    assert ledger.pinned == {}
+
+
+def test_pending_pins_are_made_before_their_unpins():
+    """Queue a message's unpin behind its pin if the pin hasn't been made yet."""
+    events = []
+    http = _HTTP()
+
+    async def run():
+        ledger = PinLedger()
+        ctx = _ctx(http)
+        message = _message(1)
+        pin = message.pin
+
+        async def logged_pin():
+            await asyncio.sleep(0.01)
+            await pin()
+            events.append("pin")
+
+        message.pin = logged_pin
+        ledger.pin(ctx, message)
+        await ledger.unpin(ctx, [1])
+        events.append("unpin")
+        return ledger
+
+    ledger = asyncio.run(run())
+    assert events == ["pin", "unpin"]
+    assert http.unpinned == [1]
+    assert ledger.pinned == {}
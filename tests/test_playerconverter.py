@@ -0,0 +1,57 @@
+"""Tests for lib.logic.playerconverter."""
+
+from typing import NamedTuple
+
+import pytest
+
+from lib.logic.playerconverter import best_matches
+
+
+@pytest.fixture(autouse=True)
+def no_preferences(tmp_path, monkeypatch):
+    """Run from an empty directory, so every member has default preferences."""
+    monkeypatch.chdir(tmp_path)
+
+
+class _Member(NamedTuple):
+    """A stand-in member."""
+
+    id: int
+    display_name: str
+    name: str
+
+
+def _member(idn, display_name, name=None):
+    """Make a stand-in member."""
+    return _Member(idn, display_name, name or display_name)
+
+
+_MEMBERS = [
+    _member(1, "Alice", "alice#1"),
+    _member(2, "Alistair"),
+    _member(3, "Bob"),
+    _member(4, "Rob"),
+    _member(5, "Jonathan"),
+]
+
+
+def test_exact_match_beats_prefixes():
+    """Prefer an exact name to names it's a prefix of."""
+    assert best_matches("alice", _MEMBERS) == ([_MEMBERS[0]], True)
+
+
+def test_prefixes():
+    """Return every member whose name starts with the argument."""
+    assert best_matches("ali", _MEMBERS) == (_MEMBERS[:2], False)
+
+
+def test_substrings():
+    """Fall back to names containing the argument."""
+    assert best_matches("nath", _MEMBERS) == ([_MEMBERS[4]], True)
+
+
+def test_misspellings():
+    """Fall back to close misspellings, and only be certain of a clear winner."""
+    assert best_matches("jonathon", _MEMBERS) == ([_MEMBERS[4]], True)
+    assert best_matches("bobb", _MEMBERS) == ([_MEMBERS[2]], True)
+    assert best_matches("zzz", _MEMBERS) == ([], False)
@@ -0,0 +1,53 @@
+"""Tests for the PreferenceStore class."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from lib.preferences import PreferenceStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Make a store saving to an empty preferences directory."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "resources" / "preferences").mkdir(parents=True)
+    return PreferenceStore()
+
+
+_MEMBER = SimpleNamespace(id=1, display_name="Alice")
+
+
+def test_defaults(store):
+    """Give a member with no saved preferences the defaults, without caching them."""
+    assert store.load(_MEMBER).nick == "Alice"
+    assert store.cache == {}
+
+
+def test_saved_preferences_are_cached(store):
+    """Serve saved preferences from the cache while the file is unchanged."""
+    preferences = store.load(_MEMBER)
+    preferences.nick = "Al"
+    store.save(preferences)
+    assert store.load(_MEMBER) is preferences
+
+
+def test_changed_files_are_reloaded(store):
+    """Reload preferences whose file was changed, and forget deleted ones."""
+    preferences = store.load(_MEMBER)
+    preferences.nick = "Al"
+    store.save(preferences)
+
+    other = PreferenceStore()
+    changed = other.load(_MEMBER)
+    changed.nick = "Ally"
+    other.save(changed)
+    path = "resources/preferences/1.pckl"
+    os.utime(path, (0, 0))  # ensure the modification time differs
+
+    assert store.load(_MEMBER).nick == "Ally"
+
+    os.remove(path)
+    assert store.load(_MEMBER).nick == "Alice"
+    assert store.cache == {}
@@ -0,0 +1,63 @@
+"""Tests for the Scheduler class."""
+
+import asyncio
+
+from lib.scheduler import Scheduler
+
+
+def _run_scheduler(actions):
+    """Apply actions to a new scheduler, then report which timers fired."""
+
+    async def run():
+        scheduler = Scheduler()
+        fired = []
+
+        def callback(name):
+            async def fire():
+                fired.append(name)
+
+            return fire
+
+        actions(scheduler, callback)
+        await asyncio.sleep(0.05)
+        return scheduler, fired
+
+    return asyncio.run(run())
+
+
+def test_fire():
+    """Run a timer's coroutine once its delay has passed, and forget the timer."""
+    scheduler, fired = _run_scheduler(lambda s, cb: s.arm("a", 0.01, cb("a")))
+    assert fired == ["a"]
+    assert not scheduler.is_armed("a")
+
+
+def test_rearm_replaces_timer():
+    """Keep only the latest timer for a key."""
+
+    def actions(scheduler, callback):
+        scheduler.arm("a", 0.01, callback("first"))
+        scheduler.arm("a", 0.01, callback("second"))
+
+    assert _run_scheduler(actions)[1] == ["second"]
+
+
+def test_cancel():
+    """Cancel one timer, or every timer."""
+
+    def actions(scheduler, callback):
+        scheduler.arm("a", 0.01, callback("a"))
+        scheduler.arm("b", 0.01, callback("b"))
+        scheduler.arm("c", 0.01, callback("c"))
+        scheduler.cancel("a")
+        assert scheduler.is_armed("b")
+
+    assert _run_scheduler(actions)[1] == ["b", "c"]
+
+    def cancel_all(scheduler, callback):
+        scheduler.arm("a", 0.01, callback("a"))
+        scheduler.arm("b", 0.01, callback("b"))
+        scheduler.cancel_all()
+        assert not scheduler.is_armed("a")
+
+    assert _run_scheduler(cancel_all)[1] == []
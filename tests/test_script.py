@@ -0,0 +1,95 @@
+"""Tests for the ScriptRegistry class."""
+
+import os
+import shutil
+
+import pytest
+
+from lib.logic import Script as script_module
+from lib.logic.Script import Script, ScriptRegistry, parse_script_json
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """Make a registry reading custom scripts from empty script directories."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "resources" / "basegame" / "scripts").mkdir(parents=True)
+    (tmp_path / "resources" / "playtest" / "scripts").mkdir(parents=True)
+    registry = ScriptRegistry()
+    monkeypatch.setattr(script_module, "script_registry", registry)
+    return registry
+
+
+def test_default_scripts(registry):
+    """Find the default scripts by name or alias, ignoring case."""
+    assert registry.get("trouble brewing").name == "Trouble Brewing"
+    assert registry.get("No Such Script") is None
+
+
+def test_default_scripts_are_built_as_needed(registry):
+    """Build only the default scripts which are looked up."""
+    assert registry.get("tb").name == "Trouble Brewing"
+    assert list(registry.defaults) == ["Trouble Brewing"]
+
+    names = [script.name for script in registry.scripts()]
+    assert names == ["Trouble Brewing", "Bad Moon Rising", "Sects & Violets"]
+    assert registry.get("tb") is registry.defaults["Trouble Brewing"]
+
+
+def test_custom_scripts_are_reloaded(registry):
+    """Add, change and remove custom scripts as their files change."""
+    Script("Custom", [], aliases=["cs"]).save()
+    assert registry.get("CS").name == "Custom"
+
+    Script("Custom", [], aliases=["renamed"]).save()
+    os.utime("resources/basegame/scripts/Custom.pckl", (0, 0))
+    assert registry.get("cs") is None
+    assert registry.get("renamed").name == "Custom"
+
+    os.remove("resources/basegame/scripts/Custom.pckl")
+    registry.expire()
+    assert registry.get("custom") is None
+
+
+def test_sweeps_are_throttled(registry):
+    """Only notice files changed outside the bot once the interval has passed."""
+    Script("Custom", []).save()
+    assert registry.get("custom").name == "Custom"
+
+    shutil.copy(
+        "resources/basegame/scripts/Custom.pckl",
+        "resources/playtest/scripts/Copied.pckl",
+    )
+    assert len(list(registry.scripts(playtest=True))) == 4
+
+    registry.interval = 0
+    assert len(list(registry.scripts(playtest=True))) == 5
+
+
+def test_playtest_scripts(registry):
+    """Hide playtest scripts unless they're requested."""
+    Script("Test", [], playtest=True).save()
+    assert registry.get("test") is None
+    assert registry.get("test", playtest=True).name == "Test"
+    assert "Test" in [script.name for script in registry.scripts(playtest=True)]
+    assert "Test" not in [script.name for script in registry.scripts()]
+
+
+def test_parse_script_json():
+    """Find the character IDs in a script, whatever form its entries take."""
+    text = '[{"id": "_meta", "name": "Custom"}, "imp", {"id": "chef"}]'
+    assert parse_script_json(text) == ["imp", "chef"]
+    assert parse_script_json("```json\n" + text + "\n```") == ["imp", "chef"]
+
+
+@pytest.mark.parametrize("fence", ["```", "```json", "```JSON "])
+def test_parse_script_json_on_one_line(fence):
+    """Unwrap a code block which opens and closes on the script's own line."""
+    assert parse_script_json(fence + '["imp", "chef"]```') == ["imp", "chef"]
+
+
+@pytest.mark.parametrize("text", ['{"id": "imp"}', '["imp", {"name": "Chef"}]'])
+def test_parse_script_json_rejects_other_json(text):
+    """Refuse JSON which isn't a list of script entries."""
+    with pytest.raises(ValueError):
+        parse_script_json(text)
@@ -0,0 +1,52 @@
+"""Tests for the SeatingOrder class."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from lib.logic.SeatingOrder import SeatingOrder
+
+
+def _players(*ids):
+    """Make stand-in players with the given member IDs."""
+    return [SimpleNamespace(id=idn, position=None) for idn in ids]
+
+
+def test_positions():
+    """Index players and keep their positions in sync."""
+    players = _players(1, 2, 3)
+    order = SeatingOrder(players)
+    assert [player.position for player in players] == [0, 1, 2]
+    assert order.index(players[2]) == 2
+    assert order.get(2) is players[1]
+    assert order.get(4) is None
+
+
+def test_insert_and_remove():
+    """Reindex the players after an insertion or removal."""
+    players = _players(1, 2, 3)
+    order = SeatingOrder(players)
+    (new,) = _players(4)
+
+    order.insert(1, new)
+    assert [player.id for player in order] == [1, 4, 2, 3]
+    assert [order.index(player) for player in players] == [0, 2, 3]
+
+    order.remove(players[0])
+    assert [player.id for player in order] == [4, 2, 3]
+    assert new.position == 0
+    assert players[0] not in order
+    with pytest.raises(ValueError, match="player not found"):
+        order.index(players[0])
+
+
+def test_walk_and_neighbors():
+    """Walk the ring in both directions, skipping players failing a condition."""
+    players = _players(1, 2, 3, 4)
+    order = SeatingOrder(players)
+    assert [player.id for player in order.walk(players[0])] == [2, 3, 4]
+    assert [player.id for player in order.walk(players[0], -1)] == [4, 3, 2]
+
+    condition = lambda player, ctx: player.id != 2  # noqa: E731
+    assert order.neighbors(None, players[0], condition) == (players[3], players[2])
+    assert SeatingOrder(players[:1]).neighbors(None, players[0]) == (None, None)
@@ -0,0 +1,38 @@
+"""Tests for lib.logic.tools."""
+
+from types import SimpleNamespace
+
+from lib.logic.tools import format_message_tally
+
+
+class _Game:
+    """A stand-in game with seated players 1 to 3 and storyteller 9."""
+
+    def __init__(self):
+        self.seating_order = [
+            SimpleNamespace(id=idn, nick=f"p{idn}") for idn in (1, 2, 3)
+        ]
+        self.storytellers = [SimpleNamespace(id=9, nick="st")]
+
+    def get_player(self, idn):
+        for player in self.seating_order + self.storytellers:
+            if player.id == idn:
+                return player
+        raise ValueError("player not found")
+
+
+_CTX = SimpleNamespace(table=SimpleNamespace(game=_Game()))
+
+
+def test_every_pair_tallied():
+    """Skip the zero line when every pair of seated players has messaged."""
+    text = format_message_tally(_CTX, {(1, 2): 2, (1, 3): 1, (2, 3): 1})
+    assert text.splitlines()[1] == "> p1 - p2: 2"
+    assert "All other pairs" not in text
+
+
+def test_storyteller_pairs_are_not_counted():
+    """Report untallied seated pairs even when storyteller pairs fill the count."""
+    text = format_message_tally(_CTX, {(1, 2): 1, (1, 9): 1, (2, 9): 1})
+    assert "> p1 - st: 1" in text
+    assert text.endswith("> All other pairs: 0")
@@ -0,0 +1,47 @@
+"""Tests for lib.utils."""
+
+from lib.utils import chunk_message
+
+
+def test_short_message():
+    """Leave a message within the limit alone."""
+    assert chunk_message("hello", 10) == ["hello"]
+
+
+def test_splits_between_lines():
+    """Split between lines, keeping every chunk within the limit."""
+    msg = "\n".join(f"line {i}" for i in range(20))
+    chunks = chunk_message(msg, 30)
+    assert all(len(chunk) <= 30 for chunk in chunks)
+    assert "\n".join(chunks) == msg
+
+
+def test_splits_long_lines_between_words():
+    """Split a line longer than the limit between words, then anywhere."""
+    words = "word " * 30
+    chunks = chunk_message(words.strip(), 40)
+    assert all(len(chunk) <= 40 for chunk in chunks)
+    assert " ".join(chunks) == words.strip()
+
+    chunks = chunk_message("x" * 100, 40)
+    assert all(len(chunk) <= 40 for chunk in chunks)
+    assert "".join(chunks) == "x" * 100
+
+
+def test_reopens_formatting():
+    """Close formatting at the end of a chunk and reopen it at the next."""
+    msg = "**" + "\n".join(f"line {i}" for i in range(10)) + "**"
+    chunks = chunk_message(msg, 30)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 30 for chunk in chunks)
+    assert all(chunk.count("**") == 2 for chunk in chunks)
+
+
+def test_reopens_code_blocks():
+    """Close a code block at the end of a chunk and reopen it with its language."""
+    msg = "```py\n" + "\n".join(f"x = {i}" for i in range(10)) + "\n```"
+    chunks = chunk_message(msg, 40)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 40 for chunk in chunks)
+    assert all(chunk.startswith("```py\n") for chunk in chunks)
+    assert all(chunk.endswith("```") for chunk in chunks)
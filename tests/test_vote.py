@@ -0,0 +1,67 @@
+"""Tests for the Vote class."""
+
+import asyncio
+from types import SimpleNamespace
+
+from lib.dispatcher import Priority
+from lib.logic.Vote import Vote
+
+
+class _Dispatcher:
+    """Records the messages sent instead of sending them."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, target, msg, priority=Priority.PUBLIC):
+        self.sent.append((target, msg))
+        return SimpleNamespace(id=len(self.sent))
+
+    async def send_many(self, messages, priority):
+        self.sent.append(list(messages))
+
+
+class _Voter:
+    """A stand-in voter, who may have run out of dead votes."""
+
+    def __init__(self, nick, can_vote):
+        self.nick = nick
+        self.member = SimpleNamespace(mention="@" + nick)
+        self._can_vote = can_vote
+
+    def can_vote(self, ctx, traveler):
+        return self._can_vote
+
+
+def test_tokenless_voters_are_told_after_the_announcement(monkeypatch):
+    """Send every voter without a dead vote their DM at once, after the votes."""
+    monkeypatch.setattr(Vote, "_arm_emergency_vote", lambda self, ctx, voter: None)
+    voters = [_Voter("a", False), _Voter("b", False), _Voter("c", True)]
+    vote = Vote.__new__(Vote)
+    vote.nominee = voters[2]
+    vote.traveler = False
+    vote.order = voters
+    vote.position = 0
+    vote.votes = 0
+    vote.prevotes = {}
+    vote.announcements = []
+    dispatcher = _Dispatcher()
+    ctx = SimpleNamespace(
+        bot=SimpleNamespace(dispatcher=dispatcher, batch_vote_announcements=True),
+        table=SimpleNamespace(
+            channel="channel",
+            game=SimpleNamespace(pins=SimpleNamespace(pin=lambda ctx, msg: None)),
+        ),
+    )
+
+    asyncio.run(vote.call_next(ctx))
+
+    assert dispatcher.sent == [
+        ("channel", "a votes no. 0 votes.\nb votes no. 0 votes."),
+        [
+            (voters[0].member, "You have no dead votes. Voting no."),
+            (voters[1].member, "You have no dead votes. Voting no."),
+        ],
+        ("channel", "@c, your vote on c."),
+    ]
+    assert vote.position == 2